@@ -0,0 +1,50 @@
+"""
+벤치마크용 캡처 프레임 로더
+
+- benchmark/frames/{ticker,orderbook}.json 에 거래소별 원본 소켓 프레임 저장
+- 대상 거래소는 config/*/_market_socket.yml 에 등록된 거래소 전체
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+import yaml
+
+path = Path(__file__).parent
+root = path.parent
+
+
+def socket_exchanges() -> dict[str, str]:
+    """config/*/_market_socket.yml 에 등록된 거래소 -> 지역"""
+    exchanges: dict[str, str] = {}
+    for yml_path in sorted(root.glob("config/*/_market_socket.yml")):
+        with open(file=yml_path, mode="r", encoding="utf-8") as file:
+            for market in yaml.safe_load(file):
+                exchanges[market] = yml_path.parent.name
+    return exchanges
+
+
+def load_frames(socket_type: str = "ticker") -> dict[str, list[dict]]:
+    """거래소별 파싱된 프레임"""
+    with open(file=path / "frames" / f"{socket_type}.json", mode="r", encoding="utf-8") as file:
+        frames = json.load(file)
+    return {market: frames[market] for market in socket_exchanges()}
+
+
+def load_raw_frames(socket_type: str = "ticker") -> dict[str, list[bytes]]:
+    """거래소별 소켓에서 수신한 그대로의 bytes 프레임"""
+    return {
+        market: [json.dumps(frame).encode("utf-8") for frame in frames]
+        for market, frames in load_frames(socket_type).items()
+    }
+
+
+def measure(func: Callable[[], object], number: int) -> float:
+    """func 를 number 번 실행한 초당 처리 횟수"""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    elapsed = time.perf_counter() - start
+    return number / elapsed if elapsed > 0 else float("inf")
@@ -0,0 +1,57 @@
+"""
+배치 페이로드 포맷 벤치마크 (rows vs columnar)
+
+- 거래소별 캡처 티커 프레임을 정규화해 BATCH 레코드 배치로 구성
+- 카프카로 나가는 bytes 크기, 인코딩 속도(encode + 직렬화), 컨슈머 파싱 속도 비교
+- 컨슈머 파싱: loads 만 (columnar 를 배열 그대로 사용) / decode_batch (레코드로 복원)
+
+실행:
+    python -m benchmark.batch_format_benchmark
+"""
+
+from benchmark._frames import load_frames, measure
+from common.utils.json_codec import codec
+from config.yml_param_load import ticker_projections
+from mq.data_format import (
+    decode_batch,
+    encode_columnar,
+    is_columnar,
+)
+from common.core.types import SocketLowData
+
+BATCH = 100
+NUMBER = 2_000
+
+
+def main() -> None:
+    print(
+        f"{'market':<10}{'rows B':>9}{'col B':>9}{'ratio':>7}"
+        f"{'rows enc/s':>12}{'col enc/s':>12}{'rows loads/s':>14}{'col loads/s':>13}{'col decode/s':>14}"
+    )
+    for market, frames in load_frames("ticker").items():
+        projection = ticker_projections.get(market)
+        records = [projection.extract(frames[i % len(frames)]) for i in range(BATCH)]
+        if not is_columnar(records):
+            print(f"{market:<10} columnar 대상 아님 --> 건너뜀")
+            continue
+
+        def encode_rows() -> bytes:
+            return codec.dumps(SocketLowData(region="korea", market=market, symbol="BTC", data=records))
+
+        def encode_col() -> bytes:
+            return codec.dumps(encode_columnar("korea", market, "BTC", records))
+
+        rows, col = encode_rows(), encode_col()
+        assert decode_batch(col)["data"] == decode_batch(rows)["data"]
+
+        print(
+            f"{market:<10}{len(rows):>9,}{len(col):>9,}{len(col) / len(rows):>7.2f}"
+            f"{measure(encode_rows, NUMBER):>12,.0f}{measure(encode_col, NUMBER):>12,.0f}"
+            f"{measure(lambda: codec.loads(rows), NUMBER):>14,.0f}"
+            f"{measure(lambda: codec.loads(col), NUMBER):>13,.0f}"
+            f"{measure(lambda: decode_batch(col), NUMBER):>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
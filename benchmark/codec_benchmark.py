@@ -0,0 +1,74 @@
+"""
+JSON 코덱 마이크로 벤치마크
+
+- 거래소별 캡처 프레임을 decode (소켓 수신) / encode (카프카 전송) 하는 속도 비교
+- 설치되지 않은 코덱은 건너뜀
+
+실행:
+    python -m benchmark.codec_benchmark
+"""
+
+from decimal import Decimal
+
+from benchmark._frames import load_raw_frames, measure
+from common.utils.json_codec import CODECS, JsonCodec
+
+NUMBER = 20_000
+
+
+def available_codecs() -> list[JsonCodec]:
+    codecs = []
+    for codec_class in CODECS.values():
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.name} 미설치 --> 건너뜀")
+    return codecs
+
+
+def rest_schema_sample() -> dict:
+    """REST 스키마처럼 Decimal 이 포함된 메시지"""
+    return {
+        "upbit": {
+            "market": "upbit-BTC",
+            "timestamp": 1729160000.0,
+            "coin_symbol": "BTC",
+            "data": {
+                "opening_price": Decimal("91500000.0"),
+                "trade_price": Decimal("92000000.0"),
+                "max_price": Decimal("92800000.0"),
+                "min_price": Decimal("91000000.0"),
+                "prev_closing_price": Decimal("91500000.0"),
+                "acc_trade_volume_24h": Decimal("2551.9"),
+            },
+        }
+    }
+
+
+def main() -> None:
+    codecs = available_codecs()
+    header = f"{'socket':<10}{'market':<10}" + "".join(
+        f"{codec.name + ' dec/s':>16}{codec.name + ' enc/s':>16}" for codec in codecs
+    )
+    print(header)
+
+    for socket_type in ("ticker", "orderbook"):
+        for market, raws in load_raw_frames(socket_type).items():
+            row = f"{socket_type:<10}{market:<10}"
+            for codec in codecs:
+                parsed = [codec.loads(raw) for raw in raws]
+                decode = measure(lambda: [codec.loads(raw) for raw in raws], NUMBER // len(raws))
+                encode = measure(lambda: codec.dumps(parsed), NUMBER // len(raws))
+                row += f"{decode * len(raws):>16,.0f}{encode * len(raws):>16,.0f}"
+            print(row)
+
+    sample = rest_schema_sample()
+    row = f"{'rest':<10}{'decimal':<10}"
+    for codec in codecs:
+        encode = measure(lambda: codec.dumps(sample), NUMBER)
+        row += f"{'-':>16}{encode:>16,.0f}"
+    print(row)
+
+
+if __name__ == "__main__":
+    main()
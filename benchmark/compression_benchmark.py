@@ -0,0 +1,102 @@
+"""
+카프카 압축 코덱 벤치마크 (none / gzip / snappy / lz4 / zstd)
+
+- 거래소별 캡처 프레임을 파이프라인과 같은 방식으로 정규화해 BATCH 레코드 배치 메시지로 구성
+- 지역 토픽(KOREA/ASIA/NE_REAL_TOPIC_NAME) x 소켓 타입 별로 압축률과 CPU 비용 측정
+- 압축/해제는 Producer/Consumer 가 실제로 쓰는 aiokafka.codec 함수 사용
+- 메시지 하나를 단독으로 압축 (실제 Producer 배치는 여러 메시지를 묶음)
+- 캡처 프레임 5개를 반복해 배치를 채우므로 절대 압축률은 실제보다 높게 나옴, 코덱 간 비교용
+
+실행:
+    python -m benchmark.compression_benchmark
+"""
+
+import time
+from collections import defaultdict
+from typing import Callable
+
+from aiokafka import codec as kafka_codec
+
+from benchmark._frames import load_frames, socket_exchanges
+from common.client.market_socket.websocket_interface import MessageQueueData, MessageQueueManager
+from common.utils.json_codec import codec
+from common.utils.other_util import get_topic_name
+from mq.data_interaction import COMPRESSION_CODECS
+from mq.data_format import encode_columnar, is_columnar
+from common.core.types import SocketLowData
+
+BATCH = 100
+NUMBER = 200
+
+Compressor = tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def available_compressors() -> dict[str, Compressor]:
+    compressors: dict[str, Compressor] = {}
+    for name, checker in COMPRESSION_CODECS.items():
+        if not checker():
+            print(f"{name} 미설치 --> 건너뜀 (pip install cramjam)")
+            continue
+        compressors[name] = (
+            getattr(kafka_codec, f"{name}_encode"),
+            getattr(kafka_codec, f"{name}_decode"),
+        )
+    return compressors
+
+
+def region_messages(socket_type: str, columnar: bool = False) -> dict[str, list[bytes]]:
+    """지역 토픽별 카프카 메시지 (거래소당 BATCH 레코드 메시지 하나)"""
+    queue_manager = MessageQueueManager()
+    exchanges = socket_exchanges()
+    messages: defaultdict[str, list[bytes]] = defaultdict(list)
+    for market, frames in load_frames(socket_type).items():
+        location = exchanges[market]
+        records = [
+            queue_manager.normalize(
+                MessageQueueData(market=market.upper(), symbol="BTC", message=frames[i % len(frames)]),
+                socket_type,
+            )
+            for i in range(BATCH)
+        ]
+        if columnar:
+            if not is_columnar(records):
+                continue
+            payload = encode_columnar(location, market, "BTC", records)
+        else:
+            payload = SocketLowData(region=location, market=market, symbol="BTC", data=records)
+        messages[f"{get_topic_name(location)}-{socket_type}"].append(codec.dumps(payload))
+    return messages
+
+
+def cost(func: Callable[[bytes], bytes], messages: list[bytes]) -> tuple[float, list[bytes]]:
+    """messages 전체를 NUMBER 번 처리한 결과와 소요 시간"""
+    start = time.perf_counter()
+    for _ in range(NUMBER):
+        results = [func(message) for message in messages]
+    elapsed = time.perf_counter() - start
+    return results, elapsed
+
+
+def main() -> None:
+    compressors = available_compressors()
+    print(f"{'topic':<36}{'codec':<8}{'raw B':>10}{'comp B':>10}{'ratio':>8}{'comp MB/s':>12}{'decomp MB/s':>13}")
+
+    cases = [("ticker", False), ("ticker", True), ("orderbook", False)]
+    for socket_type, columnar in cases:
+        for topic, messages in sorted(region_messages(socket_type, columnar).items()):
+            label = f"{topic}{' (columnar)' if columnar else ''}"
+            raw = sum(len(message) for message in messages)
+            print(f"{label:<36}{'none':<8}{raw:>10,}{raw:>10,}{1:>8.2f}{'-':>12}{'-':>13}")
+            for name, (encode, decode) in compressors.items():
+                compressed, encode_elapsed = cost(encode, messages)
+                _, decode_elapsed = cost(decode, compressed)
+                size = sum(len(message) for message in compressed)
+                megabytes = raw * NUMBER / 1024 / 1024
+                print(
+                    f"{'':<36}{name:<8}{raw:>10,}{size:>10,}{raw / size:>8.2f}"
+                    f"{megabytes / encode_elapsed:>12,.1f}{megabytes / decode_elapsed:>13,.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
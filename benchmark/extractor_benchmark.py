@@ -0,0 +1,32 @@
+"""
+티커 정규화 벤치마크
+
+- 범용 추출 경로(extract_generic) vs 거래소별 컴파일된 추출기(extract)
+- 거래소별 캡처 티커 프레임 기준 초당 처리 프레임 수 비교
+
+실행:
+    python -m benchmark.extractor_benchmark
+"""
+
+from benchmark._frames import load_frames, measure
+from config.yml_param_load import ticker_projections
+
+NUMBER = 50_000
+
+
+def main() -> None:
+    print(f"{'market':<10}{'generic frames/s':>20}{'compiled frames/s':>20}{'speedup':>10}")
+    for market, frames in load_frames("ticker").items():
+        projection = ticker_projections.get(market)
+        repeat = NUMBER // len(frames)
+
+        generic = measure(lambda: [projection.extract_generic(frame) for frame in frames], repeat)
+        compiled = measure(lambda: [projection.extract(frame) for frame in frames], repeat)
+        print(
+            f"{market:<10}{generic * len(frames):>20,.0f}"
+            f"{compiled * len(frames):>20,.0f}{compiled / generic:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+이벤트 루프 벤치마크 (asyncio vs uvloop)
+
+- 거래소별 캡처 프레임을 가짜 웹소켓으로 WebsocketConnectionManager 에 재생
+- 거래소 전체를 한 이벤트 루프에서 동시에 재생 (실제 소켓 프로세스와 같은 구성)
+- 카프카 전송과 로그 기록은 제외하고 수신 -> 큐 -> 정규화 -> 배치 적재 구간만 측정
+- 프레임 지연 = 소켓에서 프레임을 꺼낸 시각 ~ worker 가 처리를 끝낸 시각
+
+실행:
+    python -m benchmark.loop_benchmark
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from benchmark._frames import load_raw_frames, socket_exchanges
+from common.client.market_socket.websocket_interface import (
+    MessageQueueData,
+    WebsocketConnectionManager,
+)
+from common.client.market_socket.consolidation import BBOConsolidator
+from pipe.launcher import loop_name, run
+
+FRAMES_PER_MARKET = 5_000
+
+
+class ReplayWebsocket:
+    """캡처 프레임을 순서대로 돌려주고 다 떨어지면 연결 종료"""
+
+    def __init__(self, frames: list[bytes]) -> None:
+        # 첫 프레임은 연결 응답으로 소비되므로 시각을 기록하지 않음
+        self.frames = deque([b'{"event": "connected"}', *frames])
+        self.handed_out: deque[float] = deque()
+        self.first = True
+
+    async def recv(self) -> bytes:
+        if not self.frames:
+            raise ConnectionError("replay finished")
+        # 실제 소켓처럼 프레임마다 루프에 제어권을 넘김
+        await asyncio.sleep(0)
+        if self.first:
+            self.first = False
+        else:
+            self.handed_out.append(time.perf_counter())
+        return self.frames.popleft()
+
+
+async def nothing(*args, **kwargs) -> None:
+    return None
+
+
+async def replay(market: str, location: str, frames: list[bytes], socket_type: str, latencies: list[float]) -> None:
+    manager = WebsocketConnectionManager(location=location, folder="benchmark", rest_client=None)
+    # 카프카로 나가는 전송은 전부 제외 (원본 배치, 에러 집계, 오더북 스냅샷, 봉, 통합 BBO)
+    manager.kafka_service.send_message = nothing
+    manager.kafka_service.errors.send = nothing
+    processor = manager.message_processor
+    if processor.order_books is not None:
+        processor.order_books.send = nothing
+    if processor.candles is not None:
+        processor.candles.send = nothing
+    if processor.consolidator is not None:
+        processor.consolidator.send = nothing
+    manager._logger.log_message = nothing
+
+    websocket = ReplayWebsocket(frames)
+    producing_start = manager.producing_start
+
+    # worker 1개 -> FIFO 이므로 꺼낸 순서대로 지연 계산
+    async def timed_producing_start(queue_data: MessageQueueData, socket_type: str) -> None:
+        await producing_start(queue_data, socket_type)
+        latencies.append(time.perf_counter() - websocket.handed_out.popleft())
+
+    manager.producing_start = timed_producing_start
+    try:
+        await manager.handle_message(websocket, f"wss://api.{market}.com/ws", "BTC", socket_type)
+    except ConnectionError:
+        pass
+
+
+async def replay_all(socket_type: str) -> tuple[int, float, list[float]]:
+    exchanges = socket_exchanges()
+    latencies: list[float] = []
+    jobs = []
+    # 통합 BBO 는 프로세스 공용이라 이벤트 루프(측정)마다 새로 만듦
+    BBOConsolidator._shared = None
+    for market, raws in load_raw_frames(socket_type).items():
+        frames = (raws * (FRAMES_PER_MARKET // len(raws) + 1))[:FRAMES_PER_MARKET]
+        jobs.append(replay(market, exchanges[market], frames, socket_type, latencies))
+
+    start = time.perf_counter()
+    await asyncio.gather(*jobs)
+    elapsed = time.perf_counter() - start
+    return len(latencies), elapsed, latencies
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def main() -> None:
+    loops = ["asyncio"] + (["uvloop"] if loop_name("uvloop") == "uvloop" else [])
+    if len(loops) == 1:
+        print("uvloop 미설치 --> asyncio 만 측정")
+
+    print(f"{'socket':<10}{'loop':<10}{'frames':>10}{'frames/s':>14}{'p50 ms':>10}{'p99 ms':>10}")
+    for socket_type in ("ticker", "orderbook"):
+        for event_loop in loops:
+            count, elapsed, latencies = run(replay_all(socket_type), event_loop=event_loop)
+            print(
+                f"{socket_type:<10}{event_loop:<10}{count:>10,}{count / elapsed:>14,.0f}"
+                f"{percentile(latencies, 0.50) * 1000:>10.3f}{percentile(latencies, 0.99) * 1000:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
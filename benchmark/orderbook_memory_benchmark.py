@@ -0,0 +1,121 @@
+"""
+오더북 저장소 메모리 벤치마크
+
+- 심볼 500 개 x 거래소 9 개, 한쪽 호가 levels 개
+- raw dict: 수신 페이로드처럼 {"bids": {가격 문자열: 수량 문자열}, "asks": ...}
+- dict storage: 로컬 오더북 BookSide (정렬 키 리스트 + dict, 원본 값 보존)
+- array storage: ArrayBookSide (고정소수점 int64 NumPy 배열)
+- 메모리는 tracemalloc 으로 측정, 조회는 전체 오더북 대상 top-10 / mid / depth-at-bps / VWAP 초당 횟수
+
+실행:
+    python -m benchmark.orderbook_memory_benchmark
+    python -m benchmark.orderbook_memory_benchmark --symbols 100 --levels 20
+"""
+
+import gc
+import random
+import argparse
+import tracemalloc
+from typing import Callable
+
+from benchmark._frames import measure, socket_exchanges
+from common.client.market_socket.orderbook import OrderBook, BookUpdate, BOOK_FORMATS
+
+Levels = list[tuple[str, str]]
+
+
+def book_levels(levels: int, seed: int) -> tuple[Levels, Levels]:
+    """거래소 페이로드와 같은 문자열 가격/수량 (bids, asks)"""
+    rng = random.Random(seed)
+    mid = rng.uniform(0.1, 100_000)
+    tick = mid / 100_000
+    bids = [(f"{mid - tick * (i + 1):.8f}", f"{rng.uniform(0.001, 5):.8f}") for i in range(levels)]
+    asks = [(f"{mid + tick * (i + 1):.8f}", f"{rng.uniform(0.001, 5):.8f}") for i in range(levels)]
+    return bids, asks
+
+
+def raw_book(bids: Levels, asks: Levels) -> dict:
+    return {"bids": dict(bids), "asks": dict(asks)}
+
+
+def local_book(storage: str) -> Callable[[Levels, Levels], OrderBook]:
+    book_format = BOOK_FORMATS["BYBIT"]
+
+    def build(bids: Levels, asks: Levels) -> OrderBook:
+        book = OrderBook("BENCH", "BENCH", storage)
+        book.apply(BookUpdate(snapshot=True, bids=bids, asks=asks), book_format, validate=False)
+        return book
+
+    return build
+
+
+def allocated(build: Callable[[Levels, Levels], object], count: int, levels: int) -> tuple[list, int]:
+    """오더북 count 개를 만들었을 때 남아 있는 메모리
+
+    - 페이로드도 측정 구간 안에서 만들기 때문에 오더북이 붙잡고 있는 원본 문자열까지 포함
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    books = [build(*book_levels(levels, seed)) for seed in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return books, after - before
+
+
+def raw_queries(book: dict) -> tuple:
+    """raw dict 는 조회할 때마다 문자열을 숫자로 바꿔 정렬"""
+    bids = sorted(((float(p), float(s)) for p, s in book["bids"].items()), reverse=True)
+    asks = sorted((float(p), float(s)) for p, s in book["asks"].items())
+    mid = (bids[0][0] + asks[0][0]) / 2
+    band = mid * 10 / 10_000
+    sum(s for p, s in bids if p >= mid - band)
+    sum(s for p, s in asks if p <= mid + band)
+    remaining, cost = 1.0, 0.0
+    for price, size in asks:
+        take = min(size, remaining)
+        cost += take * price
+        remaining -= take
+        if remaining <= 0:
+            break
+    return bids[:10], asks[:10], cost / (1.0 - remaining)
+
+
+def local_queries(book: OrderBook) -> tuple:
+    return book.top_n(10), book.mid(), book.depth_at_bps(10), book.vwap_to_size("buy", 1.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="오더북 저장소 메모리 벤치마크")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--levels", type=int, default=50)
+    args = parser.parse_args()
+
+    exchanges = len(socket_exchanges())
+    count = args.symbols * exchanges
+
+    print(f"books: {args.symbols} symbols x {exchanges} exchanges = {count:,}, levels/side: {args.levels}")
+    print(f"{'storage':<16}{'total MiB':>12}{'bytes/book':>14}{'bytes/level':>14}{'query books/s':>16}")
+    for name, build, queries in [
+        ("raw dict", raw_book, raw_queries),
+        ("dict storage", local_book("dict"), local_queries),
+        ("array storage", local_book("array"), local_queries),
+    ]:
+        books, size = allocated(build, count, args.levels)
+        sample = books[:200]
+
+        def run() -> None:
+            for book in sample:
+                queries(book)
+
+        rate = measure(run, 5) * len(sample)
+        print(
+            f"{name:<16}{size / 2**20:>12,.1f}{size / count:>14,.0f}"
+            f"{size / (count * args.levels * 2):>14,.1f}{rate:>16,.0f}"
+        )
+        del books
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+파티셔너 벤치마크
+
+- Producer 가 레코드마다 호출하는 파티셔너의 초당 호출 수
+- socket: 라우팅 테이블 조회 vs 키 해석(route, 테이블 미사용 경로)
+- symbol: (거래소, 심볼) 분산 모드의 라우팅 테이블 조회
+- hashing: LRU 캐시 vs 매번 murmur2
+
+실행:
+    python -m benchmark.partitioner_benchmark
+"""
+
+from kafka.partitioner.default import murmur2
+
+from benchmark._frames import measure, socket_exchanges
+from config.yml_param_load import symbol_json
+from mq.data_partitional import (
+    CoinHashingCustomPartitional,
+    CoinSocketDataCustomPartition,
+    CoinSymbolShardPartition,
+    key_bytes,
+)
+
+NUMBER = 200
+PARTITIONS = list(range(4))
+
+
+def main() -> None:
+    keys = [
+        key_bytes(f"{market.upper()}:{socket_type}-{symbol}")
+        for market in socket_exchanges()
+        for socket_type in ("ticker", "orderbook")
+        for symbol in symbol_json()
+    ]
+    socket_partitioner = CoinSocketDataCustomPartition()
+    symbol_partitioner = CoinSymbolShardPartition()
+    hashing_partitioner = CoinHashingCustomPartitional()
+
+    def socket_table() -> None:
+        for key in keys:
+            socket_partitioner(key, PARTITIONS, PARTITIONS)
+
+    def socket_parse() -> None:
+        for key in keys:
+            CoinSocketDataCustomPartition.route(key)
+
+    def symbol_table() -> None:
+        for key in keys:
+            symbol_partitioner(key, PARTITIONS, PARTITIONS)
+
+    def hashing_cached() -> None:
+        for key in keys:
+            hashing_partitioner(key, PARTITIONS, PARTITIONS)
+
+    def hashing_murmur2() -> None:
+        for key in keys:
+            (murmur2(key) & 0x7FFFFFF) % len(PARTITIONS)
+
+    print(f"{'partitioner':<12}{'path':<16}{'calls/s':>14}")
+    for name, path, func in [
+        ("socket", "routing table", socket_table),
+        ("socket", "key parsing", socket_parse),
+        ("symbol", "routing table", symbol_table),
+        ("hashing", "lru cache", hashing_cached),
+        ("hashing", "murmur2", hashing_murmur2),
+    ]:
+        print(f"{name:<12}{path:<16}{measure(func, NUMBER) * len(keys):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
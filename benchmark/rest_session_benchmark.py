@@ -0,0 +1,121 @@
+"""
+REST 세션 벤치마크 (호출마다 새 세션 vs 호스트별 공유 세션)
+
+- 별도 프로세스의 로컬 aiohttp 서버가 거래소 수만큼 포트를 열고 캡처한 티커 프레임을 응답 (거래소 REST 대역)
+- 한 라운드 = fetch_market_data 처럼 거래소 전체에 동시에 한 번씩 요청
+- per-call session: 기존 async_source (요청마다 ClientSession 생성 -> DNS 조회 / TCP 연결 후 종료)
+- pooled session: HttpSessionPool (호스트별 공유 세션, keep-alive 연결 재사용)
+- 호스트 이름은 localhost 로 두어 DNS 조회 비용도 포함, 로컬 대역이라 TLS 핸드셰이크 비용은 빠져 있음
+  (실제 거래소 HTTPS 에서는 차이가 더 큼)
+
+실행:
+    python -m benchmark.rest_session_benchmark
+    python -m benchmark.rest_session_benchmark --rounds 500
+"""
+
+import time
+import socket
+import asyncio
+import argparse
+import multiprocessing as mp
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+from aiohttp import web
+
+from benchmark._frames import load_frames
+from common.client.market_rest.async_api_client import AsyncRequestJSON, HttpSessionPool
+from pipe.launcher import run
+
+
+def free_ports(count: int) -> list[int]:
+    """비어 있는 로컬 포트"""
+    sockets = [socket.socket() for _ in range(count)]
+    for sock in sockets:
+        sock.bind(("127.0.0.1", 0))
+    ports = [sock.getsockname()[1] for sock in sockets]
+    for sock in sockets:
+        sock.close()
+    return ports
+
+
+def serve(ports: list[int], ready: Any) -> None:
+    """거래소마다 포트 하나씩 티커를 응답하는 서버 (자식 프로세스)"""
+    frames = list(load_frames("ticker").values())
+
+    async def main() -> None:
+        runners = []
+        for port, frame in zip(ports, frames):
+
+            async def ticker(request: web.Request, frame: dict = frame[0]) -> web.Response:
+                return web.json_response([frame])
+
+            app = web.Application()
+            app.router.add_get("/ticker", ticker)
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            await web.TCPSite(runner, "127.0.0.1", port).start()
+            runners.append(runner)
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def per_call_session(url: str) -> Any:
+    """기존 방식: 요청마다 세션 생성 후 종료"""
+    request = AsyncRequestJSON(url=url, headers={"Accept": "application/json"})
+    async with aiohttp.ClientSession() as session:
+        return await request.async_response(session=session)
+
+
+async def pooled_session(url: str) -> Any:
+    """호스트별 공유 세션"""
+    return await AsyncRequestJSON(url=url, headers={"Accept": "application/json"}).async_fetch_json()
+
+
+async def measure_rounds(fetch: Callable[[str], Awaitable[Any]], urls: list[str], rounds: int) -> tuple[float, float]:
+    """(초당 요청 수, 라운드 평균 지연 ms)"""
+    # 첫 라운드는 세션/연결 준비 구간이라 제외
+    await asyncio.gather(*(fetch(url) for url in urls))
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(rounds):
+        began = time.perf_counter()
+        await asyncio.gather(*(fetch(url) for url in urls))
+        latencies.append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - start
+    return rounds * len(urls) / elapsed, sum(latencies) / len(latencies) * 1000
+
+
+async def bench(urls: list[str], rounds: int) -> None:
+    print(f"{'client':<20}{'requests/s':>14}{'round ms':>12}")
+    for name, fetch in [("per-call session", per_call_session), ("pooled session", pooled_session)]:
+        async with HttpSessionPool.lifespan():
+            rate, latency = await measure_rounds(fetch, urls, rounds)
+        print(f"{name:<20}{rate:>14,.0f}{latency:>12,.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="REST 세션 벤치마크")
+    parser.add_argument("--rounds", type=int, default=300)
+    args = parser.parse_args()
+
+    exchanges = len(load_frames("ticker"))
+    ports = free_ports(exchanges)
+    ready = mp.Event()
+    server = mp.Process(target=serve, args=(ports, ready), daemon=True)
+    server.start()
+    try:
+        if not ready.wait(timeout=10):
+            raise RuntimeError("로컬 서버가 시작되지 않았습니다")
+        urls = [f"http://localhost:{port}/ticker" for port in ports]
+        print(f"hosts: {exchanges}, rounds: {args.rounds} (requests/round: {exchanges})")
+        run(bench(urls, args.rounds))
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+import asyncio
 import aiohttp
 from abc import abstractmethod
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, ClassVar, Iterator
+from urllib.parse import urlsplit
 
 from common.exception import RestRetryOnFailure
 from common.core.types import ExchangeResponseData
@@ -8,6 +11,88 @@ from common.core.abstract import (
     AbstractAsyncRequestAcquisition,
     AbstractExchangeRestClient,
 )
+from common.setting.properties import (
+    HTTP_LIMIT_PER_HOST,
+    HTTP_DNS_TTL_S,
+    HTTP_KEEPALIVE_S,
+    HTTP_TIMEOUT_S,
+)
+
+
+class HttpSessionPool:
+    """
+    HttpSessionPool
+    - 거래소 호스트별 aiohttp.ClientSession 하나를 프로세스 전역에서 공유
+    - keep-alive 연결을 재사용해 매 호출의 DNS 조회 / TCP 연결 / TLS 핸드셰이크를 생략
+    - 세션은 첫 호출 시 만들고, 파이프라인 종료 시 lifespan 에서 정리
+    """
+
+    _sessions: ClassVar[dict[str, aiohttp.ClientSession]] = {}
+    _lock: ClassVar[asyncio.Lock | None] = None
+
+    # fmt: off
+    @staticmethod
+    def host_key(url: str) -> str:
+        """scheme + host[:port] (풀 키)"""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    @staticmethod
+    def connector() -> aiohttp.TCPConnector:
+        """호스트당 연결 수 / DNS 캐시 / keep-alive 를 조정한 커넥터"""
+        return aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=int(HTTP_LIMIT_PER_HOST),
+            ttl_dns_cache=int(HTTP_DNS_TTL_S),
+            keepalive_timeout=float(HTTP_KEEPALIVE_S),
+        )
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    async def acquire(cls, url: str) -> aiohttp.ClientSession:
+        """URL 호스트의 공유 세션 반환, 없거나 닫혔으면 한 번만 생성"""
+        key = cls.host_key(url)
+        session = cls._sessions.get(key)
+        if session is not None and not session.closed:
+            return session
+
+        async with cls._get_lock():
+            session = cls._sessions.get(key)
+            if session is None or session.closed:
+                session = cls._sessions[key] = aiohttp.ClientSession(
+                    connector=cls.connector(),
+                    timeout=aiohttp.ClientTimeout(total=float(HTTP_TIMEOUT_S)),
+                )
+        return session
+
+    @classmethod
+    async def close(cls) -> None:
+        """모든 세션 종료 (열린 keep-alive 연결 정리)"""
+        async with cls._get_lock():
+            sessions, cls._sessions = cls._sessions, {}
+            for session in sessions.values():
+                await session.close()
+        cls._lock = None
+
+    @classmethod
+    @asynccontextmanager
+    async def lifespan(cls) -> AsyncIterator[None]:
+        """세션 생명주기 훅
+
+        Example:
+            >>> async with HttpSessionPool.lifespan():
+            ...     await KoreaExchangeRestAPI().total_pull_request("BTC")
+        """
+        try:
+            yield
+        finally:
+            await cls.close()
+
 
 # fmt: off
 class AsyncRequestAcquisition(AbstractAsyncRequestAcquisition):
@@ -20,9 +105,9 @@ class AsyncRequestAcquisition(AbstractAsyncRequestAcquisition):
             return data
         
     async def async_source(self) -> Any:
-        """호출 시작점"""
-        async with aiohttp.ClientSession() as session:
-            return await self.async_response(session=session)
+        """호출 시작점 (호스트별 공유 세션 사용)"""
+        session = await HttpSessionPool.acquire(self.url)
+        return await self.async_response(session=session)
 
 
 class AsyncRequestJSON(AsyncRequestAcquisition):
@@ -43,6 +128,70 @@ class CoinExchangeRestClient(AbstractExchangeRestClient):
         else:
             return None
 
+    async def get_coin_all_info_prices(self, coin_names: list[str]) -> dict[str, ExchangeResponseData]:
+        """여러 코인데이터를 요청 한 번으로 호출 (심볼 대문자 -> 티커)
+
+        - 전체(다중) 티커 엔드포인트가 없는 거래소는 심볼별로 호출
+        - 거래소가 다중 요청을 거절하면(모르는 심볼 하나로 4xx 등) 심볼별로 다시 호출
+        - 응답에 없는 심볼은 결과에서 빠짐
+        """
+        url = self._get_tickers_url(coin_names)
+        if url is None:
+            tickers = await asyncio.gather(*(self.get_coin_all_info_price(coin_name) for coin_name in coin_names))
+            return {coin_name.upper(): ticker for coin_name, ticker in zip(coin_names, tickers)}
+
+        try:
+            data = await self._get_tickers(url)
+        except aiohttp.ClientResponseError as error:
+            if not 400 <= error.status < 500 or error.status == 429:
+                raise
+            return await self._get_tickers_each(coin_names)
+        if data is None:
+            return {}
+        if self._tickers_rejected(data):
+            return await self._get_tickers_each(coin_names)
+
+        wanted = {coin_name.upper() for coin_name in coin_names}
+        return {
+            symbol: ticker
+            for symbol, ticker in self._split_tickers(data, coin_names)
+            if symbol in wanted
+        }
+
+    @RestRetryOnFailure(retries=3, base_delay=2)
+    async def _get_tickers(self, url: str) -> Any:
+        """다중 티커 호출"""
+        return await async_request_data(url=url)
+
+    async def _get_tickers_each(self, coin_names: list[str]) -> dict[str, ExchangeResponseData]:
+        """심볼별 호출, 실패한 심볼은 결과에서 빠짐 (모두 실패하면 첫 예외)"""
+        tickers = await asyncio.gather(
+            *(self.get_coin_all_info_price(coin_name) for coin_name in coin_names),
+            return_exceptions=True,
+        )
+        result = {
+            coin_name.upper(): ticker
+            for coin_name, ticker in zip(coin_names, tickers)
+            if not isinstance(ticker, BaseException)
+        }
+        if not result and tickers:
+            raise next(ticker for ticker in tickers if isinstance(ticker, BaseException))
+        return result
+
+    def _tickers_rejected(self, data: Any) -> bool:
+        """정상 응답(200)이지만 거래소가 다중 요청 전체를 거절했는지"""
+        return False
+
+    @abstractmethod
+    def _get_tickers_url(self, coin_names: list[str]) -> str | None:
+        """여러 심볼(또는 전체) ticker 주소, None 이면 심볼별 호출"""
+        pass
+
+    @abstractmethod
+    def _split_tickers(self, data: Any, coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        """전체 티커 응답 -> (심볼 대문자, 티커)"""
+        pass
+
     # @abstractmethod
     # def _get_orderbook_url(self, coin_name: str) -> str:
     #     """ordering 주소"""
@@ -67,6 +67,25 @@ class CoinPresentPriceClient:
         )
         return market_data_architecture
 
+    async def _trans_schema_bulk(self, market: str, symbols: list[str]) -> dict[str, ExchangeData]:
+        """거래소 한 곳의 여러 심볼을 요청 한 번으로 받아 심볼별 스키마로 분배"""
+        market_info = self.market_env[market]
+        timestamp = int(time.time())
+        tickers = await market_info["api"].get_coin_all_info_prices(
+            coin_names=[symbol.upper() for symbol in symbols]
+        )
+        return {
+            symbol: await schema_create(
+                market=f"{market}-{symbol.upper()}",
+                symbol=symbol,
+                time=timestamp,
+                # 응답에 없는 심볼은 단건 호출 실패와 같은 빈 스키마
+                api=tickers.get(symbol.upper()),
+                data=market_info["parameter"],
+            )
+            for symbol in symbols
+        }
+
 
 class BaseExchangeRestAPI(CoinPresentPriceClient):
     """기본 거래소 API"""
@@ -79,6 +98,22 @@ class BaseExchangeRestAPI(CoinPresentPriceClient):
         ]
         return await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def fetch_market_data_bulk(self, symbols: list[str]) -> dict[str, list[ExchangeData | Exception]]:
+        """거래소마다 요청 한 번으로 여러 심볼 시장 데이터 가져오기 (심볼 -> 거래소 순서의 결과)"""
+        tasks = [
+            self._trans_schema_bulk(market=market, symbols=symbols)
+            for market in self.market_env
+        ]
+        market_results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 거래소 요청이 실패하면 그 거래소는 모든 심볼에서 같은 예외
+        return {
+            symbol: [
+                result if isinstance(result, BaseException) else result[symbol]
+                for result in market_results
+            ]
+            for symbol in symbols
+        }
+
     @abstractmethod
     def create_schema(self, market_result: list[ExchangeData]) -> dict: ...
 
@@ -89,3 +124,15 @@ class BaseExchangeRestAPI(CoinPresentPriceClient):
         await self.logging.log_message(logging.INFO, message=schema)
 
         return schema
+
+    async def _log_market_schema_bulk(self, coin_symbols: list[str]) -> dict[str, dict]:
+        """여러 심볼 공통 로깅 함수 (심볼 -> 스키마)"""
+        market_results = await self.fetch_market_data_bulk(coin_symbols)
+        schemas = {
+            symbol: self.create_schema(market_result)
+            for symbol, market_result in market_results.items()
+        }
+        for schema in schemas.values():
+            await self.logging.log_message(logging.INFO, message=schema)
+
+        return schemas
@@ -8,13 +8,13 @@ class BaseSettingWebsocket(ABC):
 
     def __init__(
         self,
-        symbol: str,
+        symbol: str | list[str],
         market_env,
         market: str = "all",
     ) -> None:
         """socket 시작
         Args:
-            symbol: 긁어올 코인
+            symbol: 긁어올 코인 또는 코인 목록 (목록이면 거래소별 연결 하나에 모두 구독)
             market: 활성화할 마켓. Defaults to "all"이면 모든 거래소 선택.
         """
         self.market = market
@@ -50,6 +50,11 @@ class BaseSettingWebsocket(ABC):
         await asyncio.gather(*coroutines, return_exceptions=False)
 
 
+    async def start(self) -> None:
+        """소켓 실행 시작점"""
+        await self.coin_present_architecture()
+
+
 class MarketsCoinTickerPriceWebsocket(BaseSettingWebsocket):
     """티커 웹소켓"""
 
@@ -62,3 +67,7 @@ class MarketsCoinOrderBookWebsocket(BaseSettingWebsocket):
 
     def get_websocket_method(self, api: Callable) -> Callable:
         return api.orderbook_present_websocket
+
+
+PriceWebSocketClient = MarketsCoinTickerPriceWebsocket
+OrderBookWebSocketClient = MarketsCoinOrderBookWebsocket
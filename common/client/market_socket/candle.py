@@ -0,0 +1,232 @@
+"""
+OHLCV 봉 집계
+
+- 정규화된 티커(_marekt_all_ticker.yml 의 candle 컬럼)로 (거래소, 심볼) 별 1s / 1m / 5m 봉 생성
+- 티커 하나당 interval 마다 진행 중인 봉의 high/low/close/volume 만 갱신 (O(1))
+- 마감된 봉은 interval 별 ring buffer(deque maxlen)에 남기고 {지역 토픽}-candle-{interval} 로 전송
+- 거래량은 24시간 누적값의 증가분 (24시간 창이 밀려 줄어드는 경우는 0 으로 취급)
+- 다음 봉의 티커가 오지 않아도 봉 종료 + grace_ms 가 지나면 타이머가 마감
+- 티커가 없던 구간의 빈 봉은 만들지 않음
+"""
+
+import time
+import asyncio
+from collections import Counter, deque
+from typing import Any, Awaitable, Callable
+
+from config.yml_param_load import CandleFields
+from common.core.types import CandleBar
+from common.utils.periodic import run_periodic
+from common.setting.properties import (
+    CANDLE_INTERVALS,
+    CANDLE_HISTORY,
+    CANDLE_GRACE_MS,
+)
+
+CANDLE_TOPIC_SUFFIX = "candle"
+UNITS = {"s": 1_000, "m": 60_000, "h": 3_600_000}
+
+CandleKey = tuple[str, str]
+CandleSender = Callable[[CandleBar], Awaitable[None]]
+
+
+def interval_ms(label: str) -> int:
+    """'1s' / '1m' / '5m' / '1h' -> 밀리초"""
+    label = label.strip().lower()
+    return int(label[:-1]) * UNITS[label[-1]]
+
+
+def candle_intervals(intervals: str = CANDLE_INTERVALS) -> list[str]:
+    """설정된 interval 목록 (짧은 순)"""
+    return sorted((label.strip().lower() for label in intervals.split(",") if label.strip()), key=interval_ms)
+
+
+class Candle:
+    """진행 중이거나 마감된 봉 하나"""
+
+    __slots__ = ("start", "open", "high", "low", "close", "volume", "ticks")
+
+    def __init__(self, start: int, price: float, volume: float) -> None:
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+        self.ticks = 1
+
+    def add(self, price: float, volume: float) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.ticks += 1
+
+
+class CandleSeries:
+    """(거래소, 심볼, interval) 하나의 봉 시계열"""
+
+    __slots__ = ("label", "interval", "current", "closed")
+
+    def __init__(self, label: str, history: int) -> None:
+        self.label = label
+        self.interval = interval_ms(label)
+        self.current: Candle | None = None
+        self.closed: deque[Candle] = deque(maxlen=history)
+
+    def update(self, timestamp: int, price: float, volume: float) -> Candle | None:
+        """티커 반영, 새 봉이 열리면서 마감된 봉 반환
+
+        Raises:
+            ValueError: 진행 중인 봉보다 이전 구간의 티커
+        """
+        start = timestamp - timestamp % self.interval
+        current = self.current
+        if current is not None and start == current.start:
+            current.add(price, volume)
+            return None
+        # 타이머로 이미 마감된 구간도 지난 구간으로 취급
+        if current is not None:
+            floor = current.start
+        else:
+            floor = self.closed[-1].start + self.interval if self.closed else None
+        if floor is not None and start < floor:
+            raise ValueError(f"지난 구간 티커 {timestamp} < {floor}")
+
+        self.current = Candle(start, price, volume)
+        if current is not None:
+            self.closed.append(current)
+        return current
+
+    def expire(self, now_ms: int, grace_ms: int) -> Candle | None:
+        """종료 시각 + grace 가 지난 봉 마감"""
+        current = self.current
+        if current is None or now_ms < current.start + self.interval + grace_ms:
+            return None
+        self.current = None
+        self.closed.append(current)
+        return current
+
+
+class CandleState:
+    """(거래소, 심볼) 별 누적 거래량과 interval 별 시계열"""
+
+    __slots__ = ("last_volume", "series")
+
+    def __init__(self, labels: list[str], history: int) -> None:
+        self.last_volume: float | None = None
+        self.series = [CandleSeries(label, history) for label in labels]
+
+    def volume_delta(self, volume: float) -> float:
+        """24시간 누적 거래량 -> 직전 티커 이후 증가분"""
+        last, self.last_volume = self.last_volume, volume
+        if last is None or volume < last:
+            return 0.0
+        return volume - last
+
+
+class CandleAggregator:
+    """티커 -> OHLCV 봉
+
+    - update 는 동기 호출 (정규화 worker 에서 바로 반영), 마감된 봉은 타이머가 전송
+    """
+
+    def __init__(
+        self,
+        send: CandleSender,
+        region: str,
+        intervals: list[str] | None = None,
+        history: int = int(CANDLE_HISTORY),
+        grace_ms: int = int(CANDLE_GRACE_MS),
+    ) -> None:
+        self.send = send
+        self.region = region
+        self.labels = intervals or candle_intervals()
+        self.history = history
+        self.grace_ms = grace_ms
+        # 가장 짧은 봉 기준으로 마감 확인
+        self.check_interval = min(interval_ms(label) for label in self.labels) / 1000 / 2
+        self.states: dict[CandleKey, CandleState] = {}
+        self.pending: list[CandleBar] = []
+        self.counters: Counter[str] = Counter()
+        self._timer: asyncio.Task | None = None
+
+    def update(self, market: str, symbol: str, ticker: dict[str, Any], fields: CandleFields) -> None:
+        """정규화된 티커 하나 반영"""
+        price = float(ticker[fields.price])
+        volume = float(ticker[fields.volume])
+        timestamp = int(ticker[fields.time]) if fields.time else int(time.time() * 1000)
+
+        key = (market, symbol)
+        state = self.states.get(key)
+        if state is None:
+            state = self.states[key] = CandleState(self.labels, self.history)
+        delta = state.volume_delta(volume)
+
+        self.counters["ticks"] += 1
+        for series in state.series:
+            try:
+                closed = series.update(timestamp, price, delta)
+            except ValueError:
+                self.counters["late"] += 1
+                continue
+            if closed is not None:
+                self.pending.append(self.bar(market, symbol, series, closed))
+
+    def bar(self, market: str, symbol: str, series: CandleSeries, candle: Candle) -> CandleBar:
+        return CandleBar(
+            region=self.region,
+            market=market,
+            symbol=symbol,
+            interval=series.label,
+            start=candle.start,
+            end=candle.start + series.interval,
+            open=candle.open,
+            high=candle.high,
+            low=candle.low,
+            close=candle.close,
+            volume=candle.volume,
+            ticks=candle.ticks,
+        )
+
+    def recent(self, market: str, symbol: str, interval: str, count: int) -> list[Candle]:
+        """최근 마감 봉 count 개 (오래된 순)"""
+        state = self.states.get((market, symbol))
+        if state is None:
+            return []
+        series = next(series for series in state.series if series.label == interval)
+        return list(series.closed)[-count:]
+
+    def expire(self, now_ms: int | None = None) -> None:
+        """티커가 끊겨 열려 있는 봉 마감"""
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        for (market, symbol), state in self.states.items():
+            for series in state.series:
+                if (closed := series.expire(now_ms, self.grace_ms)) is not None:
+                    self.pending.append(self.bar(market, symbol, series, closed))
+
+    async def flush(self) -> None:
+        """마감된 봉 전송"""
+        pending, self.pending = self.pending, []
+        for bar in pending:
+            self.counters[bar["interval"]] += 1
+            await self.send(bar)
+
+    async def _run_timer(self) -> None:
+        async def tick() -> None:
+            self.expire()
+            await self.flush()
+
+        await run_periodic(self.check_interval, tick, "CandleAggregator")
+
+    def start(self) -> None:
+        """마감 타이머 시작 (이미 실행 중이면 무시)"""
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def close(self) -> None:
+        """타이머 정지 후 마감된 봉 전송 (진행 중인 봉은 보내지 않음)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
@@ -0,0 +1,139 @@
+"""
+토픽별 전송 모드 (conflation)
+
+- all: 수신한 프레임을 모두 배치로 전송 (기본)
+- conflate: (토픽, 카프카 키) 별 최신 프레임 하나만 남기고 interval_ms 마다 전송
+  - 직전 전송 이후 기준 가격이 threshold_bps 이상 움직이면 타이머를 기다리지 않고 바로 전송
+  - 기준 가격: 티커는 _marekt_all_ticker.yml 의 candle price 컬럼, 오더북은 로컬 오더북 mid
+  - 전송하지 못하고 덮어쓴 프레임은 counters["conflated"] 로 집계
+- 전체 상태를 매번 보내는 스트림(티커, 스냅샷형 오더북)에만 적용
+  - 증분(delta) 오더북 스트림(OKX / Bybit / Kraken)은 프레임을 버리면 복원할 수 없으므로 그대로 전송,
+    이 거래소들의 최신 상태는 {지역 토픽}-book 토픽(로컬 오더북 스냅샷)으로 받음
+- 토픽별 모드는 urls.conf [CONFLATION_MODE] 에서 선택
+"""
+
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, NamedTuple
+
+from common.core.types import ResponseData, ProducerMetadataDict
+from common.utils.periodic import run_periodic
+from common.client.market_socket.orderbook import BOOK_FORMATS
+from common.setting.properties import (
+    CONFLATION_MODES,
+    CONFLATION_INTERVAL_MS,
+    CONFLATION_THRESHOLD_BPS,
+)
+
+ALL = "all"
+CONFLATE = "conflate"
+
+RecordSender = Callable[[ResponseData, ProducerMetadataDict], Awaitable[None]]
+
+
+def conflation_mode(topic: str) -> str:
+    """토픽에 설정된 전송 모드 (configparser 키는 소문자)"""
+    return CONFLATION_MODES.get(topic.lower(), ALL)
+
+
+def conflation_enabled() -> bool:
+    """conflate 로 설정된 토픽이 하나라도 있는지"""
+    return any(mode.strip().lower() == CONFLATE for mode in CONFLATION_MODES.values())
+
+
+def conflatable(market: str, topic: str) -> bool:
+    """최신 프레임만 남겨도 되는 스트림인지 (증분 오더북은 제외)"""
+    if not topic.endswith("-orderbook"):
+        return True
+    book_format = BOOK_FORMATS.get(market.upper())
+    return book_format is not None and not book_format.incremental
+
+
+class LatestRecord(NamedTuple):
+    """(토픽, 키) 하나의 아직 전송하지 않은 최신 프레임"""
+
+    message: ResponseData
+    metadata: ProducerMetadataDict
+    price: float | None
+
+
+class Conflator:
+    """(토픽, 키) 별 최신 프레임 보관 및 주기 전송
+
+    - offer 는 정규화 worker 에서 호출, 임계값을 넘는 가격 변화만 즉시 전송
+    - 나머지는 타이머가 interval_ms 마다 보관 중인 최신 프레임을 전송
+    """
+
+    def __init__(
+        self,
+        send: RecordSender,
+        interval_ms: float = float(CONFLATION_INTERVAL_MS),
+        threshold_bps: float = float(CONFLATION_THRESHOLD_BPS),
+    ) -> None:
+        self.send = send
+        self.interval = interval_ms / 1000
+        self.threshold_bps = threshold_bps
+        self.latest: dict[tuple[str, str], LatestRecord] = {}
+        # 마지막으로 전송한 프레임의 기준 가격
+        self.emitted: dict[tuple[str, str], float] = {}
+        self.counters: Counter[str] = Counter()
+        self._timer: asyncio.Task | None = None
+
+    def handles(self, market: str, topic: str) -> bool:
+        """conflate 대상 프레임인지 (증분 오더북은 passthrough 로 집계)"""
+        if conflation_mode(topic) != CONFLATE:
+            return False
+        if not conflatable(market, topic):
+            self.counters["passthrough"] += 1
+            return False
+        return True
+
+    def moved(self, key: tuple[str, str], price: float | None) -> bool:
+        """직전 전송 가격 대비 threshold_bps 이상 움직였는지"""
+        last = self.emitted.get(key)
+        if price is None or not last:
+            return False
+        return abs(price - last) / last * 10_000 >= self.threshold_bps
+
+    async def offer(self, message: ResponseData, metadata: ProducerMetadataDict, price: float | None = None) -> None:
+        """최신 프레임 갱신, 가격이 크게 움직였으면 바로 전송"""
+        key = (metadata["topic"], metadata["key"])
+        self.counters["received"] += 1
+        if key in self.latest:
+            self.counters["conflated"] += 1
+        self.latest[key] = LatestRecord(message, metadata, price)
+
+        if self.moved(key, price):
+            self.counters["threshold"] += 1
+            await self.emit(key)
+
+    async def emit(self, key: tuple[str, str]) -> None:
+        """보관 중인 최신 프레임 하나 전송"""
+        record = self.latest.pop(key, None)
+        if record is None:
+            return
+        if record.price is not None:
+            self.emitted[key] = record.price
+        self.counters["emitted"] += 1
+        await self.send(record.message, record.metadata)
+
+    async def flush(self) -> None:
+        """보관 중인 최신 프레임 전부 전송"""
+        for key in list(self.latest):
+            await self.emit(key)
+
+    async def _run_timer(self) -> None:
+        await run_periodic(self.interval, self.flush, "Conflator")
+
+    def start(self) -> None:
+        """전송 타이머 시작 (이미 실행 중이면 무시)"""
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def close(self) -> None:
+        """타이머 정지 후 남은 최신 프레임 전송"""
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
@@ -0,0 +1,256 @@
+"""
+거래소 통합 BBO / 김치 프리미엄 스트림
+
+- 로컬 오더북이 바뀔 때마다 (거래소, 심볼) 최우선 호가를 갱신하고 그 심볼만 다시 계산
+- KRW 거래소 가격은 USDT/KRW 환율로 환산해 전체 거래소 기준 최고 매수 / 최저 매도를 고름
+- korea_premium: KRW 거래소 mid / (달러 거래소 mid * 환율) - 1
+- cross_spread_bps: (최고 매수 - 최저 매도) / mid, 양수면 거래소 간 차익 구간
+- 환율은 KRW 거래소의 USDT 오더북이 있으면 그 mid, 없으면 urls.conf [CONSOLIDATION] usdt_krw
+- 가격/거래소가 바뀐 심볼만 throttle_ms 마다 ConsolidatedBBO 토픽으로 전송 (수량만 바뀐 경우는 보내지 않음)
+- 한 프로세스 안의 오더북만 통합 (supervisor 샤딩이면 worker 에 배정된 거래소 범위)
+- 연결이 끝난 거래소는 제외하고, max_age_ms 동안 갱신되지 않은 호가도 타이머가 제외
+"""
+
+import time
+import asyncio
+from collections import Counter
+from typing import Awaitable, Callable, ClassVar, NamedTuple
+
+from mq.data_interaction import KafkaMessageSender
+from mq.data_partitional import CoinHashingCustomPartitional
+from common.core.types import ConsolidatedQuote
+from common.utils.periodic import run_periodic
+from common.setting.properties import (
+    CONSOLIDATION_THROTTLE_MS,
+    CONSOLIDATION_USDT_KRW,
+    CONSOLIDATION_MAX_AGE_MS,
+)
+
+CONSOLIDATED_TOPIC = "ConsolidatedBBO"
+FX_SYMBOL = "USDT"
+
+KRW_MARKETS = frozenset({"UPBIT", "BITHUMB", "COINONE", "KORBIT"})
+# 달러 거래소는 USDT 마켓, kraken 만 USD 마켓 (USD 와 USDT 는 같은 달러 그룹으로 취급)
+USD_MARKETS = frozenset({"KRAKEN"})
+
+QuoteSender = Callable[[ConsolidatedQuote], Awaitable[None]]
+
+
+class VenueQuote(NamedTuple):
+    """거래소 하나의 최우선 호가"""
+
+    bid: float
+    bid_size: float
+    ask: float
+    ask_size: float
+
+
+def quote_currency(market: str) -> str:
+    """거래소 호가 통화"""
+    if market in KRW_MARKETS:
+        return "KRW"
+    return "USD" if market in USD_MARKETS else "USDT"
+
+
+class BBOConsolidator:
+    """심볼별 거래소 통합 최우선 호가
+
+    - update 는 동기 호출 (오더북을 적용한 worker 에서 바로 계산)
+    - 같은 프로세스의 모든 연결이 공유 (shared), 타이머는 마지막 연결이 닫힐 때 정지
+    """
+
+    _shared: ClassVar["BBOConsolidator | None"] = None
+
+    def __init__(
+        self,
+        send: QuoteSender,
+        throttle_ms: float = float(CONSOLIDATION_THROTTLE_MS),
+        usdt_krw: float = float(CONSOLIDATION_USDT_KRW),
+        max_age_ms: float = float(CONSOLIDATION_MAX_AGE_MS),
+    ) -> None:
+        self.send = send
+        self.throttle = throttle_ms / 1000
+        self.usdt_krw = usdt_krw
+        self.max_age = max_age_ms / 1000
+        # 심볼 -> 거래소 -> 최우선 호가
+        self.quotes: dict[str, dict[str, VenueQuote]] = {}
+        # (심볼, 거래소) -> 마지막 갱신 시각 (monotonic, 호가가 같아도 갱신)
+        self.updated: dict[tuple[str, str], float] = {}
+        self.state: dict[str, ConsolidatedQuote] = {}
+        self.published: dict[str, tuple] = {}
+        self.dirty: set[str] = set()
+        self.counters: Counter[str] = Counter()
+        self._users = 0
+        self._timer: asyncio.Task | None = None
+
+    @classmethod
+    def shared(cls) -> "BBOConsolidator":
+        """프로세스 공용 인스턴스 (심볼 키 해싱 파티셔너로 전송)"""
+        if cls._shared is None:
+            sender = KafkaMessageSender(partition_pol=CoinHashingCustomPartitional())
+
+            async def send(quote: ConsolidatedQuote) -> None:
+                await sender.produce_sending(
+                    message=quote,
+                    topic=CONSOLIDATED_TOPIC,
+                    key=f"ALL:bbo-{quote['symbol']}",
+                )
+
+            cls._shared = cls(send=send)
+        return cls._shared
+
+    def fx_rate(self) -> float:
+        """USDT/KRW 환율 (KRW 거래소 USDT 호가 mid 평균, 없으면 설정값)"""
+        mids = [
+            (quote.bid + quote.ask) / 2
+            for market, quote in self.quotes.get(FX_SYMBOL, {}).items()
+            if market in KRW_MARKETS
+        ]
+        return sum(mids) / len(mids) if mids else self.usdt_krw
+
+    def update(
+        self,
+        market: str,
+        symbol: str,
+        best_bid: tuple[float, float] | None,
+        best_ask: tuple[float, float] | None,
+    ) -> None:
+        """거래소 최우선 호가 갱신 후 해당 심볼 재계산"""
+        if best_bid is None or best_ask is None:
+            self.discard(market, symbol)
+            return
+
+        quote = VenueQuote(best_bid[0], best_bid[1], best_ask[0], best_ask[1])
+        self.updated[(symbol, market)] = time.monotonic()
+        venues = self.quotes.setdefault(symbol, {})
+        if venues.get(market) == quote:
+            self.counters["unchanged"] += 1
+            return
+        venues[market] = quote
+        self.counters["updates"] += 1
+        self._refresh(symbol, market)
+
+    def discard(self, market: str, symbol: str) -> None:
+        """동기화가 깨졌거나 비어 있거나 연결이 끝난 오더북은 통합 대상에서 제외"""
+        self.updated.pop((symbol, market), None)
+        if self.quotes.get(symbol, {}).pop(market, None) is not None:
+            self._refresh(symbol, market)
+
+    def expire(self, now: float | None = None) -> None:
+        """max_age 동안 갱신되지 않은 거래소 호가 제외"""
+        now = now if now is not None else time.monotonic()
+        stale = [key for key, updated in self.updated.items() if now - updated > self.max_age]
+        for symbol, market in stale:
+            self.counters["expired"] += 1
+            self.discard(market, symbol)
+
+    def _refresh(self, symbol: str, market: str) -> None:
+        # KRW 거래소의 USDT 호가가 바뀌면 환율이 바뀌므로 전체 심볼 재계산
+        symbols = list(self.quotes) if symbol == FX_SYMBOL and market in KRW_MARKETS else [symbol]
+        for name in symbols:
+            self.recompute(name)
+
+    def recompute(self, symbol: str) -> None:
+        """심볼 하나 통합 호가 계산, 가격/거래소가 바뀌었으면 전송 대상으로 표시"""
+        quote = self.consolidate(symbol)
+        if quote is None:
+            self.state.pop(symbol, None)
+            self.dirty.discard(symbol)
+            return
+        self.state[symbol] = quote
+        if self.signature(quote) != self.published.get(symbol):
+            self.dirty.add(symbol)
+
+    def consolidate(self, symbol: str) -> ConsolidatedQuote | None:
+        """거래소별 최우선 호가 -> 통합 호가 (거래소가 없으면 None)"""
+        venues = self.quotes.get(symbol)
+        if not venues:
+            return None
+        rate = self.fx_rate()
+
+        krw = {market: quote for market, quote in venues.items() if market in KRW_MARKETS}
+        usd = {market: quote for market, quote in venues.items() if market not in KRW_MARKETS}
+        krw_bid = max(krw, key=lambda market: krw[market].bid, default=None)
+        krw_ask = min(krw, key=lambda market: krw[market].ask, default=None)
+        usd_bid = max(usd, key=lambda market: usd[market].bid, default=None)
+        usd_ask = min(usd, key=lambda market: usd[market].ask, default=None)
+
+        def usdt(market: str, price: float) -> float:
+            return price / rate if market in KRW_MARKETS else price
+
+        bid_market = max(venues, key=lambda market: usdt(market, venues[market].bid))
+        ask_market = min(venues, key=lambda market: usdt(market, venues[market].ask))
+        bid_price = usdt(bid_market, venues[bid_market].bid)
+        ask_price = usdt(ask_market, venues[ask_market].ask)
+
+        premium = None
+        if krw_bid is not None and usd_bid is not None:
+            krw_mid = (krw[krw_bid].bid + krw[krw_ask].ask) / 2
+            usd_mid = (usd[usd_bid].bid + usd[usd_ask].ask) / 2
+            premium = krw_mid / (usd_mid * rate) - 1
+
+        return ConsolidatedQuote(
+            symbol=symbol,
+            timestamp=int(time.time() * 1000),
+            venues=len(venues),
+            usdt_krw=rate,
+            bid_market=bid_market,
+            bid_price=bid_price,
+            bid_size=venues[bid_market].bid_size,
+            ask_market=ask_market,
+            ask_price=ask_price,
+            ask_size=venues[ask_market].ask_size,
+            krw_bid_market=krw_bid,
+            krw_bid=krw[krw_bid].bid if krw_bid else None,
+            krw_ask_market=krw_ask,
+            krw_ask=krw[krw_ask].ask if krw_ask else None,
+            usd_bid_market=usd_bid,
+            usd_bid=usd[usd_bid].bid if usd_bid else None,
+            usd_ask_market=usd_ask,
+            usd_ask=usd[usd_ask].ask if usd_ask else None,
+            korea_premium=premium,
+            cross_spread_bps=(bid_price - ask_price) / ((bid_price + ask_price) / 2) * 10_000,
+        )
+
+    @staticmethod
+    def signature(quote: ConsolidatedQuote) -> tuple:
+        """전송 여부 판단용 (수량/시각 제외)"""
+        return (
+            quote["bid_market"], quote["bid_price"], quote["ask_market"], quote["ask_price"],
+            quote["krw_bid"], quote["krw_ask"], quote["usd_bid"], quote["usd_ask"],
+        )
+
+    async def flush(self) -> None:
+        """바뀐 심볼의 최신 통합 호가 전송"""
+        dirty, self.dirty = self.dirty, set()
+        for symbol in dirty:
+            quote = self.state.get(symbol)
+            if quote is None:
+                continue
+            self.published[symbol] = self.signature(quote)
+            self.counters["published"] += 1
+            await self.send(quote)
+
+    async def _run_timer(self) -> None:
+        async def tick() -> None:
+            self.expire()
+            await self.flush()
+
+        await run_periodic(self.throttle, tick, "BBOConsolidator")
+
+    def start(self) -> None:
+        """전송 타이머 시작 (연결마다 호출, 이미 실행 중이면 사용 수만 증가)"""
+        self._users += 1
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def close(self) -> None:
+        """마지막 연결이 닫히면 타이머 정지 후 남은 변경분 전송"""
+        self._users = max(self._users - 1, 0)
+        if self._users:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
@@ -0,0 +1,559 @@
+"""
+로컬 L2 오더북 엔진
+
+- (거래소, 심볼) 별로 호가 상태를 유지하고 스냅샷/델타를 적용
+- 가격 레벨은 정렬된 키 리스트 + dict 로 관리 (bisect 로 O(log n) 탐색)
+  storage = array 면 고정소수점 NumPy 배열(ArrayBookSide)에 저장
+- 상위 N / mid / spread / depth-at-bps / VWAP 조회는 배열 연산으로 처리
+- OKX(prevSeqId/seqId, CRC32), Kraken(CRC32) 은 적용 후 검증하고 어긋나면 재구독 대상으로 표시
+  - Kraken 체크섬 자릿수는 instrument 채널의 price_precision / qty_precision 사용 (받기 전에는 검증하지 않음)
+- 변경된 호가만 interval_ms 마다 상위 depth 레벨 스냅샷으로 전송
+"""
+
+import zlib
+import asyncio
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Awaitable, Callable, Iterable, NamedTuple
+
+import numpy as np
+
+from common.client.market_socket.orderbook_array import ArrayBookSide
+from common.exception import OrderBookSyncError
+from common.core.types import OrderBookSnapshot
+from common.utils.periodic import run_periodic
+from common.utils.other_util import base_symbol
+from common.setting.properties import (
+    ORDERBOOK_DEPTH,
+    ORDERBOOK_INTERVAL_MS,
+    ORDERBOOK_VALIDATE,
+    ORDERBOOK_STORAGE,
+)
+
+BOOK_TOPIC_SUFFIX = "book"
+
+# (원본 가격, 원본 수량) -- 체크섬은 거래소가 보낸 문자열 그대로 계산해야 하므로 보존
+Level = tuple[Any, Any]
+BookKey = tuple[str, str]
+# (가격 소수 자릿수, 수량 소수 자릿수)
+Precision = tuple[int, int]
+BookSender = Callable[[OrderBookSnapshot], Awaitable[None]]
+
+
+class BookUpdate(NamedTuple):
+    """거래소 프레임에서 꺼낸 호가 변경 한 건"""
+
+    snapshot: bool
+    bids: list[Level]
+    asks: list[Level]
+    sequence: int | None = None
+    prev_sequence: int | None = None
+    checksum: int | None = None
+    timestamp: int | None = None
+
+
+class BookSide:
+    """한쪽 호가 (asks 오름차순, bids 내림차순)
+
+    - keys: 정렬 키 (bids 는 가격에 -1 을 곱해 최우선 호가가 항상 앞)
+    - levels: 정렬 키 -> (원본 가격, 원본 수량)
+    """
+
+    __slots__ = ("sign", "keys", "levels")
+
+    def __init__(self, descending: bool) -> None:
+        self.sign = -1.0 if descending else 1.0
+        self.keys: list[float] = []
+        self.levels: dict[float, Level] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def update(self, price: Any, size: Any) -> None:
+        """레벨 갱신, 수량이 0 이면 삭제"""
+        key = float(price) * self.sign
+        if float(size) == 0:
+            if self.levels.pop(key, None) is not None:
+                del self.keys[bisect_left(self.keys, key)]
+            return
+        if key not in self.levels:
+            insort(self.keys, key)
+        self.levels[key] = (price, size)
+
+    def replace(self, levels: Iterable[Level]) -> None:
+        """스냅샷으로 전체 교체"""
+        self.levels = {float(price) * self.sign: (price, size) for price, size in levels if float(size) != 0}
+        self.keys = sorted(self.levels)
+
+    def truncate(self, depth: int) -> None:
+        """depth 밖의 레벨 삭제"""
+        for key in self.keys[depth:]:
+            del self.levels[key]
+        del self.keys[depth:]
+
+    def top(self, depth: int) -> list[Level]:
+        """최우선 호가부터 depth 개"""
+        return [self.levels[key] for key in self.keys[:depth]]
+
+    def arrays(self, depth: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """최우선 호가부터 depth 개의 (가격, 수량) float 배열"""
+        keys = self.keys if depth is None else self.keys[:depth]
+        values = np.array([self.levels[key] for key in keys], dtype=np.float64).reshape(-1, 2)
+        return values[:, 0], values[:, 1]
+
+
+STORAGES: dict[str, Callable[..., BookSide | ArrayBookSide]] = {
+    "dict": BookSide,
+    "array": ArrayBookSide,
+}
+
+
+class OrderBook:
+    """(거래소, 심볼) 하나의 L2 오더북"""
+
+    __slots__ = ("market", "symbol", "bids", "asks", "sequence", "timestamp", "synced", "limit", "precision")
+
+    def __init__(self, market: str, symbol: str, storage: str = "dict", precision: Precision | None = None) -> None:
+        side = STORAGES[storage]
+        self.market = market
+        self.symbol = symbol
+        self.bids = side(descending=True)
+        self.asks = side(descending=False)
+        self.sequence: int | None = None
+        self.timestamp: int | None = None
+        self.synced = False
+        # 거래소가 구독 depth 로 잘라서 관리하는 경우(kraken) 스냅샷 depth
+        self.limit: int | None = None
+        # kraken 체크섬용 (가격, 수량) 소수 자릿수 (instrument 채널)
+        self.precision = precision
+
+    def reset(self) -> None:
+        """다음 스냅샷까지 델타를 적용하지 않음"""
+        self.bids.replace(())
+        self.asks.replace(())
+        self.sequence = None
+        self.synced = False
+
+    def apply(self, update: BookUpdate, book_format: "BookFormat", validate: bool) -> bool:
+        """변경 적용
+
+        Returns:
+            bool: 호가가 바뀌었으면 True (스냅샷 대기 중이면 False)
+
+        Raises:
+            OrderBookSyncError: 시퀀스 누락 또는 체크섬 불일치
+        """
+        if update.snapshot:
+            self.bids.replace(update.bids)
+            self.asks.replace(update.asks)
+            if book_format.truncate:
+                self.limit = max(len(self.bids), len(self.asks))
+            self.synced = True
+        else:
+            if not self.synced:
+                return False
+            if None not in (update.prev_sequence, self.sequence) and update.prev_sequence != self.sequence:
+                expected = self.sequence
+                self.reset()
+                raise OrderBookSyncError(
+                    f"{self.market} {self.symbol} 시퀀스 누락 --> 기대 {expected} 수신 {update.prev_sequence}"
+                )
+            for price, size in update.bids:
+                self.bids.update(price, size)
+            for price, size in update.asks:
+                self.asks.update(price, size)
+            if self.limit is not None:
+                self.bids.truncate(self.limit)
+                self.asks.truncate(self.limit)
+
+        if update.sequence is not None:
+            self.sequence = update.sequence
+        if update.timestamp is not None:
+            self.timestamp = update.timestamp
+
+        if validate and book_format.checksum is not None and update.checksum is not None:
+            # 체크섬 계산에 필요한 정보(자릿수)가 아직 없으면 None -> 검증 건너뜀
+            checksum = book_format.checksum(self)
+            if checksum is not None and checksum != update.checksum:
+                self.reset()
+                raise OrderBookSyncError(
+                    f"{self.market} {self.symbol} 체크섬 불일치 --> 계산 {checksum} 수신 {update.checksum}"
+                )
+        return True
+
+    def best(self) -> tuple[tuple[float, float] | None, tuple[float, float] | None]:
+        """((최우선 매수 가격, 수량), (최우선 매도 가격, 수량)), 비어 있는 쪽은 None"""
+        bids, asks = self.bids.top(1), self.asks.top(1)
+        return (
+            (float(bids[0][0]), float(bids[0][1])) if bids else None,
+            (float(asks[0][0]), float(asks[0][1])) if asks else None,
+        )
+
+    def top_n(self, depth: int) -> tuple[tuple[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]:
+        """상위 depth 레벨 ((bid 가격, bid 수량), (ask 가격, ask 수량))"""
+        return self.bids.arrays(depth), self.asks.arrays(depth)
+
+    def mid(self) -> float | None:
+        """(최우선 매수 + 최우선 매도) / 2, 한쪽이라도 비어 있으면 None"""
+        (bid, _), (ask, _) = self.top_n(1)
+        if not len(bid) or not len(ask):
+            return None
+        return float(bid[0] + ask[0]) / 2
+
+    def spread(self) -> float | None:
+        """최우선 매도 - 최우선 매수"""
+        (bid, _), (ask, _) = self.top_n(1)
+        if not len(bid) or not len(ask):
+            return None
+        return float(ask[0] - bid[0])
+
+    def depth_at_bps(self, bps: float) -> tuple[float, float]:
+        """mid 에서 bps 이내에 있는 (매수 수량 합, 매도 수량 합)"""
+        mid = self.mid()
+        if mid is None:
+            return 0.0, 0.0
+        bid_prices, bid_sizes = self.bids.arrays()
+        ask_prices, ask_sizes = self.asks.arrays()
+        band = mid * bps / 10_000
+        return (
+            float(bid_sizes[bid_prices >= mid - band].sum()),
+            float(ask_sizes[ask_prices <= mid + band].sum()),
+        )
+
+    def vwap_to_size(self, side: str, size: float) -> float | None:
+        """size 만큼 시장가로 체결할 때의 평균 단가
+
+        Args:
+            side: buy (asks 소진) | sell (bids 소진)
+            size: 체결 수량
+
+        Returns:
+            float | None: 평균 단가, 호가 수량이 부족하면 None
+        """
+        prices, sizes = (self.asks if side == "buy" else self.bids).arrays()
+        if size <= 0:
+            return None
+        filled = np.cumsum(sizes)
+        last = int(np.searchsorted(filled, size))
+        if last >= len(filled):
+            return None
+        taken = sizes[: last + 1].copy()
+        taken[last] -= filled[last] - size
+        return float(np.dot(prices[: last + 1], taken) / size)
+
+    def snapshot(self, region: str, depth: int) -> OrderBookSnapshot:
+        """상위 depth 레벨 스냅샷"""
+        return OrderBookSnapshot(
+            region=region,
+            market=self.market,
+            symbol=self.symbol,
+            timestamp=self.timestamp,
+            sequence=self.sequence,
+            bids=[[float(price), float(size)] for price, size in self.bids.top(depth)],
+            asks=[[float(price), float(size)] for price, size in self.asks.top(depth)],
+        )
+
+
+# ------------------------------------------------------------------
+# ----------------------------거래소별 호가 포맷----------------------------
+# ------------------------------------------------------------------
+
+
+def parse_upbit(message: dict) -> list[BookUpdate]:
+    """업비트/빗썸: 매 프레임이 전체 호가 (orderbook_units 의 ask/bid 쌍)"""
+    units = message["orderbook_units"]
+    return [
+        BookUpdate(
+            snapshot=True,
+            bids=[(unit["bid_price"], unit["bid_size"]) for unit in units],
+            asks=[(unit["ask_price"], unit["ask_size"]) for unit in units],
+            timestamp=message.get("timestamp"),
+        )
+    ]
+
+
+def parse_price_qty(data: dict, timestamp: int | None) -> list[BookUpdate]:
+    """코인원/코빗: 매 프레임이 전체 호가 ({"price", "qty"})"""
+    return [
+        BookUpdate(
+            snapshot=True,
+            bids=[(level["price"], level["qty"]) for level in data["bids"]],
+            asks=[(level["price"], level["qty"]) for level in data["asks"]],
+            timestamp=timestamp,
+        )
+    ]
+
+
+def parse_coinone(message: dict) -> list[BookUpdate]:
+    """코인원 ORDERBOOK"""
+    data = message.get("data")
+    if message.get("channel") != "ORDERBOOK" or not isinstance(data, dict):
+        return []
+    return parse_price_qty(data, data.get("timestamp"))
+
+
+def parse_korbit(message: dict) -> list[BookUpdate]:
+    """코빗 orderbook"""
+    data = message.get("data")
+    if message.get("type") != "orderbook" or not isinstance(data, dict):
+        return []
+    return parse_price_qty(data, data.get("timestamp"))
+
+
+def parse_gateio(message: dict) -> list[BookUpdate]:
+    """Gate.io spot.order_book: 매 프레임이 상위 N 레벨 전체 (lastUpdateId 증가)"""
+    result = message.get("result")
+    if message.get("channel") != "spot.order_book" or not isinstance(result, dict) or "bids" not in result:
+        return []
+    return [
+        BookUpdate(
+            snapshot=True,
+            bids=[(price, size) for price, size in result["bids"]],
+            asks=[(price, size) for price, size in result["asks"]],
+            sequence=result.get("lastUpdateId"),
+            timestamp=result.get("t"),
+        )
+    ]
+
+
+def parse_okx(message: dict) -> list[BookUpdate]:
+    """OKX books: snapshot/update, [가격, 수량, 폐기필드, 주문수]"""
+    if "data" not in message:
+        return []
+    snapshot = message.get("action") == "snapshot"
+    return [
+        BookUpdate(
+            snapshot=snapshot,
+            bids=[(level[0], level[1]) for level in data["bids"]],
+            asks=[(level[0], level[1]) for level in data["asks"]],
+            sequence=data.get("seqId"),
+            prev_sequence=None if snapshot else data.get("prevSeqId"),
+            checksum=data.get("checksum"),
+            timestamp=int(data["ts"]) if "ts" in data else None,
+        )
+        for data in message["data"]
+    ]
+
+
+def parse_bybit(message: dict) -> list[BookUpdate]:
+    """Bybit orderbook: snapshot/delta, u=1 이면 서비스 재시작으로 인한 스냅샷"""
+    data = message.get("data")
+    if not data:
+        return []
+    return [
+        BookUpdate(
+            snapshot=message.get("type") == "snapshot" or data.get("u") == 1,
+            bids=[(price, size) for price, size in data["b"]],
+            asks=[(price, size) for price, size in data["a"]],
+            sequence=data.get("u"),
+            timestamp=message.get("ts"),
+        )
+    ]
+
+
+def parse_kraken(message: dict) -> list[BookUpdate]:
+    """Kraken v2 book: snapshot/update, {"price", "qty"}"""
+    if message.get("channel") != "book":
+        return []
+    snapshot = message.get("type") == "snapshot"
+    return [
+        BookUpdate(
+            snapshot=snapshot,
+            bids=[(level["price"], level["qty"]) for level in data["bids"]],
+            asks=[(level["price"], level["qty"]) for level in data["asks"]],
+            checksum=data.get("checksum"),
+        )
+        for data in message["data"]
+    ]
+
+
+def parse_binance(message: dict) -> list[BookUpdate]:
+    """Binance partial depth: 매 프레임이 상위 N 레벨 전체 (lastUpdateId 증가)"""
+    if "lastUpdateId" not in message:
+        return []
+    return [
+        BookUpdate(
+            snapshot=True,
+            bids=[(price, size) for price, size in message["bids"]],
+            asks=[(price, size) for price, size in message["asks"]],
+            sequence=message["lastUpdateId"],
+        )
+    ]
+
+
+def okx_checksum(book: OrderBook) -> int:
+    """OKX: 상위 25 레벨을 bid:ask 번갈아 이어 붙인 문자열의 signed CRC32"""
+    bids, asks = book.bids.top(25), book.asks.top(25)
+    parts: list[str] = []
+    for index in range(max(len(bids), len(asks))):
+        if index < len(bids):
+            parts.extend(bids[index])
+        if index < len(asks):
+            parts.extend(asks[index])
+    checksum = zlib.crc32(":".join(parts).encode("utf-8"))
+    return checksum - (1 << 32) if checksum >= 1 << 31 else checksum
+
+
+def kraken_number(value: Any, places: int) -> str:
+    """Kraken 체크섬 포맷: 자릿수를 맞춘 뒤 '.' 과 앞자리 0 제거"""
+    text = value if isinstance(value, str) else f"{value:.{places}f}"
+    return text.replace(".", "").lstrip("0")
+
+
+def kraken_checksum(book: OrderBook) -> int | None:
+    """Kraken: 상위 10 레벨 asks 다음 bids 를 가격+수량으로 이어 붙인 CRC32
+
+    - v2 는 가격/수량을 JSON 숫자로 보내므로 끝자리 0 이 사라짐
+      instrument 채널의 페어 정밀도로 다시 채움, 정밀도를 받기 전이면 None (검증하지 않음)
+    """
+    if book.precision is None:
+        return None
+    asks, bids = book.asks.top(10), book.bids.top(10)
+    price_places, qty_places = book.precision
+    text = "".join(
+        kraken_number(price, price_places) + kraken_number(qty, qty_places)
+        for price, qty in asks + bids
+    )
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def parse_kraken_instrument(message: dict) -> dict[str, Precision] | None:
+    """Kraken v2 instrument: 페어별 (price_precision, qty_precision), instrument 프레임이 아니면 None"""
+    if not isinstance(message, dict) or message.get("channel") != "instrument":
+        return None
+    data = message.get("data")
+    pairs = data.get("pairs", []) if isinstance(data, dict) else []
+    return {
+        base_symbol(pair["symbol"]): (int(pair["price_precision"]), int(pair["qty_precision"]))
+        for pair in pairs
+        if pair.get("symbol", "").upper().endswith("/USD")
+    }
+
+
+class BookFormat(NamedTuple):
+    """거래소별 파서 / 체크섬 / depth 유지 여부 / 원본 문자열 보존 필요 여부 / 증분(delta) 스트림 여부 / 페어 정밀도 파서"""
+
+    parse: Callable[[dict], list[BookUpdate]]
+    checksum: Callable[[OrderBook], int | None] | None = None
+    truncate: bool = False
+    raw_levels: bool = False
+    incremental: bool = False
+    instruments: Callable[[dict], dict[str, Precision] | None] | None = None
+
+
+BOOK_FORMATS: dict[str, BookFormat] = {
+    "UPBIT": BookFormat(parse_upbit),
+    "BITHUMB": BookFormat(parse_upbit),
+    "COINONE": BookFormat(parse_coinone),
+    "KORBIT": BookFormat(parse_korbit),
+    "GATEIO": BookFormat(parse_gateio),
+    "OKX": BookFormat(parse_okx, checksum=okx_checksum, raw_levels=True, incremental=True),
+    "BYBIT": BookFormat(parse_bybit, incremental=True),
+    "KRAKEN": BookFormat(
+        parse_kraken, checksum=kraken_checksum, truncate=True, incremental=True, instruments=parse_kraken_instrument
+    ),
+    "BINANCE": BookFormat(parse_binance),
+}
+
+
+class OrderBookEngine:
+    """(거래소, 심볼) 별 로컬 오더북 관리 및 상위 depth 스냅샷 전송
+
+    - apply 는 동기 호출 (정규화 worker 에서 바로 적용)
+    - 검증에 실패한 오더북은 stale 에 남아 reader 가 재연결(재구독)을 결정
+    """
+
+    def __init__(
+        self,
+        send: BookSender,
+        region: str,
+        depth: int = int(ORDERBOOK_DEPTH),
+        interval_ms: float = float(ORDERBOOK_INTERVAL_MS),
+        validate: bool = ORDERBOOK_VALIDATE.lower() == "true",
+        storage: str = ORDERBOOK_STORAGE,
+    ) -> None:
+        self.send = send
+        self.region = region
+        self.depth = depth
+        self.interval = interval_ms / 1000
+        self.validate = validate
+        self.storage = storage
+        self.books: dict[BookKey, OrderBook] = {}
+        self.dirty: set[BookKey] = set()
+        self.stale: set[BookKey] = set()
+        # instrument 채널에서 받은 (거래소, 심볼) 별 정밀도
+        self.precisions: dict[BookKey, Precision] = {}
+        self.counters: Counter[str] = Counter()
+        self._timer: asyncio.Task | None = None
+
+    @staticmethod
+    def supports(market: str) -> bool:
+        """로컬 오더북을 지원하는 거래소인지"""
+        return market.upper() in BOOK_FORMATS
+
+    def apply(self, market: str, symbol: str, message: dict) -> None:
+        """프레임 하나 적용
+
+        Raises:
+            OrderBookSyncError: 시퀀스 누락 또는 체크섬 불일치 (오더북은 다음 스냅샷까지 비워짐)
+        """
+        book_format = BOOK_FORMATS[market.upper()]
+        key = (market, symbol)
+        book = self.books.get(key)
+        if book is None:
+            # 원본 문자열로 체크섬을 계산하는 거래소는 배열 저장소를 쓰지 않음
+            storage = "dict" if book_format.raw_levels else self.storage
+            book = self.books[key] = OrderBook(market, symbol, storage, self.precisions.get(key))
+
+        for update in book_format.parse(message):
+            try:
+                changed = book.apply(update, book_format, self.validate)
+            except OrderBookSyncError:
+                self.counters["resync"] += 1
+                self.dirty.discard(key)
+                self.stale.add(key)
+                raise
+            if changed:
+                self.counters["snapshot" if update.snapshot else "delta"] += 1
+                self.dirty.add(key)
+            else:
+                self.counters["ignored"] += 1
+
+    def set_precisions(self, market: str, precisions: dict[str, Precision]) -> None:
+        """instrument 채널의 페어 정밀도 반영 (이미 있는 오더북도 갱신)"""
+        for symbol, precision in precisions.items():
+            key = (market, symbol)
+            self.precisions[key] = precision
+            if (book := self.books.get(key)) is not None:
+                book.precision = precision
+
+    def take_stale(self) -> set[BookKey]:
+        """재구독이 필요한 오더북 (가져가면 비워짐)"""
+        stale, self.stale = self.stale, set()
+        return stale
+
+    async def flush(self) -> None:
+        """변경된 오더북의 상위 depth 스냅샷 전송"""
+        dirty, self.dirty = self.dirty, set()
+        for key in dirty:
+            book = self.books[key]
+            if not book.synced:
+                continue
+            self.counters["emitted"] += 1
+            await self.send(book.snapshot(self.region, self.depth))
+
+    async def _run_timer(self) -> None:
+        await run_periodic(self.interval, self.flush, "OrderBookEngine")
+
+    def start(self) -> None:
+        """전송 타이머 시작 (이미 실행 중이면 무시)"""
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def close(self) -> None:
+        """타이머 정지 후 남은 변경분 전송"""
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
@@ -0,0 +1,116 @@
+"""
+배열 기반 호가 저장소
+
+- 가격/수량을 고정소수점 int64 로 변환해 한쪽 호가당 미리 할당한 NumPy 배열 두 개에 저장
+- 레벨마다 파이썬 객체(문자열, 튜플, dict 엔트리)를 만들지 않아 심볼 수백 개에서도 메모리가 작음
+- BookSide 와 같은 인터페이스라 OrderBook 의 저장소로 그대로 교체 가능
+- 원본 문자열을 보존하지 않으므로 원본 문자열로 체크섬을 계산하는 거래소(OKX)에는 쓰지 않음
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from common.setting.properties import (
+    ORDERBOOK_CAPACITY,
+    ORDERBOOK_PRICE_DECIMALS,
+    ORDERBOOK_SIZE_DECIMALS,
+)
+
+Level = tuple[float, float]
+
+
+class ArrayBookSide:
+    """한쪽 호가 (asks 오름차순, bids 내림차순)
+
+    - keys: 정렬 키 (고정소수점 가격 * sign, bids 는 음수라 최우선 호가가 항상 앞)
+    - sizes: 고정소수점 수량
+    - count 개까지만 유효하고 capacity 를 넘으면 두 배로 늘림
+    """
+
+    __slots__ = ("sign", "price_scale", "size_scale", "keys", "sizes", "count")
+
+    def __init__(
+        self,
+        descending: bool,
+        capacity: int = int(ORDERBOOK_CAPACITY),
+        price_decimals: int = int(ORDERBOOK_PRICE_DECIMALS),
+        size_decimals: int = int(ORDERBOOK_SIZE_DECIMALS),
+    ) -> None:
+        self.sign = -1 if descending else 1
+        self.price_scale = 10**price_decimals
+        self.size_scale = 10**size_decimals
+        self.keys = np.empty(capacity, dtype=np.int64)
+        self.sizes = np.empty(capacity, dtype=np.int64)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, count: int) -> None:
+        """count 개를 담을 수 있게 배열 확장"""
+        capacity = len(self.keys)
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity = max(capacity * 2, 1)
+        keys = np.empty(capacity, dtype=np.int64)
+        sizes = np.empty(capacity, dtype=np.int64)
+        keys[: self.count] = self.keys[: self.count]
+        sizes[: self.count] = self.sizes[: self.count]
+        self.keys, self.sizes = keys, sizes
+
+    def update(self, price: float | str, size: float | str) -> None:
+        """레벨 갱신, 수량이 0 이면 삭제 (이진 탐색 후 뒤쪽 레벨을 한 칸씩 이동)"""
+        key = self.sign * round(float(price) * self.price_scale)
+        fixed_size = round(float(size) * self.size_scale)
+        count = self.count
+        index = int(np.searchsorted(self.keys[:count], key))
+
+        if index < count and self.keys[index] == key:
+            if fixed_size:
+                self.sizes[index] = fixed_size
+            else:
+                self.keys[index : count - 1] = self.keys[index + 1 : count]
+                self.sizes[index : count - 1] = self.sizes[index + 1 : count]
+                self.count -= 1
+            return
+        if not fixed_size:
+            return
+
+        self._reserve(count + 1)
+        self.keys[index + 1 : count + 1] = self.keys[index:count]
+        self.sizes[index + 1 : count + 1] = self.sizes[index:count]
+        self.keys[index] = key
+        self.sizes[index] = fixed_size
+        self.count += 1
+
+    def replace(self, levels: Iterable[tuple[float | str, float | str]]) -> None:
+        """스냅샷으로 전체 교체"""
+        values = np.array(list(levels), dtype=np.float64).reshape(-1, 2)
+        keys = self.sign * np.rint(values[:, 0] * self.price_scale).astype(np.int64)
+        sizes = np.rint(values[:, 1] * self.size_scale).astype(np.int64)
+        valid = sizes != 0
+        keys, sizes = keys[valid], sizes[valid]
+        order = np.argsort(keys, kind="stable")
+
+        self.count = 0
+        self._reserve(len(order))
+        self.keys[: len(order)] = keys[order]
+        self.sizes[: len(order)] = sizes[order]
+        self.count = len(order)
+
+    def truncate(self, depth: int) -> None:
+        """depth 밖의 레벨 삭제"""
+        self.count = min(self.count, depth)
+
+    def arrays(self, depth: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """최우선 호가부터 depth 개의 (가격, 수량) float 배열"""
+        count = self.count if depth is None else min(self.count, depth)
+        prices = self.keys[:count] / (self.sign * self.price_scale)
+        return prices, self.sizes[:count] / self.size_scale
+
+    def top(self, depth: int) -> list[Level]:
+        """최우선 호가부터 depth 개"""
+        prices, sizes = self.arrays(depth)
+        return list(zip(prices.tolist(), sizes.tolist()))
@@ -2,32 +2,57 @@ import json
 import logging
 import traceback
 from typing import TypedDict, Required
-from collections import defaultdict
-from asyncio.exceptions import CancelledError
 
 import websockets
 import asyncio
-from config.yml_param_load import ticker_json
+from config.yml_param_load import ticker_projections, TickerProjection
 from mq.data_interaction import KafkaMessageSender
-from common.exception import SocketRetryOnFailure
+from mq.data_batch import BatchAccumulator, RecordBatch
+from mq.data_format import encode_batch
+from mq.data_error import ERROR_TOPIC, ErrorAggregator
+from common.client.market_socket.orderbook import BOOK_FORMATS, BOOK_TOPIC_SUFFIX, OrderBookEngine
+from common.client.market_socket.consolidation import BBOConsolidator
+from common.client.market_socket.candle import CANDLE_TOPIC_SUFFIX, CandleAggregator
+from common.client.market_socket.conflation import Conflator, conflation_enabled
+from common.exception import SocketRetryOnFailure, OrderBookSyncError
 from common.utils.logger import AsyncLogger
-from common.utils.other_util import market_name_extract, get_topic_name
+from common.utils.json_codec import codec
+from common.setting.properties import (
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_WORKERS,
+    PIPELINE_OVERFLOW_POLICY,
+    ORDERBOOK_ENABLED,
+    CONSOLIDATION_ENABLED,
+    CANDLE_ENABLED,
+)
+from common.utils.other_util import (
+    market_name_extract,
+    get_topic_name,
+    symbol_list,
+    symbol_demultiplex,
+)
+from common.setting.socket_parameter import subscribe_messages, orderbook_resubscribe_messages
 from common.core.abstract import WebsocketConnectionAbstract
 from common.core.types import (
     SubScribeFormat,
     ExchangeResponseData,
     ResponseData,
-    SocketLowData,
     ProducerMetadataDict,
+    ErrorSummary,
+    OrderBookSnapshot,
+    CandleBar,
 )
 
 socket_protocol = websockets.WebSocketClientProtocol
 
+# 체크섬이 계속 어긋나는 경우에도 거래소에 재연결을 몰아치지 않도록 두는 간격
+ORDERBOOK_RESUBSCRIBE_DELAY_S = 1.0
+
 
 class MessageQueueData(TypedDict):
     market: Required[str]
     symbol: Required[str]
-    message: Required[dict]
+    message: Required[ResponseData]
 
 
 class KafkaMessageData(TypedDict):
@@ -40,10 +65,16 @@ class KafkaMessageData(TypedDict):
 
 # fmt: off
 class MessageQueueManager:
-    """메시지 큐를 관리하는 클래스"""
+    """메시지 큐를 관리하는 클래스
+
+    - 소켓 reader 와 정규화/전송 worker 사이의 bounded 큐
+    - 큐가 가득 찼을 때 overflow_policy 에 따라 대기(block) 또는 버림(drop_oldest / drop_newest)
+    """
     
-    def __init__(self) -> None:
-        self.message_async_q = asyncio.Queue()
+    def __init__(self, maxsize: int = int(PIPELINE_QUEUE_SIZE), overflow_policy: str = PIPELINE_OVERFLOW_POLICY) -> None:
+        self.message_async_q: asyncio.Queue[MessageQueueData] = asyncio.Queue(maxsize=maxsize)
+        self.overflow_policy = overflow_policy
+        self.dropped = 0
 
     def process_exchange(self, message: str | dict) -> dict | None:
         """거래소 메시지를 처리하는 메서드
@@ -63,7 +94,7 @@ class MessageQueueManager:
         
         try:
             # 문자열이면 JSON으로 파싱
-            parsed_message = json.loads(message) if isinstance(message, str) else message
+            parsed_message = codec.loads(message) if isinstance(message, bytes | str) else message
             
             # 무시할 패턴에 대한 검사
             for pattern in SKIP_PATTERNS:
@@ -74,71 +105,86 @@ class MessageQueueManager:
             # 패턴에 맞지 않는 메시지는 그대로 반환
             return parsed_message
             
-        except json.JSONDecodeError:
+        except codec.decode_error:
             # JSON 파싱 오류 발생 시 None 반환
             return None
 
 
-    def process_filtered_data(self, filtered_message: ResponseData, ticker_columns: list[str]) -> ResponseData:
+    def process_filtered_data(self, filtered_message: ResponseData, projection: TickerProjection) -> ResponseData:
         """메시지 데이터를 필터링하여 처리하는 메서드
         
         Args:
             filtered_message: 필터링할 응답 데이터
-            ticker_columns: 필터링에 사용할 컬럼 목록
+            projection: 시작 시 컴파일된 거래소별 티커 projection
             
         Returns:
             ResponseData: 필터링된 메시지 데이터
         """
-        # 특수 키 목록 정의
-        special_keys = {"data", "result", "time_ms", "ts", "timestamp"}
-        
-        # 기본 메시지 데이터 생성 - 필터링된 일반 필드
-        message_data = {k: v for k, v in filtered_message.items() 
-                        if k not in special_keys and k in ticker_columns}
-        
-        # 특수 키 처리
-        for key in special_keys & filtered_message.keys():  # 교집합으로 존재하는 키만 처리
-            value = filtered_message[key]
-            
-            # 숫자 타입은 그대로 추가
-            if isinstance(value, (int, float)):
-                message_data[key] = value
-            # 딕셔너리나 리스트는 필터링하여 추가
-            elif isinstance(value, (dict, list)):
-                target_dict = value[0] if isinstance(value, list) else value
-                # 딕셔너리 컴프리헨션으로 필터링
-                message_data.update({col: target_dict[col] for col in set(target_dict) & set(ticker_columns)})
-                
-        return message_data
-
-    async def put_message(self, uri: str, symbol: str, message: ResponseData, socket_type: str = None) -> None:
-        """메시지를 큐에 추가
+        return projection.extract(filtered_message)
+
+    def normalize(self, queue_data: MessageQueueData, socket_type: str) -> ResponseData:
+        """큐에서 꺼낸 원본 프레임 정규화 (worker 에서 실행)
         
         Args:
-            uri: 웹소켓 URI
-            symbol: 심볼
-            message: 응답 데이터
+            queue_data: reader 가 넣은 원본 프레임
             socket_type: 소켓 타입
+            
+        Returns:
+            ResponseData: 정규화된 메시지
         """
-        market: str = market_name_extract(uri=uri)
-        
+        filtered_message = self.process_exchange(queue_data["message"])
         if socket_type == "ticker":
-            filtered_message = self.process_exchange(message)
-            ticker_columns: list[str] = ticker_json(location=market)
-            message_data = self.process_filtered_data(filtered_message, ticker_columns)
-        else:
-            message_data = filtered_message = self.process_exchange(message)
-            
+            projection: TickerProjection = ticker_projections.get(location=queue_data["market"])
+            return self.process_filtered_data(filtered_message, projection)
+        return filtered_message
 
+    async def put_message(self, market: str, symbol: str, message: ResponseData) -> bool:
+        """원본 프레임을 큐에 추가 (reader 에서 실행, 정규화는 하지 않음)
+        
+        Args:
+            market: 마켓 이름
+            symbol: 심볼
+            message: 파싱된 프레임
+            
+        Returns:
+            bool: 큐에 들어갔는지 여부 (drop_newest 로 버려지면 False)
+        """
+        queue_data = MessageQueueData(market=market, symbol=symbol, message=message)
+
+        match self.overflow_policy:
+            case "drop_newest":
+                try:
+                    self.message_async_q.put_nowait(queue_data)
+                except asyncio.QueueFull:
+                    self.dropped += 1
+                    return False
+            case "drop_oldest":
+                while True:
+                    try:
+                        self.message_async_q.put_nowait(queue_data)
+                        break
+                    except asyncio.QueueFull:
+                        self.message_async_q.get_nowait()
+                        self.message_async_q.task_done()
+                        self.dropped += 1
+            case _:
+                await self.message_async_q.put(queue_data)
+        return True
 
-        await self.message_async_q.put(
-            MessageQueueData(
-                market=market, 
-                symbol=symbol, 
-                message=json.dumps(message_data)
-            )
-        )
+    def clear(self) -> int:
+        """처리되지 않은 프레임 비우기 (연결이 끊기면 이전 연결의 프레임을 재연결 후 처리하지 않도록)
 
+        Returns:
+            int: 버린 프레임 수
+        """
+        cleared = 0
+        while True:
+            try:
+                self.message_async_q.get_nowait()
+            except asyncio.QueueEmpty:
+                return cleared
+            self.message_async_q.task_done()
+            cleared += 1
 
     async def get_message(self) -> MessageQueueData:
         """큐에서 메시지를 가져옴
@@ -148,164 +194,337 @@ class MessageQueueManager:
         """
         return await self.message_async_q.get()
 
+    def task_done(self) -> None:
+        """worker 처리 완료 알림"""
+        self.message_async_q.task_done()
+
 
 class KafkaService:
     """Kafka 메시지 전송을 처리하는 서비스 클래스"""
 
     def __init__(self, location: str) -> None:
         self.location = location
+        self.sender = KafkaMessageSender()
+        self.errors = ErrorAggregator(send=self.send_error_summary, region=location)
 
     async def send_message(self, kafka_message: KafkaMessageData) -> None:
         """Kafka로 메시지 전송"""
-        await KafkaMessageSender().produce_sending(
-            message=SocketLowData(
+        await self.sender.produce_sending(
+            message=encode_batch(
+                topic=kafka_message["topic"],
                 region=self.location,
                 market=kafka_message["market"],
                 symbol=kafka_message["symbol"],
-                data=kafka_message["data"],
+                records=kafka_message["data"],
             ),
             topic=kafka_message["topic"],
             key=kafka_message["key"],
         )
 
-    async def send_error(self, error: Exception, market: str, symbol: str) -> None:
-        """에러 메시지를 Kafka로 전송
+    def send_error(self, error: Exception, market: str, symbol: str) -> None:
+        """에러 기록 (window 마다 (마켓, 심볼, 예외 타입) 별 한 건으로 ErrorTopic 전송)
         
         Args:
             error: 발생한 예외
             market: 마켓 이름
             symbol: 심볼
         """
-        await self.send_message(
-            market=market,
-            symbol=symbol,
-            data=[{"error": str(error)}],
-            topic="ErrorTopic",
-            key=f"{market}:error-{symbol}",
+        self.errors.record(error, market, symbol)
+
+    async def send_error_summary(self, summary: ErrorSummary) -> None:
+        """집계된 에러를 Kafka로 전송"""
+        await self.sender.produce_sending(
+            message=summary,
+            topic=ERROR_TOPIC,
+            key=f"{summary['market']}:error-{summary['symbol']}",
+        )
+
+    async def send_book(self, snapshot: OrderBookSnapshot) -> None:
+        """로컬 오더북 상위 depth 스냅샷을 Kafka로 전송 (원본 오더북과 같은 키로 파티셔닝)"""
+        await self.sender.produce_sending(
+            message=snapshot,
+            topic=f"{get_topic_name(location=self.location)}-{BOOK_TOPIC_SUFFIX}",
+            key=f"{snapshot['market']}:orderbook-{snapshot['symbol']}",
+        )
+
+    async def send_candle(self, bar: CandleBar) -> None:
+        """마감된 OHLCV 봉을 interval 별 토픽으로 전송 (원본 티커와 같은 키로 파티셔닝)"""
+        await self.sender.produce_sending(
+            message=bar,
+            topic=f"{get_topic_name(location=self.location)}-{CANDLE_TOPIC_SUFFIX}-{bar['interval']}",
+            key=f"{bar['market']}:ticker-{bar['symbol']}",
         )
 
 
 class MessageProcessor:
-    """웹소켓 메시지 처리 클래스"""
+    """웹소켓 메시지 처리 클래스
+
+    - 스냅샷과 업데이트를 따로 (토픽, 카프카 키) 단위로 배치
+    - 배치 전송 조건(레코드 수 / 바이트 / linger)은 BatchAccumulator 가 판단
+    - 오더북 프레임은 로컬 오더북(OrderBookEngine)에도 적용해 상위 depth 스냅샷을 따로 전송
+    - 로컬 오더북의 최우선 호가는 프로세스 공용 BBOConsolidator 로 넘겨 거래소 통합 BBO 계산
+    - 정규화된 티커는 CandleAggregator 로 OHLCV 봉을 만들어 마감된 봉만 따로 전송
+    - conflate 모드 토픽은 Conflator 가 (토픽, 키) 별 최신 프레임만 남겨 배치로 넘김
+    """
 
     def __init__(self, logger: AsyncLogger, kafka_service: KafkaService) -> None:
         self._logger = logger
         self.kafka_service = kafka_service
-        self.message_data = defaultdict(list)
-        self.snapshot = defaultdict(list)
-        self.last_send_time = defaultdict(float)
-        self.BATCH_SIZE = 100  # 배치 크기
-        self.TIME_THRESHOLD = 60.0  # 시간 임계값 (초)
-
-    async def should_send_batch(self, market: str, data_size: int) -> bool:
-        """배치를 전송해야 하는지 확인
+        self.message_data = BatchAccumulator(send=self.send_batch)
+        self.snapshot = BatchAccumulator(send=self.send_batch)
+        self.order_books: OrderBookEngine | None = (
+            OrderBookEngine(send=kafka_service.send_book, region=kafka_service.location)
+            if ORDERBOOK_ENABLED.lower() == "true"
+            else None
+        )
+        self.consolidator: BBOConsolidator | None = (
+            BBOConsolidator.shared()
+            if self.order_books is not None and CONSOLIDATION_ENABLED.lower() == "true"
+            else None
+        )
+        self.candles: CandleAggregator | None = (
+            CandleAggregator(send=kafka_service.send_candle, region=kafka_service.location)
+            if CANDLE_ENABLED.lower() == "true"
+            else None
+        )
+        self.conflator: Conflator | None = Conflator(send=self.append) if conflation_enabled() else None
+
+    def start(self) -> None:
+        """linger 타이머 시작"""
+        self.message_data.start()
+        self.snapshot.start()
+        if self.order_books is not None:
+            self.order_books.start()
+        if self.consolidator is not None:
+            self.consolidator.start()
+        if self.candles is not None:
+            self.candles.start()
+        if self.conflator is not None:
+            self.conflator.start()
+
+    async def close(self) -> None:
+        """타이머 정지 및 남은 배치 전부 전송"""
+        # conflate 로 보관 중인 최신 프레임을 배치에 먼저 넘김
+        if self.conflator is not None:
+            await self.conflator.close()
+        await self.snapshot.close()
+        await self.message_data.close()
+        if self.order_books is not None:
+            await self.order_books.close()
+        if self.consolidator is not None:
+            # 연결이 끝난 거래소의 마지막 호가가 통합 BBO 에 남지 않도록 제외
+            if self.order_books is not None:
+                for market, symbol in self.order_books.books:
+                    self.consolidator.discard(market, symbol)
+            await self.consolidator.close()
+        if self.candles is not None:
+            await self.candles.close()
+
+    async def send_batch(self, batch: RecordBatch) -> None:
+        """배치를 Kafka로 전송
         
         Args:
-            market: 마켓 이름
-            data_size: 현재 데이터 크기
-            
-        Returns:
-            bool: 전송 여부
+            batch: 전송할 배치
         """
-        current_time = asyncio.get_event_loop().time()
-        time_elapsed = current_time - self.last_send_time[market]
-        
-        return (data_size >= self.BATCH_SIZE) or (time_elapsed >= self.TIME_THRESHOLD)
+        try:
+            await self.kafka_service.send_message(
+                kafka_message=KafkaMessageData(
+                    market=batch.market,
+                    symbol=batch.symbol,
+                    data=batch.records,
+                    topic=batch.topic,
+                    key=batch.key,
+                )
+            )
+        except Exception as error:
+            await self._logger.log_message(
+                logging.ERROR,
+                f"배치 전송 실패 --> {error} key --> {batch.key} records --> {len(batch.records)}",
+            )
 
-    async def update_and_send(self, default_data: defaultdict, msg: dict, kafka_metadata: ProducerMetadataDict) -> None:
-        """메시지 업데이트 및 전송
+    async def append(self, message: ResponseData, kafka_metadata: ProducerMetadataDict) -> None:
+        """메시지를 (토픽, 카프카 키) 단위 배치에 추가
         
         Args:
-            default_data: 기본 데이터 저장소
-            msg: 메시지
+            message: 전송할 메시지
             kafka_metadata: Kafka 메타데이터
         """
-        kafka_metadata["default_data"] = default_data
-        kafka_metadata["message"] = msg
-        kafka_metadata["counting"] = 100
-
-        await self.producer_sending(**kafka_metadata)
-
-    async def producer_sending(self, **metadata: ProducerMetadataDict) -> None:
-        """메시지를 Kafka로 전송"""
-        default_data: defaultdict = metadata["default_data"]
-        market: str = metadata["market"]
-        symbol: str = metadata["symbol"]
-        message: ResponseData = metadata["message"]
-        topic: str = metadata["topic"]
-        key: str = metadata["key"]
-
-        default_data[market].append(message)
-        current_size = len(default_data[market])
-
-        # 배치 전송 조건 확인 (배치 크기 또는 시간 임계값)
-        if await self.should_send_batch(market, current_size):
-            if current_size > 0: 
-                await self.kafka_service.send_message(
-                    kafka_message=KafkaMessageData(
-                        market=market,
-                        symbol=symbol,
-                        data=default_data[market],
-                        topic=topic,
-                        key=key,
-                    )
-                )
-                default_data[market].clear()
-                self.last_send_time[market] = asyncio.get_event_loop().time()
+        match message:
+            case {"type": "snapshot"}:
+                batches = self.snapshot
+            case _:
+                batches = self.message_data
+
+        # 다중 심볼 구독에서도 심볼이 섞이지 않도록 카프카 키(마켓+심볼) 단위로 배치
+        await batches.append(
+            topic=kafka_metadata["topic"],
+            key=kafka_metadata["key"],
+            market=kafka_metadata["market"],
+            symbol=kafka_metadata["symbol"],
+            record=message,
+        )
 
-    async def append_and_process(self, message: str, kafka_metadata: ProducerMetadataDict) -> None:
+    async def append_and_process(self, message: ResponseData, kafka_metadata: ProducerMetadataDict) -> None:
         """메시지 처리 및 추가
         
+        - 봉 / 로컬 오더북을 먼저 갱신해 conflate 기준 가격을 구하고, 갱신이 실패해도 원본 프레임은 전송
+        
         Args:
             message: 처리할 메시지
             kafka_metadata: Kafka 메타데이터
         """
-
-        match message:
-            case {"type": "snapshot"}:
-                await self.update_and_send(self.snapshot, message, kafka_metadata)
-            case {"type": "update"}:
-                await self.update_and_send(self.message_data, message, kafka_metadata)
-            case _:
-                await self.update_and_send(self.message_data, message, kafka_metadata)
+        price: float | None = None
+        try:
+            price = await self.process(message, kafka_metadata)
+        finally:
+            if self.conflator is not None and self.conflator.handles(kafka_metadata["market"], kafka_metadata["topic"]):
+                await self.conflator.offer(message, kafka_metadata, price)
+            else:
+                await self.append(message, kafka_metadata)
+
+    async def process(self, message: ResponseData, kafka_metadata: ProducerMetadataDict) -> float | None:
+        """봉 / 로컬 오더북 / 통합 BBO 갱신
+        
+        Args:
+            message: 처리할 메시지
+            kafka_metadata: Kafka 메타데이터
+            
+        Returns:
+            float | None: conflate 기준 가격 (티커 가격 또는 오더북 mid)
+        """
+        market: str = kafka_metadata["market"]
+        symbol: str = kafka_metadata["symbol"]
+        if kafka_metadata["topic"].endswith("-ticker"):
+            fields = ticker_projections.get(location=market).candle
+            if fields is None:
+                return None
+            if self.candles is not None:
+                self.candles.update(market, symbol, message, fields)
+            return float(message[fields.price]) if self.conflator is not None else None
+
+        if (
+            self.order_books is not None
+            and kafka_metadata["topic"].endswith("-orderbook")
+            and self.order_books.supports(market)
+        ):
+            try:
+                self.order_books.apply(market, symbol, message)
+            except OrderBookSyncError as error:
+                await self._logger.log_message(logging.WARNING, f"{error} --> 재구독 대기")
+                self.kafka_service.send_error(error, market, symbol)
+                if self.consolidator is not None:
+                    self.consolidator.discard(market, symbol)
+                return None
+            book = self.order_books.books[(market, symbol)]
+            if not book.synced:
+                return None
+            if self.consolidator is not None:
+                self.consolidator.update(market, symbol, *book.best())
+            return book.mid()
+        return None
 
 
 class WebsocketConnectionManager(WebsocketConnectionAbstract):
     """웹소켓 연결 관리 클래스"""
 
-    def __init__(self, location: str, folder: str, rest_client: SocketRetryOnFailure) -> None:
+    def __init__(self, location: str, folder: str, rest_client: SocketRetryOnFailure, workers: int = int(PIPELINE_WORKERS)) -> None:
         self._logger = AsyncLogger(target=location, folder=folder)
         self.rest_client = rest_client
+        self.workers = workers
         self.message_queue = MessageQueueManager()
         self.kafka_service = KafkaService(location=location)
         self.message_processor = MessageProcessor(logger=self._logger, kafka_service=self.kafka_service)
 
-    async def handle_message(self, websocket: socket_protocol, uri: str, symbol: str = None, socket_type: str = None) -> None:
-        """웹소켓 메시지 처리
+    async def handle_message(self, websocket: socket_protocol, uri: str, symbol: str | list[str] = None, socket_type: str = None) -> None:
+        """웹소켓 메시지 처리 (reader)
+
+        - reader 는 프레임 수신/파싱 후 큐에 넣기만 함
+        - 다중 심볼 구독이면 프레임에서 심볼을 추출해 심볼별 키로 분배
+        - 정규화와 카프카 전송은 worker 들이 처리하므로 recv()/ping 이 지연되지 않음
+        - worker 가 여러 개면 같은 소켓 안에서 프레임 순서가 보장되지 않음 (기본 1개)
         
         Args:
             websocket: 웹소켓 프로토콜
             uri: 웹소켓 URI
-            symbol: 심볼
+            symbol: 심볼 또는 심볼 목록
             socket_type: 소켓 타입
         """
         market: str = market_name_extract(uri=uri)
+        symbols: list[str] = symbol_list(symbol)
+        default_symbol: str = symbols[0] if len(symbols) == 1 else "ALL"
+        # 오더북 체크섬에 필요한 페어 정밀도 프레임(kraken instrument)은 큐에 넣지 않고 reader 에서 바로 반영
+        book_format = BOOK_FORMATS.get(market.upper())
+        instruments = book_format.instruments if book_format is not None else None
 
         initial_message: str = await self.receive_message(websocket)
         if initial_message:
             await self._logger.log_message(logging.INFO, f"{market} 연결 완료")
 
+        self.message_processor.start()
+        self.kafka_service.errors.start()
+        workers = [
+            asyncio.create_task(self.producing_worker(socket_type))
+            for _ in range(self.workers)
+        ]
+        try:
+            while True:
+                message = await self.receive_message(websocket)
+                if message is None:
+                    continue
+                if instruments is not None and (precisions := instruments(message)) is not None:
+                    if self.message_processor.order_books is not None:
+                        self.message_processor.order_books.set_precisions(market, precisions)
+                    continue
+                frame_symbol, message = symbol_demultiplex(market, message)
+                queued = await self.message_queue.put_message(market=market, symbol=frame_symbol or default_symbol, message=message)
+                if not queued and self.message_queue.dropped % 1000 == 1:
+                    await self._logger.log_message(logging.WARNING, f"{market} 큐 포화로 버린 메시지 --> {self.message_queue.dropped}")
+                # 시퀀스/체크섬이 어긋난 오더북은 해당 심볼만 다시 구독해 스냅샷부터 다시 받음
+                order_books = self.message_processor.order_books
+                if order_books is not None and (stale := order_books.take_stale()):
+                    await self.resubscribe(websocket, market, sorted(symbol for _, symbol in stale), symbols)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # 끊긴 연결의 프레임은 재연결 후 스냅샷보다 늦게 적용되면 안 되므로 버림
+            if cleared := self.message_queue.clear():
+                await self._logger.log_message(logging.WARNING, f"{market} 연결 종료로 버린 미처리 메시지 --> {cleared}")
+            # 연결 종료/취소 시에도 쌓여 있던 배치와 에러 집계는 전송
+            await self.message_processor.close()
+            await self.kafka_service.errors.close()
+
+    async def resubscribe(self, websocket: socket_protocol, market: str, stale: list[str], symbols: list[str]) -> None:
+        """어긋난 오더북 심볼만 구독 해제 후 재구독 (같은 연결의 다른 심볼은 계속 수신)
+
+        Raises:
+            OrderBookSyncError: 심볼 단위 재구독을 지원하지 않는 거래소이거나 구독하지 않은 심볼 (연결 전체 재구독)
+        """
+        messages = orderbook_resubscribe_messages(market, stale)
+        if messages is None or not set(stale) <= set(symbols):
+            raise OrderBookSyncError(f"{market} 오더북 재구독 --> {stale}")
+        await self._logger.log_message(logging.WARNING, f"{market} 오더북 심볼 재구독 --> {stale}")
+        for message in messages:
+            await websocket.send(json.dumps(message))
+
+    async def producing_worker(self, socket_type: str) -> None:
+        """큐에서 프레임을 꺼내 정규화 및 전송하는 worker
+        
+        Args:
+            socket_type: 소켓 타입
+        """
         while True:
+            queue_data: MessageQueueData = await self.message_queue.get_message()
             try:
-                message = await self.receive_message(websocket)
-                await self.message_queue.put_message(uri=uri, symbol=symbol, message=message, socket_type=socket_type)
-                await self.producing_start(socket_type)
-            except (TypeError, ValueError, Exception) as error:
+                await self.producing_start(queue_data, socket_type)
+            except Exception as error:
                 await self._logger.log_message(
                     logging.ERROR,
                     f"다음과 같은 이유로 실행하지 못했습니다 --> {error} \n 오류 라인 --> {traceback.format_exc()}",
                 )
-                await self.kafka_service.send_error(error, market, symbol)
+                self.kafka_service.send_error(error, queue_data["market"], queue_data["symbol"])
+            finally:
+                self.message_queue.task_done()
 
     async def receive_message(self, websocket: socket_protocol) -> ExchangeResponseData:
         """웹소켓에서 메시지 수신
@@ -318,23 +537,23 @@ class WebsocketConnectionManager(WebsocketConnectionAbstract):
         try:
             message: bytes = await asyncio.wait_for(websocket.recv(), timeout=30.0)
             # message: bytes = await websocket.recv()
-            return json.loads(message) if isinstance(message, bytes | str) else message
-        except (TypeError, ValueError) as error:
+            return codec.loads(message) if isinstance(message, bytes | str) else message
+        except (TypeError, ValueError, *codec.decode_error) as error:
             message = f"다음과 같은 이유 메시지 수신하지 못했습니다 --> {error} \n 오류 라인 --> {traceback.format_exc()}"
             await self._logger.log_message(logging.ERROR, message)
-            await self.kafka_service.send_error(error, "Socket", "Socket")
+            self.kafka_service.send_error(error, "Socket", "Socket")
 
-    async def producing_start(self, socket_type: str) -> None:
-        """메시지 생성 및 처리 시작
+    async def producing_start(self, queue_data: MessageQueueData, socket_type: str) -> None:
+        """메시지 정규화 및 처리 시작
         
         Args:
+            queue_data: 큐에서 꺼낸 원본 프레임
             socket_type: 소켓 타입
         """
+        market: str = queue_data["market"]
+        symbol: str = queue_data["symbol"]
         try:
-            queue_data: MessageQueueData = await self.message_queue.get_message()
-            market: str = queue_data["market"]
-            symbol: str = queue_data["symbol"]
-            message: ResponseData = json.loads(queue_data["message"])
+            message: ResponseData = self.message_queue.normalize(queue_data, socket_type)
             
             if len(message) > 0:
                 await self._logger.log_message(logging.INFO, message=f"{market} -- {message}")
@@ -347,19 +566,19 @@ class WebsocketConnectionManager(WebsocketConnectionAbstract):
                     key=f"{market}:{socket_type}-{symbol}",
                 ) 
             
-                await self.message_processor.append_and_process(message=json.dumps(message), kafka_metadata=producer_metadata)
-        except (TypeError, KeyError, CancelledError) as error:
+                await self.message_processor.append_and_process(message=message, kafka_metadata=producer_metadata)
+        except (TypeError, KeyError) as error:
             message = f"오류 --> {error} market --> {market} symbol --> {symbol}"
             await self._logger.log_message(logging.ERROR, message=message)
-            await self.kafka_service.send_error(error, market, symbol)
+            self.kafka_service.send_error(error, market, symbol)
 
-    async def websocket_to_json(self, uri: str, subs_fmt: SubScribeFormat, symbol: str, socket_type: str) -> None:
+    async def websocket_to_json(self, uri: str, subs_fmt: SubScribeFormat, symbol: str | list[str], socket_type: str) -> None:
         """웹소켓 연결 및 JSON 변환 처리
         
         Args:
             uri: 웹소켓 URI
-            subs_fmt: 구독 형식
-            symbol: 심볼
+            subs_fmt: 구독 형식 (SubscribeBatch 면 메시지별로 전송)
+            symbol: 심볼 또는 심볼 목록
             socket_type: 소켓 타입
         """
         @SocketRetryOnFailure(
@@ -371,8 +590,16 @@ class WebsocketConnectionManager(WebsocketConnectionAbstract):
             subs=subs_fmt,
         )
         async def connection():
-            async with websockets.connect(uri, ping_interval=30.0, ping_timeout=60.0) as websocket:
-                await websocket.send(json.dumps(subs_fmt))
-                await self.handle_message(websocket, uri, symbol, socket_type)
+            while True:
+                try:
+                    async with websockets.connect(uri, ping_interval=30.0, ping_timeout=60.0) as websocket:
+                        for subscribe in subscribe_messages(subs_fmt):
+                            await websocket.send(json.dumps(subscribe))
+                        await self.handle_message(websocket, uri, symbol, socket_type)
+                    return
+                except OrderBookSyncError as error:
+                    # 오더북 재동기화는 연결 실패가 아니므로 재시도 횟수를 쓰지 않고 재구독
+                    await self._logger.log_message(logging.WARNING, f"{error} --> 재연결")
+                    await asyncio.sleep(ORDERBOOK_RESUBSCRIBE_DELAY_S)
 
         await connection()
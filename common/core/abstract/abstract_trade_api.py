@@ -43,7 +43,7 @@ class AbstractExchangeSocketClient(ABC):
 
     @abstractmethod
     async def get_present_websocket(
-        self, symbol: str, req_type: str, socket_type: str
+        self, symbol: str | list[str], req_type: str, socket_type: str
     ) -> Coroutine[Any, Any, None]:
         """
         Subject:
@@ -51,7 +51,7 @@ class AbstractExchangeSocketClient(ABC):
         Args:
             - uri (str): 소켓주소
             - subscribe_fmt (list[dict]): 인증파라미터 \n
-            - symbol (str) : 심볼
+            - symbol (str | list[str]) : 심볼 또는 심볼 목록
         Returns:
             - 무한루프 \n
         """
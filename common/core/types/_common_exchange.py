@@ -66,6 +66,77 @@ class SocketLowData(TypedDict):
     data: dict | list
 
 
+class SocketColumnarData(TypedDict):
+    region: str
+    market: str
+    symbol: str
+    format: str
+    count: int
+    timestamp_field: str | None
+    timestamp: list | None
+    columns: dict[str, list]
+
+
+class ErrorSummary(TypedDict):
+    region: str
+    market: str
+    symbol: str
+    error_type: str
+    count: int
+    first_seen: float
+    last_seen: float
+    window_s: float
+    samples: list[str]
+
+
+class OrderBookSnapshot(TypedDict):
+    region: str
+    market: str
+    symbol: str
+    timestamp: int | None
+    sequence: int | None
+    bids: list[list[float]]
+    asks: list[list[float]]
+
+
+class ConsolidatedQuote(TypedDict):
+    symbol: str
+    timestamp: int
+    venues: int
+    usdt_krw: float
+    bid_market: str
+    bid_price: float
+    bid_size: float
+    ask_market: str
+    ask_price: float
+    ask_size: float
+    krw_bid_market: str | None
+    krw_bid: float | None
+    krw_ask_market: str | None
+    krw_ask: float | None
+    usd_bid_market: str | None
+    usd_bid: float | None
+    usd_ask_market: str | None
+    usd_ask: float | None
+    korea_premium: float | None
+    cross_spread_bps: float
+
+
+class CandleBar(TypedDict):
+    region: str
+    market: str
+    symbol: str
+    interval: str
+    start: int
+    end: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    ticks: int
+
+
 class ProducerMetadataDict(TypedDict):
     market: str
     symbol: str
@@ -135,9 +206,20 @@ class KrakenParameter(TypedDict):
     req_id: UUID
 
 
+class KrakenBookParameter(TypedDict):
+    channel: str
+    symbol: list[str]
+    snapshot: bool
+
+
+class KrakenInstrumentParameter(TypedDict):
+    channel: str
+    snapshot: bool
+
+
 class KrakenSocketParameter(TypedDict):
     method: str
-    params: KrakenParameter
+    params: KrakenParameter | KrakenBookParameter | KrakenInstrumentParameter
 
 
 class GateioSocketParameter(TypedDict):
@@ -163,6 +245,14 @@ class BybitSocketParameter(TypedDict):
     args: list[str]
 
 
+class SubscribeBatch(list):
+    """연결 하나에서 순서대로 각각 전송할 구독 메시지 묶음
+
+    - 한 메시지에 여러 심볼을 담을 수 없는 거래소(코인원, gateio 오더북)나
+      요청당 인자 수 제한이 있는 거래소(bybit)에서 사용
+    """
+
+
 UpBithumbSocketParmater = list[TicketUUID | CombinedRequest]
 SubScribeFormat = (
     UpBithumbSocketParmater
@@ -173,6 +263,7 @@ SubScribeFormat = (
     | GateioSocketParameter
     | OKXSocketParameter
     | BybitSocketParameter
+    | SubscribeBatch
 )
 
 # ------------------------------------------------------------------
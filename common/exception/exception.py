@@ -1,12 +1,13 @@
 import json
 import logging
+import time
 import random
 from abc import ABC, abstractmethod
 from functools import wraps
 from typing import Callable, Any
 
 import asyncio
-from aiohttp import ClientConnectorError, ClientError
+from aiohttp import ClientConnectorError, ClientError, ClientResponseError
 from aiohttp.web_exceptions import HTTPException
 from asyncio.exceptions import CancelledError, TimeoutError
 
@@ -18,46 +19,73 @@ from websockets.exceptions import (
     ConnectionClosed,
 )
 from common.utils.logger import AsyncLogger
+from common.utils.other_util import symbol_list
+from common.setting.socket_parameter import subscribe_messages
 
 
 class SocketError(Exception): ...
 
 
+class OrderBookSyncError(SocketError):
+    """로컬 오더북 시퀀스/체크섬 불일치 (재연결 후 스냅샷부터 다시 구독)"""
+
+
 # 기본적인 재시도 로직을 포함하는 추상 클래스
 class BaseRetry(ABC):
-    def __init__(self, retries=3, base_delay=2, max_delay=60):
+    def __init__(self, retries=3, base_delay=2, max_delay=60, healthy_after: float | None = None):
         self.retries = retries
         self.base_delay = base_delay
         self.max_delay = max_delay
+        # 한 번의 실행이 healthy_after 초 이상 정상 동작했으면 이전 실패는 잊고 재시도 횟수를 다시 셈
+        self.healthy_after = healthy_after
+        # 마지막 실행의 재시도 횟수 (호출마다 0부터 다시 셈, 클래스 데코레이터처럼 인스턴스를 공유해도 누적되지 않음)
         self.current_retry = 0
-        self.logging = AsyncLogger(target="connection", folder="error")
+        self._logging: AsyncLogger | None = None
+
+    @property
+    def logging(self) -> AsyncLogger:
+        """로거는 처음 쓸 때 생성 (클래스 데코레이터는 import 시점이라 실행 중인 루프가 없음)"""
+        if self._logging is None:
+            self._logging = AsyncLogger(target="connection", folder="error")
+        return self._logging
 
     async def log_error(self, message: str) -> None:
         """비동기로 로그 메시지를 기록하는 메서드."""
         await self.logging.log_message(logging.ERROR, message=message)
 
-    def calculate_delay(self) -> float:
+    def calculate_delay(self, attempt: int) -> float:
         """지수 백오프를 사용하여 다음 재시도까지의 지연 시간을 계산"""
-        delay = min(self.base_delay * (2**self.current_retry), self.max_delay)
+        delay = min(self.base_delay * (2**attempt), self.max_delay)
         return delay + (random.uniform(0, 0.1) * delay)  # 지터 추가
 
+    def retryable(self, e: Exception) -> bool:
+        """재시도해도 결과가 같지 않은 예외인지 (기본: 모두 재시도)"""
+        return True
+
     async def execute_with_retry(self, func: Callable, *args, **kwargs) -> Any:
         """공통 재시도 로직을 처리하는 메서드"""
-        while self.current_retry < self.retries:
+        attempt = 0
+        while True:
+            started = time.monotonic()
             try:
                 return await func(*args, **kwargs)
             except Exception as e:
-                self.current_retry += 1
-                if self.current_retry >= self.retries:
+                if not self.retryable(e):
+                    raise
+                if self.healthy_after is not None and time.monotonic() - started >= self.healthy_after:
+                    attempt = 0
+                attempt += 1
+                self.current_retry = attempt
+                if attempt >= self.retries:
                     await self.log_error(
                         f"최대 재시도 횟수({self.retries})에 도달했습니다."
                     )
                     raise
 
                 await self.handle_exception(e)
-                delay = self.calculate_delay()
+                delay = self.calculate_delay(attempt)
                 await self.log_error(
-                    f"재시도 {self.current_retry}/{self.retries}, {delay:.2f}초 후 다시 시도합니다."
+                    f"재시도 {attempt}/{self.retries}, {delay:.2f}초 후 다시 시도합니다."
                 )
                 await asyncio.sleep(delay)
 
@@ -77,6 +105,12 @@ class BaseRetry(ABC):
 
 
 class RestRetryOnFailure(BaseRetry):
+    def retryable(self, e: Exception) -> bool:
+        """4xx(429 제외)는 요청 자체가 잘못된 것이므로 재시도하지 않음"""
+        if isinstance(e, ClientResponseError):
+            return not 400 <= e.status < 500 or e.status == 429
+        return True
+
     async def handle_exception(self, e: Exception) -> None:
         """HTTP 예외 처리 로직
 
@@ -95,14 +129,15 @@ class RestRetryOnFailure(BaseRetry):
 class SocketRetryOnFailure(BaseRetry):
     def __init__(
         self,
-        symbol: str,
+        symbol: str | list[str],
         uri: str,
         rest_client: Callable,
         subs: list,
         retries: int = 3,
         base_delay: int = 2,
+        healthy_after: float | None = 60.0,
     ):
-        super().__init__(retries, base_delay)
+        super().__init__(retries, base_delay, healthy_after=healthy_after)
         self.symbol = symbol
         self.uri = uri
         self.subs = subs
@@ -141,7 +176,7 @@ class SocketRetryOnFailure(BaseRetry):
         await self.log_error("REST API로 전환 중...")
         while True:
             try:
-                await self.rest_client.total_pull_request(coin_symbol=self.symbol)
+                await self.rest_client.pull_requests(coin_symbols=symbol_list(self.symbol))
                 await self.log_error("REST API 호출 성공")
                 if await self.connection_test():
                     await self.log_error("소켓 복구 감지, 소켓으로 전환합니다...")
@@ -154,7 +189,8 @@ class SocketRetryOnFailure(BaseRetry):
         """소켓 핑 테스트 메서드"""
         try:
             async with websockets.connect(self.uri, ping_interval=60) as websocket:
-                await websocket.send(json.dumps(self.subs))
+                for subscribe in subscribe_messages(self.subs):
+                    await websocket.send(json.dumps(subscribe))
                 await self.logging.log_message(
                     logging.INFO, f"connection sent -- {self.uri}"
                 )
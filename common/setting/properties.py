@@ -29,6 +29,134 @@ SECURITY_PROTOCOL = parser.get("KAFKA", "security_protocol")
 MAX_BATCH_SIZE = parser.get("KAFKA", "max_batch_size")
 MAX_REQUEST_SIZE = parser.get("KAFKA", "max_request_size")
 ARCKS = parser.get("KAFKA", "acks")
+SEND_MODE = parser.get("KAFKA", "send_mode", fallback="async")
+MAX_INFLIGHT_RECORDS = parser.get("KAFKA", "max_inflight_records", fallback="1000")
+MAX_INFLIGHT_BYTES = parser.get("KAFKA", "max_inflight_bytes", fallback=str(32 * 1024 * 1024))
+
+
+# PARTITION (소켓 토픽 파티셔닝 exchange: 거래소별 고정 파티션 | symbol: (거래소, 심볼) 분산)
+PARTITION_MODE = parser.get("PARTITION", "mode", fallback="exchange")
+PARTITION_MAX = parser.get("PARTITION", "max_partitions", fallback="64")
+
+
+# TOPIC (토픽 프로비저닝 기본값, topic_create.py)
+TOPIC_REPLICATION = parser.get("TOPIC", "replication", fallback="3")
+TOPIC_MIN_INSYNC_REPLICAS = parser.get("TOPIC", "min_insync_replicas", fallback="2")
+TOPIC_REALTIME_RETENTION_MS = parser.get("TOPIC", "realtime_retention_ms", fallback=str(24 * 60 * 60 * 1000))
+TOPIC_REST_RETENTION_MS = parser.get("TOPIC", "rest_retention_ms", fallback=str(7 * 24 * 60 * 60 * 1000))
+TOPIC_ERROR_RETENTION_MS = parser.get("TOPIC", "error_retention_ms", fallback=str(7 * 24 * 60 * 60 * 1000))
+
+
+# SPOOL (전송 실패 메시지 디스크 스풀, eviction: drop_oldest | drop_newest)
+SPOOL_PATH = parser.get("SPOOL", "path", fallback="spool")
+SPOOL_SEGMENT_BYTES = parser.get("SPOOL", "segment_bytes", fallback=str(64 * 1024 * 1024))
+SPOOL_MAX_BYTES = parser.get("SPOOL", "max_bytes", fallback=str(1024 * 1024 * 1024))
+SPOOL_EVICTION = parser.get("SPOOL", "eviction", fallback="drop_oldest")
+SPOOL_REPLAY_RATE = parser.get("SPOOL", "replay_rate", fallback="500")
+
+
+# COMPRESSION (none | gzip | snappy | lz4 | zstd)
+# 키는 토픽 이름(RegionKoreaSocket-ticker) 또는 그 "-" 단위 접두어(RegionKoreaSocket), 가장 길게 일치하는 키 사용, 미지정 토픽은 default
+KAFKA_COMPRESSION = parser.get("COMPRESSION", "default", fallback="none")
+TOPIC_COMPRESSIONS: dict[str, str] = (
+    {topic: value for topic, value in parser.items("COMPRESSION") if topic != "default"}
+    if parser.has_section("COMPRESSION")
+    else {}
+)
+
+
+# PIPELINE (소켓 reader -> 큐 -> 정규화/전송 worker)
+# overflow_policy: block | drop_oldest | drop_newest
+PIPELINE_QUEUE_SIZE = parser.get("PIPELINE", "queue_size", fallback="1000")
+PIPELINE_WORKERS = parser.get("PIPELINE", "workers", fallback="1")
+PIPELINE_OVERFLOW_POLICY = parser.get("PIPELINE", "overflow_policy", fallback="block")
+
+
+# BATCH (카프카 키 단위 배치, 레코드 수/바이트/linger 중 먼저 도달하는 조건으로 전송)
+BATCH_MAX_RECORDS = parser.get("BATCH", "max_records", fallback="100")
+BATCH_MAX_BYTES = parser.get("BATCH", "max_bytes", fallback=str(512 * 1024))
+BATCH_LINGER_MS = parser.get("BATCH", "linger_ms", fallback="1000")
+BATCH_FLUSH_INTERVAL_MS = parser.get("BATCH", "flush_interval_ms", fallback="100")
+
+
+# BATCH_FORMAT (토픽별 배치 포맷 rows | columnar, 미지정 토픽은 rows)
+# 예) RegionKoreaSocket-ticker = columnar
+BATCH_FORMATS: dict[str, str] = (
+    dict(parser.items("BATCH_FORMAT")) if parser.has_section("BATCH_FORMAT") else {}
+)
+
+
+# CONFLATION (토픽별 전송 모드 all | conflate, 미지정 토픽은 all)
+# conflate: (거래소, 심볼) 별 최신 프레임만 남겨 interval_ms 마다 전송, 기준 가격이 threshold_bps 이상 움직이면 즉시 전송
+# 예) RegionAsiaSocket-orderbook = conflate
+CONFLATION_INTERVAL_MS = parser.get("CONFLATION", "interval_ms", fallback="250")
+CONFLATION_THRESHOLD_BPS = parser.get("CONFLATION", "threshold_bps", fallback="10")
+CONFLATION_MODES: dict[str, str] = (
+    dict(parser.items("CONFLATION_MODE")) if parser.has_section("CONFLATION_MODE") else {}
+)
+
+
+# ERROR (ErrorTopic 집계 window 및 샘플 traceback 수/길이)
+ERROR_WINDOW_S = parser.get("ERROR", "window_s", fallback="10")
+ERROR_MAX_SAMPLES = parser.get("ERROR", "max_samples", fallback="3")
+ERROR_SAMPLE_CHARS = parser.get("ERROR", "sample_chars", fallback="2000")
+
+
+# ORDERBOOK (로컬 L2 오더북, 상위 depth 레벨 스냅샷을 interval_ms 마다 변경된 호가만 전송)
+ORDERBOOK_ENABLED = parser.get("ORDERBOOK", "enabled", fallback="true")
+ORDERBOOK_DEPTH = parser.get("ORDERBOOK", "depth", fallback="10")
+ORDERBOOK_INTERVAL_MS = parser.get("ORDERBOOK", "interval_ms", fallback="200")
+ORDERBOOK_VALIDATE = parser.get("ORDERBOOK", "validate", fallback="true")
+# storage = dict (원본 문자열 보존) | array (고정소수점 NumPy 배열, capacity 는 한쪽 호가 초기 레벨 수)
+ORDERBOOK_STORAGE = parser.get("ORDERBOOK", "storage", fallback="dict")
+ORDERBOOK_CAPACITY = parser.get("ORDERBOOK", "capacity", fallback="64")
+ORDERBOOK_PRICE_DECIMALS = parser.get("ORDERBOOK", "price_decimals", fallback="8")
+ORDERBOOK_SIZE_DECIMALS = parser.get("ORDERBOOK", "size_decimals", fallback="8")
+
+
+# CONSOLIDATION (거래소 통합 BBO / 김치 프리미엄, 바뀐 심볼만 throttle_ms 마다 전송)
+# usdt_krw 는 KRW 거래소의 USDT 오더북을 받지 않을 때 쓰는 환율
+CONSOLIDATION_ENABLED = parser.get("CONSOLIDATION", "enabled", fallback="true")
+CONSOLIDATION_THROTTLE_MS = parser.get("CONSOLIDATION", "throttle_ms", fallback="250")
+CONSOLIDATION_USDT_KRW = parser.get("CONSOLIDATION", "usdt_krw", fallback="1380")
+# max_age_ms 동안 갱신되지 않은 거래소 호가는 통합 대상에서 제외
+CONSOLIDATION_MAX_AGE_MS = parser.get("CONSOLIDATION", "max_age_ms", fallback="30000")
+
+
+# CANDLE (티커로 만드는 OHLCV 봉, 마감된 봉만 {지역 토픽}-candle-{interval} 로 전송)
+# - history: (거래소, 심볼, interval) 별로 메모리에 남길 마감 봉 수 (ring buffer)
+# - grace_ms: 다음 티커가 없어도 봉 종료 후 이 시간이 지나면 마감
+CANDLE_ENABLED = parser.get("CANDLE", "enabled", fallback="true")
+CANDLE_INTERVALS = parser.get("CANDLE", "intervals", fallback="1s,1m,5m")
+CANDLE_HISTORY = parser.get("CANDLE", "history", fallback="300")
+CANDLE_GRACE_MS = parser.get("CANDLE", "grace_ms", fallback="500")
+
+
+# REST (소켓 장애 시 REST 폴링 모드 symbol: 심볼마다 거래소별 요청 | bulk: 거래소별 전체(다중) 티커 요청 한 번)
+REST_MODE = parser.get("REST", "mode", fallback="bulk")
+
+
+# HTTP (REST 호출용 호스트별 공유 aiohttp 세션, keep-alive 로 DNS 조회 / TCP 연결 / TLS 핸드셰이크 재사용)
+# - limit_per_host: 호스트당 동시 연결 수, dns_ttl_s: DNS 캐시 유지 시간
+# - keepalive_s: 유휴 연결 유지 시간, timeout_s: 요청 하나의 전체 제한 시간
+HTTP_LIMIT_PER_HOST = parser.get("HTTP", "limit_per_host", fallback="8")
+HTTP_DNS_TTL_S = parser.get("HTTP", "dns_ttl_s", fallback="300")
+HTTP_KEEPALIVE_S = parser.get("HTTP", "keepalive_s", fallback="30")
+HTTP_TIMEOUT_S = parser.get("HTTP", "timeout_s", fallback="10")
+
+
+# RUNTIME (asyncio | uvloop, uvloop 미설치 시 asyncio)
+EVENT_LOOP = parser.get("RUNTIME", "event_loop", fallback="uvloop")
+
+
+# SHARD (거래소/심볼 구독을 여러 프로세스로 분산)
+SHARD_WORKERS = parser.get("SHARD", "workers", fallback="4")
+SHARD_HEARTBEAT_INTERVAL = parser.get("SHARD", "heartbeat_interval", fallback="5")
+SHARD_HEARTBEAT_TIMEOUT = parser.get("SHARD", "heartbeat_timeout", fallback="30")
+
+
+# CODEC (json | orjson | msgspec)
+JSON_CODEC = parser.get("CODEC", "json", fallback="orjson")
 
 
 # URL 가져오는 함수
@@ -2,6 +2,7 @@ import time
 from datetime import datetime, timezone
 
 import uuid
+from common.utils.other_util import symbol_list
 from common.core.types import (
     UpBithumbSocketParmater,
     TicketUUID,
@@ -9,11 +10,15 @@ from common.core.types import (
     CoinoneSocketParameter,
     CoinoneTopicParameter,
     KorbitSocketParameter,
+    SubscribeBatch,
+    SubScribeFormat,
 )
 from common.core.types import (
     BinanceSocketParameter,
     KrakenSocketParameter,
     KrakenParameter,
+    KrakenBookParameter,
+    KrakenInstrumentParameter,
     GateioSocketParameter,
     OKXArgsSocketParameter,
     OKXSocketParameter,
@@ -22,93 +27,148 @@ from common.core.types import (
 
 uu_id = str(uuid.uuid4())
 
+# bybit spot 은 구독 요청 하나에 최대 10개 topic
+BYBIT_MAX_ARGS = 10
+
+
+def subscribe_messages(subs_fmt: SubScribeFormat) -> list:
+    """소켓으로 전송할 구독 메시지 목록"""
+    return list(subs_fmt) if isinstance(subs_fmt, SubscribeBatch) else [subs_fmt]
+
 
 # fmt: off
-def upbithumb_socket_parameter(symbol: str, req_type: str) -> UpBithumbSocketParmater:
+def upbithumb_socket_parameter(symbol: str | list[str], req_type: str) -> UpBithumbSocketParmater:
     return [
         TicketUUID(ticket=uu_id),
         CombinedRequest(
             type=req_type,
-            codes=[f"KRW-{symbol.upper()}"],
+            codes=[f"KRW-{s.upper()}" for s in symbol_list(symbol)],
             isOnlyRealtime=True,
         )
     ]
 
 
-def coinone_socket_parameter(symbol: str, req_type: str) -> CoinoneSocketParameter:
-    return CoinoneSocketParameter(
-        request_type="SUBSCRIBE",
-        channel=req_type.upper(),
-        topic=CoinoneTopicParameter(
-            quote_currency="KRW", target_currency=f"{symbol.upper()}"
-        ),
+def coinone_socket_parameter(symbol: str | list[str], req_type: str) -> SubscribeBatch:
+    # 코인원은 메시지 하나에 심볼 하나 -> 같은 연결에서 심볼별로 전송
+    return SubscribeBatch(
+        CoinoneSocketParameter(
+            request_type="SUBSCRIBE",
+            channel=req_type.upper(),
+            topic=CoinoneTopicParameter(
+                quote_currency="KRW", target_currency=f"{s.upper()}"
+            ),
+        )
+        for s in symbol_list(symbol)
     )
 
 
-def korbit_socket_parameter(symbol: str, req_type: str) -> list[KorbitSocketParameter]:
+def korbit_socket_parameter(symbol: str | list[str], req_type: str) -> list[KorbitSocketParameter]:
     return [KorbitSocketParameter(
         method="subscribe",
         type=req_type,
-        symbols=[f"{symbol.lower()}_krw"]
+        symbols=[f"{s.lower()}_krw" for s in symbol_list(symbol)]
     )]
 
 
 
-def binance_socket_paramater(symbol: str, req_type: str) -> BinanceSocketParameter:
+def binance_socket_paramater(symbol: str | list[str], req_type: str) -> BinanceSocketParameter:
     return BinanceSocketParameter(
         id=uu_id,
         method=f"SUBSCRIBE",
-        params=[f"{symbol.lower()}usdt@{req_type}"],
+        params=[f"{s.lower()}usdt@{req_type}" for s in symbol_list(symbol)],
     )
 
 
-def kraken_socket_parameter(symbol: str, req_type: str) -> KrakenSocketParameter:
-    kraken = KrakenSocketParameter(
+def kraken_book_parameter(symbol: str | list[str], method: str = "subscribe") -> KrakenSocketParameter:
+    """kraken 오더북 구독 / 해제 (구독은 스냅샷부터 받아야 로컬 오더북을 만들 수 있음)"""
+    params = KrakenBookParameter(channel="book", symbol=[f"{s.upper()}/USD" for s in symbol_list(symbol)], snapshot=True)
+    if method != "subscribe":
+        del params["snapshot"]
+    return KrakenSocketParameter(method=method, params=params, req_id=int(datetime.now().timestamp()))
+
+
+def kraken_socket_parameter(symbol: str | list[str], req_type: str) -> KrakenSocketParameter | SubscribeBatch:
+    if req_type == "book":
+        # 체크섬 자릿수(price_precision / qty_precision)를 먼저 받도록 instrument 를 오더북보다 앞에 구독
+        return SubscribeBatch([
+            KrakenSocketParameter(
+                method="subscribe",
+                params=KrakenInstrumentParameter(channel="instrument", snapshot=True),
+            ),
+            kraken_book_parameter(symbol),
+        ])
+
+    return KrakenSocketParameter(
         method="subscribe",
         params=KrakenParameter(
             channel=f"{req_type}", 
-            symbol=[f"{symbol.upper()}/USD"],
+            symbol=[f"{s.upper()}/USD" for s in symbol_list(symbol)],
             event_trigger="trades",
             snapshot=False
         ),
         req_id=1234
     )
-    
-    if req_type == "book":
-        kraken["req_id"] = int(datetime.now().timestamp())
-    
-    return kraken
 
 
-def gateio_socket_parameter(symbol: str, req_type: str) -> GateioSocketParameter:
+def gateio_socket_parameter(symbol: str | list[str], req_type: str) -> GateioSocketParameter | SubscribeBatch:
+    symbols = symbol_list(symbol)
+
+    if req_type == "order_book":
+        # 오더북은 payload 하나에 거래쌍 하나 -> 심볼별 메시지
+        return SubscribeBatch(
+            GateioSocketParameter(
+                time=int(time.time()),
+                channel=f"spot.{req_type}",
+                event="subscribe",
+                payload=[f"{s.upper()}_USDT", "100", "100ms"],
+            )
+            for s in symbols
+        )
+
     gate_io = GateioSocketParameter(
         time=int(time.time()),
         channel=f"spot.{req_type}",
         event="subscribe",
     )
-    
-    if req_type == "order_book":
-        gate_io["payload"] = [f"{symbol.upper()}_USDT", "100", "100ms"]
-    elif req_type == "tickers":
-        gate_io["payload"] =[f"{symbol.upper()}_USDT"]
+    if req_type == "tickers":
+        gate_io["payload"] = [f"{s.upper()}_USDT" for s in symbols]
         
     return gate_io
 
-def bybit_socket_parameter(symbol: str, req_type: str) -> BybitSocketParameter:
-    bybit = BybitSocketParameter(
-        req_id=uu_id,
-        op="subscribe",
-    )
+def bybit_socket_parameter(symbol: str | list[str], req_type: str) -> BybitSocketParameter | SubscribeBatch:
     if req_type == "orderbook":
-        bybit["args"] = [f"{req_type}.50.{symbol.upper()}USDT"]
-
+        args = [f"{req_type}.50.{s.upper()}USDT" for s in symbol_list(symbol)]
     elif req_type == "tickers":
-        bybit["args"] = [f"{req_type}.{symbol.upper()}USDT"]
-    
-    return bybit
+        args = [f"{req_type}.{s.upper()}USDT" for s in symbol_list(symbol)]
+    else:
+        args = []
+
+    chunks = [args[i:i + BYBIT_MAX_ARGS] for i in range(0, len(args), BYBIT_MAX_ARGS)] or [args]
+    messages = [
+        BybitSocketParameter(req_id=uu_id, op="subscribe", args=chunk)
+        for chunk in chunks
+    ]
+    return messages[0] if len(messages) == 1 else SubscribeBatch(messages)
 
-def okx_socket_parameter(symbol: str, req_type: str) -> OKXSocketParameter:
+def okx_socket_parameter(symbol: str | list[str], req_type: str) -> OKXSocketParameter:
     return OKXSocketParameter(
         op="subscribe",
-        args=[OKXArgsSocketParameter(channel=req_type, instId=f"{symbol}-USDT")],
+        args=[OKXArgsSocketParameter(channel=req_type, instId=f"{s}-USDT") for s in symbol_list(symbol)],
     )
+
+
+def orderbook_resubscribe_messages(market: str, symbol: str | list[str]) -> list | None:
+    """심볼 단위 오더북 구독 해제 후 재구독 메시지 (재구독하면 스냅샷부터 다시 받음)
+
+    - 증분 오더북 거래소(OKX / Bybit / Kraken)만 지원, 그 밖의 거래소는 None (재연결)
+    """
+    match market.lower():
+        case "okx":
+            subscribe = okx_socket_parameter(symbol, "books")
+            return [{**subscribe, "op": "unsubscribe"}, subscribe]
+        case "bybit":
+            subscribes = subscribe_messages(bybit_socket_parameter(symbol, "orderbook"))
+            return [{**subscribe, "op": "unsubscribe"} for subscribe in subscribes] + subscribes
+        case "kraken":
+            return [kraken_book_parameter(symbol, method="unsubscribe"), kraken_book_parameter(symbol)]
+    return None
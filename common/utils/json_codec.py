@@ -0,0 +1,88 @@
+"""
+소켓 수신(decode) / 카프카 전송(encode) 에 쓰이는 JSON 코덱
+
+- urls.conf [CODEC] json = orjson | msgspec | json
+- 선택한 라이브러리가 설치되어 있지 않으면 표준 json 으로 폴백
+- encode 는 항상 bytes 를 반환하므로 Producer 에서 다시 인코딩하지 않음
+"""
+
+import json
+from decimal import Decimal
+from typing import Any
+
+from common.setting.properties import JSON_CODEC
+
+
+def default(obj: Any) -> str | None:
+    """Decimal 직렬화 훅 (문자열로 보존)"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+
+
+class JsonCodec:
+    """표준 json 코덱 (기본 폴백)"""
+
+    name: str = "json"
+    decode_error: tuple[type[Exception], ...] = (ValueError,)
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, default=default).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson 코덱"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self.decode_error = (orjson.JSONDecodeError,)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=default)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec 코덱 (Decimal 은 문자열로 기본 인코딩)"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(decimal_format="string")
+        self._decoder = msgspec.json.Decoder()
+        self.decode_error = (msgspec.DecodeError,)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+
+CODECS: dict[str, type[JsonCodec]] = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+
+def get_codec(name: str = JSON_CODEC) -> JsonCodec:
+    """이름에 맞는 코덱 반환, 라이브러리가 없으면 표준 json 으로 폴백"""
+    codec_class = CODECS.get(name.lower(), JsonCodec)
+    try:
+        return codec_class()
+    except ImportError:
+        return JsonCodec()
+
+
+codec: JsonCodec = get_codec()
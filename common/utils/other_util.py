@@ -21,3 +21,76 @@ def get_topic_name(location: str) -> str:
     elif location.lower() == "ne":
         return f"{NE_REAL_TOPIC_NAME}"
     return f"{ASIA_REAL_TOPIC_NAME}"
+
+
+QUOTE_CURRENCIES = ("USDT", "KRW", "USD")
+
+
+def symbol_list(symbol: str | list[str]) -> list[str]:
+    """단일 심볼 또는 심볼 목록을 목록으로 통일"""
+    return [symbol] if isinstance(symbol, str) else list(symbol)
+
+
+def base_symbol(pair: str) -> str:
+    """거래쌍에서 기준 코인 심볼 추출
+
+    >>> base_symbol("KRW-BTC"), base_symbol("btc_krw"), base_symbol("BTCUSDT")
+    ('BTC', 'BTC', 'BTC')
+    """
+    pair = pair.upper()
+    for sep in ("-", "_", "/"):
+        if sep in pair:
+            first, second = pair.split(sep)[:2]
+            # KRW-BTC 처럼 호가 통화가 앞에 오는 거래소 처리
+            return second if first in QUOTE_CURRENCIES else first
+
+    for quote in QUOTE_CURRENCIES:
+        if pair.endswith(quote) and len(pair) > len(quote):
+            return pair[: -len(quote)]
+    return pair
+
+
+def symbol_demultiplex(market: str, message: dict) -> tuple[str | None, dict]:
+    """다중 심볼 구독 프레임에서 심볼 추출
+
+    Args:
+        market: 마켓 이름
+        message: 파싱된 프레임
+
+    Returns:
+        tuple[str | None, dict]: (심볼 또는 None, 래퍼를 벗긴 프레임)
+    """
+    if not isinstance(message, dict):
+        return None, message
+
+    pair: str | None = None
+    match market.lower():
+        case "upbit" | "bithumb":
+            pair = message.get("code")
+        case "coinone":
+            if isinstance(data := message.get("data"), dict):
+                pair = data.get("target_currency")
+        case "korbit":
+            pair = message.get("symbol")
+        case "okx":
+            if isinstance(arg := message.get("arg"), dict):
+                pair = arg.get("instId")
+        case "bybit":
+            if topic := message.get("topic"):
+                pair = topic.rsplit(".", 1)[-1]
+        case "gateio":
+            if isinstance(result := message.get("result"), dict):
+                pair = result.get("currency_pair") or result.get("s")
+        case "binance":
+            # combined stream(/stream) 은 {"stream": "btcusdt@depth20", "data": {...}} 형태
+            if "stream" in message and "data" in message:
+                pair = message["stream"].split("@")[0]
+                message = message["data"]
+            else:
+                pair = message.get("s")
+        case "kraken":
+            data = message.get("data")
+            if isinstance(data, list) and data and isinstance(data[0], dict):
+                pair = data[0].get("symbol")
+
+    return (base_symbol(pair) if isinstance(pair, str) and pair else None), message
@@ -0,0 +1,35 @@
+"""
+주기 전송 타이머
+
+- 배치 / 집계 / 스냅샷 전송 타이머가 공통으로 사용
+- tick 에서 예외가 나도 로그만 남기고 다음 주기를 계속 실행 (타이머 태스크가 조용히 죽지 않도록)
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from common.utils.logger import AsyncLogger
+
+
+async def run_periodic(interval: float, tick: Callable[[], Awaitable[None]], name: str) -> None:
+    """interval 초마다 tick 실행 (취소될 때까지)
+
+    Args:
+        interval: 주기 (초)
+        tick: 매 주기 실행할 코루틴 함수
+        name: 로그에 남길 타이머 이름
+    """
+    # 로거는 리스너 스레드를 띄우므로 처음 실패했을 때만 생성
+    logger: AsyncLogger | None = None
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await tick()
+        except Exception as error:
+            if logger is None:
+                logger = AsyncLogger(target="timer", folder="error")
+            await logger.log_message(
+                logging.ERROR,
+                f"{name} 주기 전송 실패, 다음 주기에 계속 --> {type(error).__name__}: {error}",
+            )
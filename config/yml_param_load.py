@@ -1,9 +1,13 @@
 # fmt: off
 
+import os
 import yaml
+import asyncio
+import logging
 from pathlib import Path
-from typing import ClassVar, Callable
+from typing import Any, ClassVar, Callable, NamedTuple
 from common.core.types import Result, Ok, Err
+from common.utils.logger import AsyncLogger
 
 from protocols.client.korea.rest_korea_exchange import (
     UpbitRest, BithumbRest, CoinoneRest, KorbitRest
@@ -141,14 +145,197 @@ class RestMarketLoader(MarketLoadType):
 
 
 
+TickerExtractor = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class CandleFields(NamedTuple):
+    """OHLCV 봉 집계에 쓰는 정규화 티커 컬럼 (time 이 None 이면 수신 시각)"""
+
+    price: str
+    volume: str
+    time: str | None = None
+
+
+class TickerProjection:
+    """거래소별 티커 컬럼 projection
+
+    - YAML 컬럼 목록을 frozenset 으로 한 번만 컴파일
+    - payload/root 레이아웃이 있으면 고정 레이아웃 추출기(클로저) 사용
+    - 레이아웃이 없거나 프레임 형태가 다르면 범용 경로(extract_generic)로 처리
+    """
+
+    SPECIAL_KEYS: ClassVar[frozenset[str]] = frozenset({"data", "result", "time_ms", "ts", "timestamp"})
+
+    __slots__ = ("market", "column_list", "columns", "plain_columns", "payload_path", "root_columns", "candle", "_compiled")
+
+    def __init__(
+        self,
+        market: str,
+        column_list: list[str],
+        payload_path: list[str | int] | None = None,
+        root_columns: list[str] | None = None,
+        candle: dict[str, str] | None = None,
+    ) -> None:
+        self.market = market
+        self.column_list: tuple[str, ...] = tuple(dict.fromkeys(column_list))
+        self.columns: frozenset[str] = frozenset(self.column_list)
+        self.plain_columns: tuple[str, ...] = tuple(
+            col for col in self.column_list if col not in self.SPECIAL_KEYS
+        )
+        self.payload_path: tuple[str | int, ...] | None = (
+            tuple(payload_path) if payload_path is not None else None
+        )
+        self.root_columns: tuple[str, ...] = tuple(root_columns or ())
+        self.candle: CandleFields | None = CandleFields(**candle) if candle else None
+        self._compiled: TickerExtractor | None = self._compile()
+
+    def _compile(self) -> TickerExtractor | None:
+        """payload 경로와 컬럼으로 고정 레이아웃 추출기 생성
+
+        경로와 컬럼을 튜플로 고정한 클로저 (zip / 컴프리헨션보다 중간 객체 할당이 적음)
+
+        >>> # okx: payload [data, 0]
+        >>> payload = message['data'][0]
+        >>> {'ts': payload['ts'], 'open24h': payload['open24h'], ...}
+        """
+        if self.payload_path is None or not self.column_list:
+            return None
+
+        path = self.payload_path
+        root_columns = self.root_columns
+        payload_columns = tuple(col for col in self.column_list if col not in root_columns)
+
+        def extract(message: dict[str, Any]) -> dict[str, Any]:
+            payload = message
+            for step in path:
+                payload = payload[step]
+            row = {}
+            for col in root_columns:
+                row[col] = message[col]
+            for col in payload_columns:
+                row[col] = payload[col]
+            return row
+
+        return extract
+
+    def extract(self, message: dict[str, Any]) -> dict[str, Any]:
+        """메시지에서 설정된 컬럼만 추출 (컴파일된 추출기 우선)"""
+        if self._compiled is not None:
+            try:
+                return self._compiled(message)
+            except (KeyError, IndexError, TypeError):
+                pass
+        return self.extract_generic(message)
+
+    def extract_generic(self, message: dict[str, Any]) -> dict[str, Any]:
+        """범용 추출 경로
+
+        - 최상위 일반 컬럼은 그대로
+        - 특수 키 값이 숫자면 그대로, dict/list 면 내부에서 컬럼 추출
+        """
+        message_data = {col: message[col] for col in self.plain_columns if col in message}
+
+        for key in self.SPECIAL_KEYS:
+            if key not in message:
+                continue
+            value = message[key]
+            if isinstance(value, (int, float)):
+                message_data[key] = value
+            elif isinstance(value, (dict, list)):
+                if isinstance(value, list):
+                    if not value:
+                        continue
+                    value = value[0]
+                message_data.update({col: value[col] for col in self.column_list if col in value})
+
+        return message_data
+
+
+class TickerProjectionLoader:
+    """티커 projection 캐시
+
+    - 시작 시 _marekt_all_ticker.yml 을 한 번만 읽어 거래소별 projection 생성
+    - reload() 로 명시적 재로딩, watch() 로 파일 변경 시 자동 재로딩 (소켓 재시작 불필요)
+    """
+
+    def __init__(self, yml_path: str = f"{path}/config/_marekt_all_ticker.yml") -> None:
+        self.yml_path = yml_path
+        self._mtime: float | None = None
+        self._projections: dict[str, TickerProjection] = {}
+        self.reload()
+
+    def reload(self) -> None:
+        """YAML 을 다시 읽어 projection 교체 (참조 교체라 진행 중 메시지에 영향 없음)"""
+        mtime = os.stat(self.yml_path).st_mtime
+        with open(file=self.yml_path, mode="r", encoding="utf-8") as file:
+            market_info: dict = yaml.safe_load(file) or {}
+
+        self._projections = {
+            market.lower(): TickerProjection(
+                market=market.lower(),
+                column_list=info.get("parameter", []),
+                payload_path=info.get("payload"),
+                root_columns=info.get("root"),
+                candle=info.get("candle"),
+            )
+            for market, info in market_info.items()
+        }
+        self._mtime = mtime
+
+    def reload_if_changed(self) -> bool:
+        """파일 수정 시각이 바뀌었을 때만 재로딩"""
+        if os.stat(self.yml_path).st_mtime == self._mtime:
+            return False
+        self.reload()
+        return True
+
+    async def watch(self, interval: float = 5.0) -> None:
+        """파일 변경 감시 루프
+
+        - 잘못된 YAML / 파일 오류는 로그만 남기고 이전 projection 을 유지한 채 계속 감시
+        - 같은 수정 시각의 실패는 한 번만 기록 (파일이 다시 바뀌면 재시도)
+        """
+        logger = AsyncLogger(target="projection", folder="error")
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.reload_if_changed()
+            except (yaml.YAMLError, OSError, KeyError, TypeError, AttributeError) as error:
+                try:
+                    self._mtime = os.stat(self.yml_path).st_mtime
+                except OSError:
+                    pass
+                await logger.log_message(
+                    logging.ERROR,
+                    f"티커 projection 재로딩 실패, 이전 설정 유지 --> {type(error).__name__}: {error}",
+                )
+
+    def get(self, location: str) -> TickerProjection:
+        """거래소 projection 반환 (미등록 거래소는 빈 projection)"""
+        market = location.lower()
+        if (projection := self._projections.get(market)) is None:
+            return TickerProjection(market, [])
+        return projection
+
+
+ticker_projections = TickerProjectionLoader()
+
+
 def ticker_json(location: str) -> list[str]:
     """
-    JSON 파일 로드 (socket 또는 rest)
+    티커 컬럼 목록 (캐시된 projection 에서 반환)
         - 어떤 가격대를 가지고 올지 파라미터 정의되어 있음
     """
-    yml_path = f"{path}/config/_marekt_all_ticker.yml"
+    return list(ticker_projections.get(location).column_list)
+
+
+def symbol_json() -> list[str]:
+    """
+    수집할 코인 심볼 목록 (config/_market_symbol.yml)
+        - 거래소별 소켓 연결 하나에서 모두 구독
+    """
+    yml_path = f"{path}/config/_market_symbol.yml"
     with open(file=yml_path, mode="r", encoding="utf-8") as file:
-        market_info = yaml.safe_load(file)
-    
-    
-    return market_info.get(location.lower(), {}).get("parameter", [])
+        symbol_info = yaml.safe_load(file)
+
+    return [symbol.upper() for symbol in symbol_info.get("symbols", [])]
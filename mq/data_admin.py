@@ -1,10 +1,285 @@
 """
 KAKFA NEW TOPIC CREATE
+
+- desired_topics: config/*/_market_socket.yml, _market_symbol.yml, urls.conf 로부터 파이프라인이 쓰는 토픽 전체 계산
+- TopicProvisioner: 현재 클러스터 상태와 비교해 차이만 적용 (여러 번 실행해도 결과 동일)
+    - 없는 토픽 생성, 부족한 파티션 추가, 다른 설정값 변경
+    - 파티션 축소/복제 수 변경은 카프카가 지원하지 않으므로 경고만 남김
+- admin 클라이언트를 주입할 수 있어 로컬 카프카(mq/kafka-docker) 나 대역 객체(InMemoryAdmin)로 실행 가능
 """
 
-from confluent_kafka.admin import AdminClient, NewTopic
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import Future
+from typing import Protocol, TypedDict
+
+from confluent_kafka.admin import (
+    AdminClient,
+    NewTopic,
+    NewPartitions,
+    ConfigResource,
+    ConfigEntry,
+    AlterConfigOpType,
+    ResourceType,
+)
 from confluent_kafka.error import KafkaError, KafkaException, ProduceError
-from common.setting.properties import BOOTSTRAP_SERVER
+from config.yml_param_load import SocketMarketLoader
+from mq.data_partitional import SOCKET_TYPES, CoinSymbolShardPartition
+from mq.data_error import ERROR_TOPIC
+from common.client.market_socket.orderbook import BOOK_TOPIC_SUFFIX
+from common.client.market_socket.consolidation import CONSOLIDATED_TOPIC
+from common.client.market_socket.candle import CANDLE_TOPIC_SUFFIX, candle_intervals
+from common.utils.other_util import get_topic_name
+from common.setting.properties import (
+    BOOTSTRAP_SERVER,
+    MAX_REQUEST_SIZE,
+    TOPIC_REPLICATION,
+    TOPIC_MIN_INSYNC_REPLICAS,
+    TOPIC_REALTIME_RETENTION_MS,
+    TOPIC_REST_RETENTION_MS,
+    TOPIC_ERROR_RETENTION_MS,
+)
+
+config_path = Path(__file__).parents[1] / "config"
+
+REGION_LABELS: dict[str, str] = {"korea": "Korea", "asia": "Asia", "ne": "NE"}
+
+
+class TopicSpec(TypedDict):
+    name: str
+    partitions: int
+    replication: int
+    config: dict[str, str]
+
+
+class TopicChange(TypedDict):
+    action: str  # create | add_partitions | alter_config | warn
+    topic: str
+    detail: str
+
+
+class AdminLike(Protocol):
+    """TopicProvisioner 가 사용하는 AdminClient 메서드"""
+
+    def list_topics(self, *args, **kwargs): ...
+    def create_topics(self, new_topics, **kwargs): ...
+    def create_partitions(self, new_partitions, **kwargs): ...
+    def describe_configs(self, resources, **kwargs): ...
+    def incremental_alter_configs(self, resources, **kwargs): ...
+
+
+class InMemoryAdmin:
+    """클러스터 없이 TopicProvisioner 를 실행하기 위한 AdminLike 대역 (토픽 / 파티션 / 설정을 메모리에 보관)"""
+
+    def __init__(self) -> None:
+        # 토픽 -> (파티션 수, 복제 수)
+        self.topics: dict[str, tuple[int, int]] = {}
+        self.configs: dict[str, dict[str, str]] = {}
+
+    @staticmethod
+    def _done(value=None) -> Future:
+        future: Future = Future()
+        future.set_result(value)
+        return future
+
+    def list_topics(self, *args, **kwargs) -> SimpleNamespace:
+        return SimpleNamespace(
+            topics={
+                name: SimpleNamespace(
+                    partitions={
+                        partition: SimpleNamespace(replicas=list(range(replication)))
+                        for partition in range(partitions)
+                    }
+                )
+                for name, (partitions, replication) in self.topics.items()
+            }
+        )
+
+    def create_topics(self, new_topics, **kwargs) -> dict[str, Future]:
+        for topic in new_topics:
+            self.topics[topic.topic] = (topic.num_partitions, topic.replication_factor)
+            self.configs[topic.topic] = dict(topic.config)
+        return {topic.topic: self._done() for topic in new_topics}
+
+    def create_partitions(self, new_partitions, **kwargs) -> dict[str, Future]:
+        for partition in new_partitions:
+            self.topics[partition.topic] = (partition.new_total_count, self.topics[partition.topic][1])
+        return {partition.topic: self._done() for partition in new_partitions}
+
+    def describe_configs(self, resources, **kwargs) -> dict:
+        return {
+            resource: self._done({key: SimpleNamespace(value=value) for key, value in self.configs[resource.name].items()})
+            for resource in resources
+        }
+
+    def incremental_alter_configs(self, resources, **kwargs) -> dict:
+        for resource in resources:
+            for entry in resource.incremental_configs:
+                self.configs[resource.name][entry.name] = entry.value
+        return {resource: self._done() for resource in resources}
+
+
+def socket_regions() -> list[str]:
+    """소켓 거래소가 설정된 지역 (config/*/_market_socket.yml)"""
+    return sorted(path.parent.name for path in config_path.glob("*/_market_socket.yml"))
+
+
+def topic_config(retention_ms: str, replication: int, segment_ms: str | None = None) -> dict[str, str]:
+    """처리량 위주 토픽 설정
+
+    - 압축은 Producer 가 토픽별로 결정 (compression.type=producer, 브로커 재압축 없음)
+    - max.message.bytes 는 Producer max_request_size 에 맞춤
+    """
+    config = {
+        "cleanup.policy": "delete",
+        "retention.ms": retention_ms,
+        "min.insync.replicas": str(min(int(TOPIC_MIN_INSYNC_REPLICAS), replication)),
+        "max.message.bytes": MAX_REQUEST_SIZE,
+        "compression.type": "producer",
+    }
+    if segment_ms is not None:
+        config["segment.ms"] = segment_ms
+    return config
+
+
+def desired_topics(
+    symbols: list[str],
+    partition_mode: str = "exchange",
+    max_partitions: int = 64,
+    replication: int = int(TOPIC_REPLICATION),
+) -> list[TopicSpec]:
+    """파이프라인이 쓰는 토픽 전체
+
+    - {지역 토픽}-ticker / -orderbook: 파티션 = 지역 거래소 수 (symbol 모드면 (거래소, 심볼) 쌍 수, max_partitions 이하)
+    - {지역 토픽}-book: 로컬 오더북 상위 depth 스냅샷, 원본 오더북과 같은 키라서 파티션도 동일
+    - {지역 토픽}-candle-{interval}: 마감된 OHLCV 봉, 원본 티커와 같은 키라서 파티션도 동일
+    - Region{지역}_{Ticker|Orderbook}Preprocessing: 파티션 = 지역 거래소 수
+    - TotalRestDataIn{SYMBOL}: 키가 지역별({location}-Total) 이므로 파티션 = 지역 수
+      (키가 지역 수만큼뿐이라 compact 하면 시계열이 지역별 마지막 값 하나로 줄어듦 -> retention 삭제만)
+    - ConsolidatedBBO: 심볼 키 해싱, 파티션 = 심볼 수 (max_partitions 이하)
+    - ErrorTopic: 파티션 1
+    """
+    realtime = topic_config(TOPIC_REALTIME_RETENTION_MS, replication, segment_ms=str(60 * 60 * 1000))
+    specs: list[TopicSpec] = []
+    regions = socket_regions()
+
+    for location in regions:
+        exchanges = len(SocketMarketLoader(location=location).load_json())
+        partitions = (
+            CoinSymbolShardPartition.partition_count(exchanges, symbols, max_partitions)
+            if partition_mode == "symbol"
+            else exchanges
+        )
+        label = REGION_LABELS.get(location, location.capitalize())
+        for socket_type in SOCKET_TYPES:
+            specs.append(TopicSpec(name=f"{get_topic_name(location)}-{socket_type}", partitions=partitions, replication=replication, config=realtime))
+            specs.append(TopicSpec(name=f"Region{label}_{socket_type.capitalize()}Preprocessing", partitions=exchanges, replication=replication, config=realtime))
+        specs.append(TopicSpec(name=f"{get_topic_name(location)}-{BOOK_TOPIC_SUFFIX}", partitions=partitions, replication=replication, config=realtime))
+        for interval in candle_intervals():
+            specs.append(TopicSpec(name=f"{get_topic_name(location)}-{CANDLE_TOPIC_SUFFIX}-{interval}", partitions=partitions, replication=replication, config=realtime))
+
+    rest = topic_config(TOPIC_REST_RETENTION_MS, replication)
+    for symbol in symbols:
+        specs.append(TopicSpec(name=f"TotalRestDataIn{symbol.upper()}", partitions=len(regions), replication=replication, config=rest))
+
+    specs.append(TopicSpec(name=CONSOLIDATED_TOPIC, partitions=max(min(len(symbols), max_partitions), 1), replication=replication, config=realtime))
+    specs.append(TopicSpec(name=ERROR_TOPIC, partitions=1, replication=replication, config=topic_config(TOPIC_ERROR_RETENTION_MS, replication)))
+    return specs
+
+
+class TopicProvisioner:
+    """선언된 토픽 목록과 클러스터 상태 비교 후 차이만 적용"""
+
+    def __init__(self, admin: AdminLike | None = None, timeout: float = 10.0) -> None:
+        self.admin = admin if admin is not None else AdminClient({"bootstrap.servers": BOOTSTRAP_SERVER})
+        self.timeout = timeout
+
+    def current_topics(self) -> dict[str, tuple[int, int]]:
+        """토픽 -> (파티션 수, 복제 수), 내부 토픽 제외"""
+        metadata = self.admin.list_topics(timeout=self.timeout)
+        return {
+            name: (len(topic.partitions), min((len(p.replicas) for p in topic.partitions.values()), default=0))
+            for name, topic in metadata.topics.items()
+            if not name.startswith("__")
+        }
+
+    def current_configs(self, names: list[str]) -> dict[str, dict[str, str]]:
+        if not names:
+            return {}
+        futures = self.admin.describe_configs([ConfigResource(ResourceType.TOPIC, name) for name in names])
+        return {
+            resource.name: {key: entry.value for key, entry in future.result().items()}
+            for resource, future in futures.items()
+        }
+
+    def plan(self, desired: list[TopicSpec]) -> list[TopicChange]:
+        """적용할 변경 목록 (클러스터는 변경하지 않음)"""
+        current = self.current_topics()
+        configs = self.current_configs([spec["name"] for spec in desired if spec["name"] in current])
+        changes: list[TopicChange] = []
+
+        for spec in desired:
+            name = spec["name"]
+            if name not in current:
+                changes.append(TopicChange(action="create", topic=name, detail=f"partitions={spec['partitions']} replication={spec['replication']}"))
+                continue
+
+            partitions, replication = current[name]
+            if partitions < spec["partitions"]:
+                changes.append(TopicChange(action="add_partitions", topic=name, detail=f"{partitions} -> {spec['partitions']}"))
+            elif partitions > spec["partitions"]:
+                changes.append(TopicChange(action="warn", topic=name, detail=f"파티션 축소 불가 ({partitions} > {spec['partitions']})"))
+            if replication != spec["replication"]:
+                changes.append(TopicChange(action="warn", topic=name, detail=f"복제 수 다름 ({replication} != {spec['replication']})"))
+
+            diff = {key: value for key, value in spec["config"].items() if configs.get(name, {}).get(key) != value}
+            if diff:
+                changes.append(TopicChange(action="alter_config", topic=name, detail=", ".join(f"{k}={v}" for k, v in sorted(diff.items()))))
+        return changes
+
+    @staticmethod
+    def _wait(futures: dict) -> None:
+        for future in futures.values():
+            try:
+                future.result()
+            except (KafkaException, KafkaError) as error:
+                # 다른 프로세스가 먼저 만든 경우는 성공으로 취급
+                if error.args[0].code() != KafkaError.TOPIC_ALREADY_EXISTS:
+                    raise
+
+    def apply(self, desired: list[TopicSpec], changes: list[TopicChange]) -> None:
+        """plan 결과 적용"""
+        specs = {spec["name"]: spec for spec in desired}
+        by_action: dict[str, list[TopicSpec]] = {}
+        for change in changes:
+            by_action.setdefault(change["action"], []).append(specs[change["topic"]])
+
+        if creates := by_action.get("create"):
+            self._wait(self.admin.create_topics([
+                NewTopic(spec["name"], num_partitions=spec["partitions"], replication_factor=spec["replication"], config=spec["config"])
+                for spec in creates
+            ]))
+        if additions := by_action.get("add_partitions"):
+            self._wait(self.admin.create_partitions([NewPartitions(spec["name"], spec["partitions"]) for spec in additions]))
+        if alters := by_action.get("alter_config"):
+            self._wait(self.admin.incremental_alter_configs([
+                ConfigResource(
+                    ResourceType.TOPIC,
+                    spec["name"],
+                    incremental_configs=[
+                        ConfigEntry(key, value, incremental_operation=AlterConfigOpType.SET)
+                        for key, value in spec["config"].items()
+                    ],
+                )
+                for spec in alters
+            ]))
+
+    def sync(self, desired: list[TopicSpec], dry_run: bool = False) -> list[TopicChange]:
+        """plan 후 적용 (dry_run 이면 plan 만)"""
+        changes = self.plan(desired)
+        if not dry_run:
+            self.apply(desired, changes)
+        return changes
 
 
 def new_topic_initialization(
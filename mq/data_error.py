@@ -0,0 +1,95 @@
+"""
+에러 리포트 집계
+
+- 예외마다 카프카로 보내지 않고 (마켓, 심볼, 예외 타입) 단위로 묶어서 window 마다 한 건씩 ErrorTopic 으로 전송
+- 기록(record)은 동기 호출이라 수신/정규화 경로를 막지 않음
+- traceback 은 키마다 max_samples 개까지만 포맷해서 샘플로 첨부
+"""
+
+import time
+import asyncio
+import traceback
+from typing import Awaitable, Callable
+
+from common.core.types import ErrorSummary
+from common.utils.periodic import run_periodic
+from common.setting.properties import (
+    ERROR_WINDOW_S,
+    ERROR_MAX_SAMPLES,
+    ERROR_SAMPLE_CHARS,
+)
+
+ERROR_TOPIC = "ErrorTopic"
+
+ErrorKey = tuple[str, str, str]
+ErrorSender = Callable[[ErrorSummary], Awaitable[None]]
+
+
+class ErrorAggregator:
+    """(마켓, 심볼, 예외 타입) 별 에러 집계"""
+
+    def __init__(
+        self,
+        send: ErrorSender,
+        region: str,
+        window_s: float = float(ERROR_WINDOW_S),
+        max_samples: int = int(ERROR_MAX_SAMPLES),
+        sample_chars: int = int(ERROR_SAMPLE_CHARS),
+    ) -> None:
+        self.send = send
+        self.region = region
+        self.window_s = window_s
+        self.max_samples = max_samples
+        self.sample_chars = sample_chars
+        self.pending: dict[ErrorKey, ErrorSummary] = {}
+        self.recorded = 0
+        self.emitted = 0
+        self._timer: asyncio.Task | None = None
+
+    def record(self, error: BaseException, market: str, symbol: str) -> None:
+        """에러 한 건 기록 (전송은 window 가 끝날 때)"""
+        now = time.time()
+        key = (market, symbol, type(error).__name__)
+        self.recorded += 1
+
+        summary = self.pending.get(key)
+        if summary is None:
+            summary = self.pending[key] = ErrorSummary(
+                region=self.region,
+                market=market,
+                symbol=symbol,
+                error_type=key[2],
+                count=0,
+                first_seen=now,
+                last_seen=now,
+                window_s=self.window_s,
+                samples=[],
+            )
+        summary["count"] += 1
+        summary["last_seen"] = now
+        if len(summary["samples"]) < self.max_samples:
+            sample = "".join(traceback.format_exception(error))
+            summary["samples"].append(sample[-self.sample_chars:])
+
+    async def flush(self) -> None:
+        """쌓인 집계 전송 (전송 중 기록되는 에러는 다음 window 로)"""
+        pending, self.pending = self.pending, {}
+        for summary in pending.values():
+            self.emitted += 1
+            await self.send(summary)
+
+    async def _run_timer(self) -> None:
+        await run_periodic(self.window_s, self.flush, "ErrorAggregator")
+
+    def start(self) -> None:
+        """window 타이머 시작 (이미 실행 중이면 무시)"""
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._run_timer())
+
+    async def close(self) -> None:
+        """타이머 정지 후 남은 집계 전송"""
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        await self.flush()
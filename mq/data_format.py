@@ -0,0 +1,96 @@
+"""
+카프카 배치 페이로드 포맷
+
+- rows: 기존 SocketLowData (레코드 dict 의 리스트, 레코드마다 필드 이름 반복)
+- columnar: SocketColumnarData (필드별 배열 + 공통 timestamp 배열)
+- 토픽별 포맷은 urls.conf [BATCH_FORMAT] 에서 선택 (미지정 토픽은 rows)
+- columnar 는 평평한(중첩 없는) 같은 필드 구성의 레코드에만 적용, 아니면 rows 로 전송
+- 컨슈머는 decode_batch 로 두 포맷 모두 레코드 리스트로 복원
+"""
+
+from typing import Any
+
+from common.utils.json_codec import codec
+from common.setting.properties import BATCH_FORMATS
+from common.core.types import SocketLowData, SocketColumnarData
+
+ROWS = "rows"
+COLUMNAR = "columnar"
+
+# 거래소별 티커 시각 필드 (첫 번째로 발견된 필드를 공통 timestamp 배열로 분리)
+TIMESTAMP_FIELDS: tuple[str, ...] = ("timestamp", "ts", "time_ms", "E")
+
+
+def batch_format(topic: str) -> str:
+    """토픽에 설정된 배치 포맷 (configparser 키는 소문자)"""
+    return BATCH_FORMATS.get(topic.lower(), ROWS)
+
+
+def is_columnar(records: list[Any]) -> bool:
+    """columnar 로 인코딩 가능한 배치인지 (평평하고 필드 구성이 같은 dict)"""
+    if not records or not isinstance(records[0], dict):
+        return False
+    first = records[0]
+    if any(isinstance(value, dict | list) for value in first.values()):
+        return False
+    fields = first.keys()
+    return all(isinstance(record, dict) and record.keys() == fields for record in records)
+
+
+def encode_columnar(region: str, market: str, symbol: str, records: list[dict]) -> SocketColumnarData:
+    """레코드 리스트 -> 필드별 배열"""
+    fields = list(records[0])
+    timestamp_field = next((field for field in TIMESTAMP_FIELDS if field in records[0]), None)
+    if timestamp_field is not None:
+        fields.remove(timestamp_field)
+
+    return SocketColumnarData(
+        region=region,
+        market=market,
+        symbol=symbol,
+        format=COLUMNAR,
+        count=len(records),
+        timestamp_field=timestamp_field,
+        timestamp=[record[timestamp_field] for record in records] if timestamp_field else None,
+        columns={field: [record[field] for record in records] for field in fields},
+    )
+
+
+def encode_batch(topic: str, region: str, market: str, symbol: str, records: list[Any]) -> SocketLowData | SocketColumnarData:
+    """토픽 설정에 맞는 배치 페이로드"""
+    if batch_format(topic) == COLUMNAR and is_columnar(records):
+        return encode_columnar(region, market, symbol, records)
+    return SocketLowData(region=region, market=market, symbol=symbol, data=records)
+
+
+def decode_columnar(payload: SocketColumnarData) -> list[dict]:
+    """필드별 배열 -> 레코드 리스트 (필드 순서는 timestamp 가 맨 앞)"""
+    names: list[str] = []
+    arrays: list[list] = []
+    if payload["timestamp_field"] is not None:
+        names.append(payload["timestamp_field"])
+        arrays.append(payload["timestamp"])
+    for field, values in payload["columns"].items():
+        names.append(field)
+        arrays.append(values)
+    return [dict(zip(names, row)) for row in zip(*arrays)]
+
+
+def decode_batch(payload: bytes | str | dict) -> SocketLowData:
+    """컨슈머용: 카프카 메시지 값을 포맷과 무관하게 SocketLowData 로 복원
+
+    Example:
+        >>> for record in consumer:
+        ...     batch = decode_batch(record.value)
+        ...     batch["data"]  # 레코드 리스트
+    """
+    if not isinstance(payload, dict):
+        payload = codec.loads(payload)
+    if payload.get("format") != COLUMNAR:
+        return payload
+    return SocketLowData(
+        region=payload["region"],
+        market=payload["market"],
+        symbol=payload["symbol"],
+        data=decode_columnar(payload),
+    )
@@ -1,32 +1,80 @@
 import logging
-import json
+import asyncio
 from pathlib import Path
-from typing import Any, TypedDict, Callable
+from functools import partial, lru_cache
+from contextlib import asynccontextmanager
+from typing import Any, TypedDict, Callable, ClassVar, AsyncIterator
 
-from decimal import Decimal
-from collections import defaultdict
 from aiokafka import AIOKafkaProducer
-from aiokafka.errors import NoBrokersAvailable, KafkaProtocolError, KafkaConnectionError
+from aiokafka.codec import has_gzip, has_snappy, has_lz4, has_zstd
+from aiokafka.errors import KafkaError
 from kafka.partitioner.default import DefaultPartitioner
+from mq.data_spool import DiskSpool, SpoolRecord
 from mq.data_partitional import (
     CoinHashingCustomPartitional,
     CoinSocketDataCustomPartition,
+    socket_partitioner,
 )
 from common.utils.logger import AsyncLogger
+from common.utils.json_codec import codec
 from common.setting.properties import (
     BOOTSTRAP_SERVER,
     SECURITY_PROTOCOL,
     MAX_BATCH_SIZE,
     MAX_REQUEST_SIZE,
     ARCKS,
+    SEND_MODE,
+    MAX_INFLIGHT_RECORDS,
+    MAX_INFLIGHT_BYTES,
+    KAFKA_COMPRESSION,
+    TOPIC_COMPRESSIONS,
 )
 
 present_path = Path(__file__).parent
 
 
-def default(obj: Any):
-    if isinstance(obj, Decimal):
-        return str(obj)
+def serialize(value: Any) -> bytes:
+    """카프카 전송용 직렬화 (파이프라인에서 단 한 번만 수행)"""
+    return codec.dumps(value)
+
+
+COMPRESSION_CODECS: dict[str, Callable[[], bool]] = {
+    "gzip": has_gzip,
+    "snappy": has_snappy,
+    "lz4": has_lz4,
+    "zstd": has_zstd,
+}
+
+
+def compression_codec(name: str) -> str | None:
+    """압축 코덱 이름 검증 (None 이면 압축하지 않음)
+
+    - 코덱 라이브러리(cramjam)가 없으면 압축하지 않음
+
+    Raises:
+        ValueError: 지원하지 않는 코덱 이름
+    """
+    name = name.lower()
+    if name in ("", "none"):
+        return None
+    if name not in COMPRESSION_CODECS:
+        raise ValueError(f"지원하지 않는 압축 코덱입니다 --> {name}")
+    return name if COMPRESSION_CODECS[name]() else None
+
+
+@lru_cache(maxsize=None)
+def compression_type(topic: str) -> str | None:
+    """토픽에 적용할 압축 코덱
+
+    - 설정 키 중 토픽 이름과 "-" 단위로 가장 길게 일치하는 접두어 사용, 없으면 default
+      (RegionKoreaSocket-candle-1s -> RegionKoreaSocket-candle-1s, RegionKoreaSocket-candle, RegionKoreaSocket 순)
+    """
+    parts = topic.lower().split("-")
+    for end in range(len(parts), 0, -1):
+        prefix = "-".join(parts[:end])
+        if prefix in TOPIC_COMPRESSIONS:
+            return compression_codec(TOPIC_COMPRESSIONS[prefix])
+    return compression_codec(KAFKA_COMPRESSION)
 
 
 class KafkaConfig(TypedDict):
@@ -40,95 +88,277 @@ class KafkaConfig(TypedDict):
         | CoinSocketDataCustomPartition
     )
     acks: str | int
-    value_serializer: Callable[[Any], bytes]
+    compression_type: str | None
     key_serializer: Callable[[Any], bytes]
     enable_idempotence: bool
     retry_backoff_ms: int
 
 
+DeliveryErrorCallback = Callable[[str, Any, BaseException], None]
+
+
+class InFlightWindow:
+    """
+    InFlightWindow
+    - 브로커 확인(ack)을 기다리는 레코드 수/바이트를 제한
+    - 윈도우가 가득 찼을 때만 호출자(소켓 reader)를 대기시킴
+    """
+
+    def __init__(self, max_records: int, max_bytes: int) -> None:
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.records = 0
+        self.bytes = 0
+        self._space: asyncio.Event | None = None
+
+    def _get_space(self) -> asyncio.Event:
+        if self._space is None:
+            self._space = asyncio.Event()
+            self._space.set()
+        return self._space
+
+    def is_full(self, size: int) -> bool:
+        """size 만큼 추가했을 때 한도를 넘는지 (비어 있으면 항상 허용)"""
+        if self.records == 0:
+            return False
+        return self.records >= self.max_records or self.bytes + size > self.max_bytes
+
+    async def acquire(self, size: int) -> None:
+        """윈도우에 여유가 생길 때까지 대기 후 자리 확보"""
+        space = self._get_space()
+        while self.is_full(size):
+            space.clear()
+            await space.wait()
+        self.records += 1
+        self.bytes += size
+
+    def release(self, size: int) -> None:
+        """전송 완료(성공/실패) 시 자리 반환"""
+        self.records -= 1
+        self.bytes -= size
+        self._get_space().set()
+
+
+class KafkaProducerPool:
+    """
+    KafkaProducerPool
+    - (파티션 정책, 압축 코덱) 별 AIOKafkaProducer 하나를 프로세스 전역에서 공유
+    - compression_type 은 Producer 단위 설정이므로 압축이 다른 토픽은 Producer 를 나눔
+    - 파이프라인 시작 시 한 번만 시작하고, 종료 시 flush 후 정리
+    """
+
+    _producers: ClassVar[dict[str, AIOKafkaProducer]] = {}
+    _windows: ClassVar[dict[str, InFlightWindow]] = {}
+    _lock: ClassVar[asyncio.Lock | None] = None
+
+    # fmt: off
+    @staticmethod
+    def policy_name(partition_pol: Callable, compression: str | None = None) -> str:
+        """파티션 정책 + 압축 코덱 이름 (풀 키)"""
+        return f"{type(partition_pol).__name__}:{compression or 'none'}"
+
+    @staticmethod
+    def producer_config(partition_pol: Callable, compression: str | None = None) -> KafkaConfig:
+        """파티션 정책/압축 코덱별 Producer 설정"""
+        return KafkaConfig(
+            bootstrap_servers=BOOTSTRAP_SERVER,
+            security_protocol=SECURITY_PROTOCOL,
+            max_batch_size=int(MAX_BATCH_SIZE),
+            max_request_size=int(MAX_REQUEST_SIZE),
+            partitioner=partition_pol,
+            acks=ARCKS,
+            compression_type=compression,
+            key_serializer=serialize,
+            enable_idempotence=True,
+            retry_backoff_ms=100,
+        )
+
+    @classmethod
+    def _get_lock(cls) -> asyncio.Lock:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        return cls._lock
+
+    @classmethod
+    async def acquire(cls, partition_pol: Callable, compression: str | None = None) -> AIOKafkaProducer:
+        """정책/압축에 맞는 Producer 반환, 없으면 한 번만 시작
+
+        Raises:
+            KafkaError: 브로커 연결 실패
+        """
+        name = cls.policy_name(partition_pol, compression)
+        if (producer := cls._producers.get(name)) is not None:
+            return producer
+
+        async with cls._get_lock():
+            if name not in cls._producers:
+                producer = AIOKafkaProducer(**cls.producer_config(partition_pol, compression))
+                try:
+                    await producer.start()
+                except KafkaError:
+                    await producer.stop()
+                    raise
+                cls._producers[name] = producer
+        return cls._producers[name]
+
+    @classmethod
+    def window(cls, partition_pol: Callable, compression: str | None = None) -> InFlightWindow:
+        """Producer 별로 공유되는 in-flight 윈도우"""
+        name = cls.policy_name(partition_pol, compression)
+        if name not in cls._windows:
+            cls._windows[name] = InFlightWindow(
+                max_records=int(MAX_INFLIGHT_RECORDS),
+                max_bytes=int(MAX_INFLIGHT_BYTES),
+            )
+        return cls._windows[name]
+
+    @classmethod
+    async def start(cls, *partition_pols: Callable) -> None:
+        """파이프라인 부팅 시 기본 압축 코덱의 Producer 미리 시작 (다른 압축은 첫 전송 시 시작)"""
+        compression = compression_codec(KAFKA_COMPRESSION)
+        for partition_pol in partition_pols:
+            await cls.acquire(partition_pol, compression)
+
+    @classmethod
+    async def close(cls) -> None:
+        """모든 Producer flush 후 종료"""
+        async with cls._get_lock():
+            producers, cls._producers = cls._producers, {}
+            for producer in producers.values():
+                try:
+                    await producer.flush()
+                finally:
+                    await producer.stop()
+        # 락과 in-flight 윈도우는 현재 이벤트 루프에 묶이므로 다음 lifespan 에서 새로 만듦
+        cls._lock = None
+        cls._windows = {}
+
+    @classmethod
+    @asynccontextmanager
+    async def lifespan(cls, *partition_pols: Callable) -> AsyncIterator[None]:
+        """Producer 생명주기 훅
+
+        Example:
+            >>> async with KafkaProducerPool.lifespan(socket_partitioner()):
+            ...     await coin_present_websocket(CoinPresentPriceWebsocket)
+        """
+        logger = AsyncLogger(target="kafka", folder="kafka")
+        try:
+            await cls.start(*partition_pols)
+        except KafkaError as e:
+            # 부팅 시 브로커가 없어도 파이프라인은 시작, 첫 전송 시 재시도
+            await logger.log_message(logging.ERROR, message=f"Producer 사전 시작 실패: {e}")
+        try:
+            yield
+        finally:
+            # 재전송 중단 -> Producer flush (마지막 flush 에서 실패한 레코드도 스풀에 저장) -> 스풀 닫기
+            await DiskSpool.stop_replays()
+            await cls.close()
+            await DiskSpool.close_all()
+
+
 class KafkaMessageSender:
     """
     KafkaMessageSender
-    - 카프카 전송 로직
-    - 전송 실패 시 메시지를 임시 저장하고, 나중에 재전송
+    - 카프카 전송 로직 (Producer 는 KafkaProducerPool 에서 공유)
+    - send_mode="async" 이면 ack 를 기다리지 않고 in-flight 윈도우로 파이프라이닝
+    - 메시지는 전송 직전에 한 번만 직렬화하고, 크기도 직렬화된 bytes 로 계산
+    - 토픽별 압축 코덱(urls.conf [COMPRESSION])에 맞는 Producer 로 전송
+    - 전송 실패 시 (토픽, 키, 값) 을 파티션 정책별 디스크 스풀에 저장하고, 전송이 성공하면 백그라운드로 재전송
     """
 
     def __init__(
-        self, partition_pol: Callable = CoinSocketDataCustomPartition()
+        self,
+        partition_pol: Callable = socket_partitioner(),
+        send_mode: str = SEND_MODE,
+        on_delivery_error: DeliveryErrorCallback | None = None,
     ) -> None:
-        self.except_list: defaultdict[Any, list] = defaultdict(list)
-        self.producer = None  # Producer를 클래스 속성으로 저장
-        self.producer_started = False
         self.partition_pol = partition_pol
+        self.send_mode = send_mode
+        self.on_delivery_error = on_delivery_error
         self.logger = AsyncLogger(target="kafka", folder="kafka")
+        # 같은 파티션 정책의 sender 는 스풀을 공유 (sender 를 새로 만들어도 유지)
+        self.spool = DiskSpool.open(type(partition_pol).__name__)
 
     # fmt: off
-    async def start_producer(self, topic: str, message: dict) -> None:
-        """Producer 시작 및 재사용"""
-        if not self.producer_started:
-            config = KafkaConfig(
-                bootstrap_servers=BOOTSTRAP_SERVER,
-                security_protocol=SECURITY_PROTOCOL,
-                max_batch_size=int(MAX_BATCH_SIZE),
-                max_request_size=int(MAX_REQUEST_SIZE),
-                partitioner=self.partition_pol,
-                acks=ARCKS,
-                value_serializer=lambda value: json.dumps(value, default=default).encode("utf-8"),
-                key_serializer=lambda value: json.dumps(value, default=default).encode("utf-8"),
-                enable_idempotence=True,
-                retry_backoff_ms=100,
-            )
-            self.producer = AIOKafkaProducer(**config)
-            try:
-                await self.producer.start()
-                self.producer_started = True
-            except (KafkaConnectionError, KafkaProtocolError) as e:
-                await self.logger.log_message(logging.ERROR, message=f"Producer 시작 실패: {e} 데이터 임시 저장합니다 -> {message}")
-                self.except_list[topic].append(message)  # 메시지 저장
-                
-    async def stop_producer(self) -> None:
-        """Producer 종료"""
-        if self.producer_started and self.producer is not None:
-            try:
-                await self.producer.stop()
-                self.producer_started = False
-            except (KafkaConnectionError, KafkaProtocolError) as e:
-                await self.logger.log_message(logging.ERROR, message=f"Producer 종료 실패: {e}")
+    def _spill(self, topic: str, key: Any, value: bytes) -> None:
+        """전송 실패 메시지 스풀에 저장"""
+        if not self.spool.append(SpoolRecord(topic, key, value)):
+            reason = "스풀이 이미 닫혀" if self.spool.closed else "스풀 디스크 예산 초과로"
+            self.logger.get_logger().error(f"{reason} 메시지를 버립니다 -> {topic} (거부 {self.spool.rejected})")
+
+    def _delivery_done(self, topic: str, key: Any, message: bytes, size: int, window: InFlightWindow, future: asyncio.Future) -> None:
+        """비동기 전송 결과 콜백 (윈도우 반환 및 실패 처리)"""
+        window.release(size)
+        if future.cancelled():
+            return
+        if (error := future.exception()) is not None:
+            self.logger.get_logger().error(f"전송 실패: {error}, 메시지 임시 저장합니다 -> {topic}")
+            self._spill(topic, key, message)
+            if self.on_delivery_error is not None:
+                self.on_delivery_error(topic, message, error)
+            return
+        # 브로커가 ack 했으므로 스풀에 저장된 메시지 재전송
+        self._schedule_replay()
 
+    async def _send_pipelined(self, producer: AIOKafkaProducer, message: bytes, topic: str, key: Any, size: int) -> None:
+        """ack 를 기다리지 않고 전송, 윈도우가 가득 찼을 때만 대기"""
+        window = KafkaProducerPool.window(self.partition_pol, compression_type(topic))
+        await window.acquire(size)
+        try:
+            future = await producer.send(topic=topic, value=message, key=key)
+        except BaseException:
+            window.release(size)
+            raise
+        future.add_done_callback(partial(self._delivery_done, topic, key, message, size, window))
+
+    async def _resend(self, record: SpoolRecord) -> None:
+        """스풀 레코드 재전송 (ack 확인 후 다음 레코드)"""
+        producer = await KafkaProducerPool.acquire(self.partition_pol, compression_type(record.topic))
+        await producer.send_and_wait(topic=record.topic, value=record.value, key=record.key)
+
+    async def _replay_spool(self) -> None:
+        try:
+            sent = await self.spool.replay(self._resend)
+            await self.logger.log_message(logging.INFO, message=f"스풀 재전송 완료: {sent} 건")
+        except KafkaError as resend_error:
+            # 남은 레코드는 체크포인트 이후부터 다음 성공 전송 때 다시 재전송
+            await self.logger.log_message(logging.ERROR, message=f"재전송 실패: {resend_error}")
+
+    def _schedule_replay(self) -> None:
+        """스풀에 남은 메시지가 있으면 재전송 태스크 시작 (스풀당 하나)"""
+        if not self.spool.closed and self.spool.pending and (self.spool.replaying is None or self.spool.replaying.done()):
+            self.spool.replaying = asyncio.create_task(self._replay_spool())
 
     async def produce_sending(self, message: dict, topic: str, key: bytes) -> None:
-        await self.start_producer(topic, message)
+        value: bytes = serialize(message)
+        try:
+            producer = await KafkaProducerPool.acquire(self.partition_pol, compression_type(topic))
+        except KafkaError as e:
+            await self.logger.log_message(logging.ERROR, message=f"Producer 시작 실패: {e} 데이터 임시 저장합니다 -> {topic}")
+            self._spill(topic, key, value)  # 메시지 저장
+            return
 
         try:
-            # 로그는 실제 전송할 메시지와는 별도로 기록
-            size: int = len(json.dumps(message, default=default).encode("utf-8"))
+            # 크기는 실제 전송할 bytes 기준
+            size: int = len(value)
             log_message = f"Message to: {topic} --> size: {size} bytes"
             try:
                 await self.logger.log_message(logging.INFO, message=log_message)
             except Exception as log_error:
                 print(f"Logging 실패: {log_error}")
 
-            # 실제 메시지 전송
-            await self.producer.send_and_wait(
-                topic=topic, value=message, key=key
-            )
+            # 실제 메시지 전송 (async 는 버퍼에 넣기만 하므로 재전송은 ack 콜백에서 시작)
+            if self.send_mode == "async":
+                await self._send_pipelined(producer, value, topic, key, size)
+            else:
+                await producer.send_and_wait(
+                    topic=topic, value=value, key=key
+                )
+                # ack 를 받았으므로 스풀에 저장된 메시지 재전송
+                self._schedule_replay()
 
-            # 예외 상황에서 저장된 메시지 재전송
-            retry_count = 0
-            max_retries = 5
-            while self.except_list[topic] and retry_count < max_retries:
-                stored_message = self.except_list[topic].pop(0)
-                try:
-                    await self.producer.send_and_wait(topic, stored_message)
-                except (KafkaConnectionError, KafkaProtocolError) as resend_error:
-                    await self.logger.log_message(logging.ERROR, message=f"재전송 실패: {resend_error}")
-                    self.except_list[topic].append(stored_message)
-                    retry_count += 1
-
-        except (NoBrokersAvailable, KafkaProtocolError, KafkaConnectionError) as kafka_error:
+        except KafkaError as kafka_error:
             error_message = f"Kafka broker error: {kafka_error}, 메시지 임시 저장합니다."
             await self.logger.log_message(logging.ERROR, message=error_message)
-            self.except_list[topic].append(message)  # 메시지 저장
-
-        finally:
-            await self.stop_producer()
+            self._spill(topic, key, value)  # 메시지 저장
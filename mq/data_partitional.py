@@ -1,7 +1,30 @@
-from kafka.partitioner.default import DefaultPartitioner, murmur2
+"""
+카프카 파티셔너
+
+- 파티셔너는 레코드마다 호출되므로 키 해석 결과를 미리 계산해 둠
+- CoinSocketDataCustomPartition: 직렬화된 키 bytes -> 파티션 라우팅 테이블 (거래소 매핑 x 소켓 타입 x 심볼)
+  - 매핑이 없는 키(오류 요약, 통합 BBO 등)는 murmur2 키 해시로 배정
+- CoinSymbolShardPartition: (거래소, 심볼) 을 토픽의 전체 파티션에 고르게 분산 (urls.conf [PARTITION] mode = symbol)
+- CoinHashingCustomPartitional: (키 bytes, 파티션 수) -> murmur2 결과 LRU 캐시
+- 오류 경로에서만 로그 기록 (stdout 출력 없음)
+"""
 
-from typing import Optional, TypedDict
 import random
+from functools import lru_cache
+from typing import ClassVar, Optional, TypedDict
+
+from kafka.partitioner.default import DefaultPartitioner, murmur2
+
+from common.utils.json_codec import codec
+from common.utils.logger import AsyncLogger
+from common.setting.properties import PARTITION_MODE
+
+SOCKET_TYPES: tuple[str, ...] = ("ticker", "orderbook")
+
+# 라우팅 테이블에서 "거래소 매핑이 없는 키" 표시 (키 해시로 배정)
+UNROUTED = -1
+
+logger = AsyncLogger(target="kafka", folder="partition")
 
 
 class ExchangeMapping(TypedDict):
@@ -27,6 +50,17 @@ class NEPartitionMapping(TypedDict):
     kraken: ExchangeMapping
 
 
+def key_bytes(key: str | bytes) -> bytes:
+    """Producer 의 key_serializer 와 같은 방식으로 직렬화한 키"""
+    return key if isinstance(key, bytes) else codec.dumps(key)
+
+
+@lru_cache(maxsize=4096)
+def hashed_partition(key: bytes, partition_count: int) -> int:
+    """murmur2(key) % 파티션 수 (키마다 한 번만 계산)"""
+    return (murmur2(key) & 0x7FFFFFF) % partition_count
+
+
 class CoinHashingCustomPartitional(DefaultPartitioner):
     """가상화폐 특정 파티션"""
 
@@ -47,20 +81,14 @@ class CoinHashingCustomPartitional(DefaultPartitioner):
             if key is not None:
                 if isinstance(key, str):
                     key = key.encode("utf-8")  # 문자열을 bytes로 변환
-                # 키 해싱 하여 파티션 선택
-                hashed_key: int = murmur2(key)
-                hashed_key &= 0x7FFFFFF
-
-                # hash(key) % 파티션 개수
-                partition_idx: int = hashed_key % len(all_partitions)
-                print(f"{key} --> {partition_idx}")
-                return all_partitions[partition_idx]  # 해싱된 값이 따라서 파티션 적재
+                # hash(key) % 파티션 개수 (해싱 결과는 캐시)
+                return all_partitions[hashed_partition(key, len(all_partitions))]
 
             return super().__call__(
                 key=key, all_partitions=all_partitions, available=available
             )
         except Exception as e:
-            print(f"파티션 오류 {key}: {e}")
+            logger.get_logger().error(f"파티션 오류 {key}: {e}")
             return random.choice(all_partitions)
 
 
@@ -86,42 +114,143 @@ class CoinSocketDataCustomPartition(DefaultPartitioner):
         kraken=ExchangeMapping(ticker=1, orderbook=1),
     )
 
+    # 직렬화된 키 bytes -> 파티션 (처음 호출될 때 구성, 처음 보는 키는 해석 후 추가)
+    _routes: ClassVar[dict[bytes, int] | None] = None
+
+    @classmethod
+    def exchange_mapping(cls) -> dict[str, ExchangeMapping]:
+        return {
+            **cls.KOREA_PARTITION_MAPPING,
+            **cls.ASIA_PARTITION_MAPPING,
+            **cls.NE_PARTITION_MAPPING,
+        }
+
+    @staticmethod
+    def parse_key(key: str | bytes) -> tuple[str, str, str]:
+        """키 -> (거래소, 소켓 타입, 심볼), 키 형식: "{MARKET}:{socket_type}-{symbol}" """
+        decoded_key = key.decode() if isinstance(key, bytes) else key
+        ex_keys = decoded_key.split(":")
+        exchange = ex_keys[0].strip('"').lower()
+        data_type, _, symbol = ex_keys[1].strip('"').partition("-")
+        return exchange, data_type.lower(), symbol.upper()
+
+    @classmethod
+    def route(cls, key: str | bytes) -> int:
+        """키를 해석해 파티션 계산 (라우팅 테이블에 없는 키만 사용)
+
+        Raises:
+            ValueError: 알 수 없는 거래소 또는 소켓 타입
+        """
+        exchange, data_type, _ = cls.parse_key(key)
+
+        mapping = cls.exchange_mapping()
+        if exchange not in mapping:
+            raise ValueError(f"Unknown exchange: {exchange}")
+        if data_type not in SOCKET_TYPES:
+            raise ValueError(f"Unknown data type: {data_type}")
+        return mapping[exchange][data_type]
+
+    @classmethod
+    def build_routes(cls, symbols: list[str]) -> dict[bytes, int]:
+        """거래소 매핑 x 소켓 타입 x 심볼 라우팅 테이블"""
+        keys = [
+            key_bytes(f"{exchange.upper()}:{data_type}-{symbol}")
+            for exchange in cls.exchange_mapping()
+            for data_type in SOCKET_TYPES
+            for symbol in [*symbols, "ALL"]
+        ]
+        return {key: cls.route(key) for key in keys}
+
+    @classmethod
+    def routes(cls) -> dict[bytes, int]:
+        if cls._routes is None:
+            # config 가 소켓 클라이언트 -> 카프카 모듈을 import 하므로 순환 import 를 피해 첫 호출 시 로드
+            from config.yml_param_load import symbol_json
+
+            cls._routes = cls.build_routes(symbol_json())
+        return cls._routes
+
+    @classmethod
+    def select(cls, route: int, all_partitions: list[int], available: list[int]) -> int:
+        """라우팅 값 -> 파티션"""
+        if route in available:
+            return route
+        # 해당 파티션이 사용 불가능할 경우 fallback
+        return available[0]
+
     @classmethod
     def __call__(cls, key: str, all_partitions: list[int], available: list[int]) -> int:
-        try:
-            decoded_key = key.decode() if isinstance(key, bytes) else key
-            ex_keys = decoded_key.split(":")
-            exchange = ex_keys[0].strip('"').lower()
-            data_type = ex_keys[1].strip('"').lower().split("-")[0]
-
-            match exchange:
-                case exchange if exchange in cls.KOREA_PARTITION_MAPPING:
-                    partition_mapping = cls.KOREA_PARTITION_MAPPING[exchange]
-
-                case exchange if exchange in cls.NE_PARTITION_MAPPING:
-                    partition_mapping = cls.NE_PARTITION_MAPPING[exchange]
-
-                case exchange if exchange in cls.ASIA_PARTITION_MAPPING:
-                    partition_mapping = cls.ASIA_PARTITION_MAPPING[exchange]
-
-                case _:
-                    raise ValueError(f"Unknown exchange: {exchange}")
-
-            match data_type:
-                case "ticker" | "orderbook":
-                    partition = partition_mapping[data_type]
-                case _:
-                    raise ValueError(f"Unknown data type: {data_type}")
-
-            if partition in available:
-                return partition
-            else:
-                # 해당 파티션이 사용 불가능할 경우 fallback
-                return available[0]
-
-        except (ValueError, IndexError) as e:
-            print(f"파티션 오류 {key}: {e}")
-            return random.choice(all_partitions)
-        except Exception as e:
-            print(f"예외 발생 {key}: {e}")
-            return random.choice(all_partitions)
+        routes = cls.routes()
+        route = routes.get(key)
+        if route is None:
+            try:
+                route = cls.route(key)
+            except ValueError:
+                # 소켓 데이터가 아닌 정상 키 ("{market}:error-{symbol}", "ALL:bbo-{symbol}" 등)
+                route = UNROUTED
+            except (IndexError, AttributeError) as e:
+                logger.get_logger().error(f"파티션 오류 {key}: {e}")
+                return random.choice(all_partitions)
+            routes[key_bytes(key)] = route
+        if route == UNROUTED:
+            # 같은 키는 항상 같은 파티션 (키 단위 순서 유지)
+            return all_partitions[hashed_partition(key_bytes(key), len(all_partitions))]
+        return cls.select(route, all_partitions, available)
+
+
+class CoinSymbolShardPartition(CoinSocketDataCustomPartition):
+    """(거래소, 심볼) 단위 파티션 분산
+
+    - 설정된 심볼은 (심볼 순서 x 지역 안 거래소 순서) 로 번호를 매겨 파티션에 고르게 배치
+      (새 심볼은 _market_symbol.yml 목록 끝에 추가해야 기존 배정이 유지됨)
+    - 그 밖의 키는 murmur2("거래소:심볼") 로 배정
+    - 라우팅 값을 토픽의 파티션 수로 나눈 나머지가 파티션
+    - 같은 (거래소, 심볼) 은 파티션 수가 바뀌지 않는 한 항상 같은 파티션 -> 쌍 단위 순서 보장
+    - 거래소 수가 아니라 파티션 수만큼 컨슈머 병렬 처리 가능
+    """
+
+    _routes: ClassVar[dict[bytes, int] | None] = None
+
+    @classmethod
+    def build_routes(cls, symbols: list[str]) -> dict[bytes, int]:
+        routes = super().build_routes(symbols)
+        for mapping in (cls.KOREA_PARTITION_MAPPING, cls.ASIA_PARTITION_MAPPING, cls.NE_PARTITION_MAPPING):
+            for symbol_index, symbol in enumerate(symbols):
+                for exchange_index, exchange in enumerate(mapping):
+                    for data_type in SOCKET_TYPES:
+                        key = key_bytes(f"{exchange.upper()}:{data_type}-{symbol}")
+                        routes[key] = symbol_index * len(mapping) + exchange_index
+        return routes
+
+    @classmethod
+    def route(cls, key: str | bytes) -> int:
+        exchange, data_type, symbol = cls.parse_key(key)
+        if exchange not in cls.exchange_mapping():
+            raise ValueError(f"Unknown exchange: {exchange}")
+        if data_type not in SOCKET_TYPES:
+            raise ValueError(f"Unknown data type: {data_type}")
+        return murmur2(f"{exchange}:{symbol}".encode("utf-8")) & 0x7FFFFFFF
+
+    @classmethod
+    def select(cls, route: int, all_partitions: list[int], available: list[int]) -> int:
+        partition = all_partitions[route % len(all_partitions)]
+        if partition in available:
+            return partition
+        # 사용 불가능한 동안에는 가용 파티션 안에서 분산
+        return available[route % len(available)]
+
+    @classmethod
+    def partition_count(cls, exchanges: int, symbols: list[str], max_partitions: int) -> int:
+        """지역 토픽 파티션 수 ((거래소, 심볼) 쌍마다 하나, max_partitions 이하)"""
+        return max(1, min(exchanges * len(symbols), max_partitions))
+
+
+PARTITIONERS: dict[str, type[CoinSocketDataCustomPartition]] = {
+    "exchange": CoinSocketDataCustomPartition,
+    "symbol": CoinSymbolShardPartition,
+}
+
+
+def socket_partitioner(mode: str = PARTITION_MODE) -> CoinSocketDataCustomPartition:
+    """소켓 데이터 파티셔너 (exchange: 거래소별 고정 파티션, symbol: (거래소, 심볼) 분산)"""
+    return PARTITIONERS.get(mode.lower(), CoinSocketDataCustomPartition)()
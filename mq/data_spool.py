@@ -0,0 +1,296 @@
+"""
+전송 실패 메시지 디스크 스풀
+
+- 브로커 장애 중 전송하지 못한 (토픽, 키, 값) 을 세그먼트 파일에 append-only 로 저장
+- 브로커가 돌아오면 저장된 순서대로 초당 replay_rate 건으로 재전송하고 체크포인트 기록
+- 디스크 예산(max_bytes)을 넘으면 eviction 정책에 따라 오래된 세그먼트 삭제(drop_oldest) 또는 새 메시지 거부(drop_newest)
+- 프로세스 재시작 후에도 남은 메시지를 이어서 재전송 (at-least-once, 체크포인트 이후 구간은 중복 전송될 수 있음)
+- 같은 디렉터리를 두 프로세스가 쓰지 않도록 slot 디렉터리를 flock 으로 점유
+
+레코드 포맷:
+    crc32(4) | topic 길이(4) | key 길이(4, -1 = None) | value 길이(4) | topic | key | value
+"""
+
+import os
+import zlib
+import fcntl
+import struct
+import asyncio
+from pathlib import Path
+from itertools import count
+from typing import Awaitable, Callable, ClassVar, Iterator, NamedTuple, TextIO
+
+from common.setting.properties import (
+    SPOOL_PATH,
+    SPOOL_SEGMENT_BYTES,
+    SPOOL_MAX_BYTES,
+    SPOOL_EVICTION,
+    SPOOL_REPLAY_RATE,
+)
+
+HEADER = struct.Struct(">IIiI")
+CHECKPOINT = "checkpoint"
+
+
+class SpoolRecord(NamedTuple):
+    topic: str
+    key: str | None
+    value: bytes
+
+
+class SpoolPosition(NamedTuple):
+    segment: int
+    offset: int
+
+
+def encode_record(record: SpoolRecord) -> bytes:
+    topic = record.topic.encode("utf-8")
+    key = record.key.encode("utf-8") if record.key is not None else b""
+    body = topic + key + record.value
+    header = HEADER.pack(
+        zlib.crc32(body),
+        len(topic),
+        len(key) if record.key is not None else -1,
+        len(record.value),
+    )
+    return header + body
+
+
+def read_record(file) -> tuple[SpoolRecord, int] | None:
+    """파일 현재 위치에서 레코드 하나 읽기 (끝이거나 잘린/손상된 레코드면 None)"""
+    header = file.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    crc, topic_len, key_len, value_len = HEADER.unpack(header)
+    body_len = topic_len + max(key_len, 0) + value_len
+    body = file.read(body_len)
+    if len(body) < body_len or zlib.crc32(body) != crc:
+        return None
+
+    topic = body[:topic_len].decode("utf-8")
+    key = body[topic_len:topic_len + key_len].decode("utf-8") if key_len >= 0 else None
+    value = body[topic_len + max(key_len, 0):]
+    return SpoolRecord(topic, key, value), HEADER.size + body_len
+
+
+class DiskSpool:
+    """세그먼트 파일 기반 스풀 (slot 디렉터리 하나)"""
+
+    _spools: ClassVar[dict[str, "DiskSpool"]] = {}
+
+    def __init__(
+        self,
+        directory: Path,
+        lock: TextIO,
+        segment_bytes: int = int(SPOOL_SEGMENT_BYTES),
+        max_bytes: int = int(SPOOL_MAX_BYTES),
+        eviction: str = SPOOL_EVICTION,
+    ) -> None:
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self.eviction = eviction
+        self._lock = lock
+
+        self.segments: list[int] = sorted(int(path.stem) for path in directory.glob("*.seg"))
+        self.sizes: dict[int, int] = {}
+        if not self.segments:
+            self.segments.append(0)
+        self._recover_tail()
+        for segment in self.segments:
+            self.sizes[segment] = self._path(segment).stat().st_size if self._path(segment).exists() else 0
+
+        self.checkpoint = self._read_checkpoint()
+        self._writer = open(self._path(self.segments[-1]), "ab")
+        self.replaying: asyncio.Task | None = None
+
+        self.appended = 0
+        self.replayed = 0
+        self.rejected = 0
+        self.evicted_bytes = 0
+        self.evicted_segments = 0
+
+    # fmt: off
+    @classmethod
+    def open(cls, name: str, root: str = SPOOL_PATH) -> "DiskSpool":
+        """이름별 스풀 (프로세스 안에서는 공유, 프로세스 간에는 비어 있는 slot 점유)"""
+        if name in cls._spools:
+            return cls._spools[name]
+
+        for slot in count():
+            directory = Path(root) / name / f"slot-{slot}"
+            directory.mkdir(parents=True, exist_ok=True)
+            lock = open(directory / ".lock", "w")
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock.close()
+                continue
+            cls._spools[name] = cls(directory, lock)
+            return cls._spools[name]
+
+    @classmethod
+    async def stop_replays(cls) -> None:
+        """모든 스풀의 재전송 중단 (체크포인트는 replay 가 기록, 파일은 계속 append 가능)"""
+        for spool in cls._spools.values():
+            await spool.stop_replay()
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """재전송 중단, 체크포인트 기록 후 파일 정리"""
+        spools, cls._spools = cls._spools, {}
+        for spool in spools.values():
+            await spool.close()
+
+    def _path(self, segment: int) -> Path:
+        return self.directory / f"{segment:012d}.seg"
+
+    def _recover_tail(self) -> None:
+        """마지막 세그먼트 끝의 잘린 레코드 제거 (쓰는 도중 종료된 경우)"""
+        path = self._path(self.segments[-1])
+        if not path.exists():
+            return
+        valid = 0
+        with open(path, "rb") as file:
+            while (result := read_record(file)) is not None:
+                valid += result[1]
+        if valid < path.stat().st_size:
+            os.truncate(path, valid)
+
+    def _read_checkpoint(self) -> SpoolPosition:
+        try:
+            segment, offset = (self.directory / CHECKPOINT).read_text().split()
+            position = SpoolPosition(int(segment), int(offset))
+        except (FileNotFoundError, ValueError):
+            position = SpoolPosition(self.segments[0], 0)
+        return self._clamp(position)
+
+    def _clamp(self, position: SpoolPosition) -> SpoolPosition:
+        """삭제된 세그먼트를 가리키면 남아 있는 가장 오래된 세그먼트 처음으로"""
+        if position.segment < self.segments[0]:
+            return SpoolPosition(self.segments[0], 0)
+        return position
+
+    @property
+    def size(self) -> int:
+        return sum(self.sizes.values())
+
+    @property
+    def closed(self) -> bool:
+        return self._writer.closed
+
+    @property
+    def pending(self) -> bool:
+        """재전송할 레코드가 남아 있는지"""
+        last = self.segments[-1]
+        return self.checkpoint.segment < last or self.checkpoint.offset < self.sizes[last]
+
+    def _rotate(self) -> None:
+        self._writer.close()
+        segment = self.segments[-1] + 1
+        self.segments.append(segment)
+        self.sizes[segment] = 0
+        self._writer = open(self._path(segment), "ab")
+
+    def _evict_oldest(self) -> None:
+        """가장 오래된 세그먼트 삭제 (쓰는 중인 세그먼트면 먼저 교체)"""
+        if len(self.segments) == 1:
+            self._rotate()
+        segment = self.segments.pop(0)
+        self.evicted_bytes += self.sizes.pop(segment)
+        self.evicted_segments += 1
+        self._path(segment).unlink(missing_ok=True)
+        self.commit(self.checkpoint)
+
+    def append(self, record: SpoolRecord) -> bool:
+        """레코드 저장 (디스크 예산 초과 또는 이미 닫힌 스풀이라 거부되면 False)"""
+        frame = encode_record(record)
+        if self.closed or len(frame) > self.max_bytes:
+            self.rejected += 1
+            return False
+
+        while self.size + len(frame) > self.max_bytes:
+            if self.eviction == "drop_newest":
+                self.rejected += 1
+                return False
+            self._evict_oldest()
+
+        if self.sizes[self.segments[-1]] >= self.segment_bytes:
+            self._rotate()
+        # 프로세스가 죽어도 남도록 OS 버퍼까지 flush
+        self._writer.write(frame)
+        self._writer.flush()
+        self.sizes[self.segments[-1]] += len(frame)
+        self.appended += 1
+        return True
+
+    def records(self) -> Iterator[tuple[SpoolRecord, SpoolPosition]]:
+        """체크포인트부터 저장 순서대로 (레코드, 다음 위치)"""
+        position = self.checkpoint
+        while True:
+            path = self._path(position.segment)
+            if path.exists():
+                with open(path, "rb") as file:
+                    file.seek(position.offset)
+                    while (result := read_record(file)) is not None:
+                        record, length = result
+                        position = SpoolPosition(position.segment, position.offset + length)
+                        yield record, position
+
+            following = [segment for segment in self.segments if segment > position.segment]
+            if not following:
+                return
+            position = SpoolPosition(following[0], 0)
+
+    def commit(self, position: SpoolPosition) -> None:
+        """체크포인트 기록 후 다 보낸 세그먼트 삭제"""
+        position = self._clamp(position)
+        for segment in [segment for segment in self.segments[:-1] if segment < position.segment]:
+            self.segments.remove(segment)
+            self.sizes.pop(segment)
+            self._path(segment).unlink(missing_ok=True)
+
+        temp = self.directory / f"{CHECKPOINT}.tmp"
+        temp.write_text(f"{position.segment} {position.offset}")
+        os.replace(temp, self.directory / CHECKPOINT)
+        self.checkpoint = position
+
+    async def replay(
+        self,
+        send: Callable[[SpoolRecord], Awaitable[None]],
+        rate: float = float(SPOOL_REPLAY_RATE),
+        commit_every: int = 100,
+    ) -> int:
+        """저장된 레코드를 초당 rate 건으로 재전송
+
+        - send 가 예외를 던지면 중단하고, 마지막으로 성공한 위치까지 체크포인트
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = 0
+        position: SpoolPosition | None = None
+        try:
+            for record, next_position in self.records():
+                await send(record)
+                position = next_position
+                sent += 1
+                self.replayed += 1
+                if sent % commit_every == 0:
+                    self.commit(position)
+                if rate > 0 and (delay := start + sent / rate - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            if position is not None:
+                self.commit(position)
+        return sent
+
+    async def stop_replay(self) -> None:
+        if self.replaying is not None:
+            self.replaying.cancel()
+            await asyncio.gather(self.replaying, return_exceptions=True)
+            self.replaying = None
+
+    async def close(self) -> None:
+        await self.stop_replay()
+        self._writer.close()
+        self._lock.close()
@@ -8,7 +8,7 @@ from config.yml_param_load import SocketMarketLoader
 class CoinPresentPriceWebsocket(PriceWebSocketClient):
     def __init__(
         self,
-        symbol: str,
+        symbol: str | list[str],
         location: str,
         market: str = "all",
     ) -> None:
@@ -19,7 +19,7 @@ class CoinPresentPriceWebsocket(PriceWebSocketClient):
 class CoinOrderBookWebsocket(OrderBookWebSocketClient):
     def __init__(
         self,
-        symbol: str,
+        symbol: str | list[str],
         location: str,
         market: str = "all",
     ) -> None:
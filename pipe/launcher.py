@@ -0,0 +1,35 @@
+"""
+파이프라인 실행기
+
+- 모든 실행 진입점(socket_ticker, socket_order, rest_test, supervisor worker)이 사용
+- urls.conf [RUNTIME] event_loop = uvloop 이고 설치되어 있으면 uvloop 로 실행
+"""
+
+import asyncio
+from typing import Any, Callable, Coroutine, TypeVar
+
+from common.setting.properties import EVENT_LOOP
+
+T = TypeVar("T")
+
+
+def loop_factory(event_loop: str = EVENT_LOOP) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """이벤트 루프 생성 함수 (None 이면 기본 asyncio 루프)"""
+    if event_loop.lower() == "uvloop":
+        try:
+            import uvloop
+        except ImportError:
+            return None
+        return uvloop.new_event_loop
+    return None
+
+
+def loop_name(event_loop: str = EVENT_LOOP) -> str:
+    """실제로 사용될 이벤트 루프 이름"""
+    return "uvloop" if loop_factory(event_loop) is not None else "asyncio"
+
+
+def run(main: Coroutine[Any, Any, T], event_loop: str = EVENT_LOOP) -> T:
+    """설정된 이벤트 루프로 코루틴 실행 (asyncio.run 대체)"""
+    with asyncio.Runner(loop_factory=loop_factory(event_loop)) as runner:
+        return runner.run(main)
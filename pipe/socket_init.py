@@ -1,6 +1,7 @@
 import asyncio
 from typing import Union
 from pipe.connection import CoinOrderBookWebsocket, CoinPresentPriceWebsocket
+from config.yml_param_load import ticker_projections, symbol_json
 
 # 타입 힌트 개선
 # Union 형태로 명시적 표현
@@ -8,19 +9,23 @@ ConnectionType = Union[CoinOrderBookWebsocket, CoinPresentPriceWebsocket]
 
 
 async def run_coin_websocket(
-    connection_class: ConnectionType, symbol: str, location: str
+    connection_class: ConnectionType,
+    symbol: str | list[str],
+    location: str,
+    market: str = "all",
 ) -> None:
     """지정된 웹소켓 클라이언트로 시장 데이터 수집
 
     Args:
         connection_class: 웹소켓 연결 클래스
-        symbol: 암호화폐 심볼 (예: BTC)
+        symbol: 암호화폐 심볼 또는 심볼 목록 (예: BTC, ["BTC", "ETH"])
         location: 지역 위치 (예: korea, asia, ne)
+        market: 거래소 이름 (기본값 all 이면 지역 내 모든 거래소)
 
     Returns:
         None
     """
-    websocket_client = connection_class(symbol=symbol, location=location, market="all")
+    websocket_client = connection_class(symbol=symbol, location=location, market=market)
     await websocket_client.start()
 
 
@@ -37,16 +42,33 @@ async def coin_present_websocket(connection_class: ConnectionType) -> None:
     """
     # 지역 목록 정의
     locations = ["korea", "asia", "ne"]
-    symbol = "BTC"  # 상수를 변수로 분리하여 가독성 향상
+    # 거래소별 연결 하나에 모든 심볼을 구독 (config/_market_symbol.yml)
+    symbol = symbol_json()
 
     # 각 지역별 태스크 생성
     tasks = [
         run_coin_websocket(connection_class, symbol, location) for location in locations
     ]
 
+    # 티커 컬럼 파일 변경 시 소켓 재시작 없이 projection 재로딩
+    watcher = asyncio.create_task(ticker_projections.watch())
+
     # 모든 태스크 동시 실행
-    await asyncio.gather(*tasks, return_exceptions=False)
+    try:
+        await asyncio.gather(*tasks, return_exceptions=False)
+    finally:
+        watcher.cancel()
 
 
 if __name__ == "__main__":
-    asyncio.run(coin_present_websocket(CoinOrderBookWebsocket))
+    from pipe.launcher import run
+    from mq.data_interaction import KafkaProducerPool
+    from mq.data_partitional import socket_partitioner
+    from common.client.market_rest.async_api_client import HttpSessionPool
+
+    async def main() -> None:
+        # 종료 시 Producer 배치 / HTTP 세션을 정리하도록 socket_order.py 와 같은 lifespan 안에서 실행
+        async with KafkaProducerPool.lifespan(socket_partitioner()), HttpSessionPool.lifespan():
+            await coin_present_websocket(CoinOrderBookWebsocket)
+
+    run(main())
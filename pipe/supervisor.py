@@ -0,0 +1,238 @@
+"""
+소켓 샤딩 Supervisor
+
+- (거래소, 심볼) 구독을 여러 worker 프로세스로 분산 (프로세스마다 이벤트 루프 + 카프카 Producer)
+- rendezvous hashing 으로 배정하므로 재시작해도 같은 심볼은 같은 worker 로 감
+- worker 는 주기적으로 heartbeat 를 보내고, 죽거나 응답이 없으면 같은 배정으로 재시작
+"""
+
+import time
+import queue
+import signal
+import asyncio
+import hashlib
+import logging
+import multiprocessing as mp
+from collections import defaultdict
+from multiprocessing.process import BaseProcess
+from typing import TypedDict
+
+from config.yml_param_load import SocketMarketLoader
+from mq.data_interaction import KafkaProducerPool
+from common.client.market_rest.async_api_client import HttpSessionPool
+from mq.data_partitional import socket_partitioner
+from pipe.connection import CoinOrderBookWebsocket, CoinPresentPriceWebsocket
+from pipe.socket_init import run_coin_websocket
+from pipe.launcher import run
+from common.utils.logger import AsyncLogger
+from common.setting.properties import (
+    SHARD_WORKERS,
+    SHARD_HEARTBEAT_INTERVAL,
+    SHARD_HEARTBEAT_TIMEOUT,
+)
+
+CONNECTION_CLASSES = {
+    "ticker": CoinPresentPriceWebsocket,
+    "orderbook": CoinOrderBookWebsocket,
+}
+
+
+class ShardAssignment(TypedDict):
+    location: str
+    market: str
+    symbols: list[str]
+
+
+class ShardHealth(TypedDict):
+    pid: int | None
+    last_seen: float
+    restarts: int
+
+
+def shard_of(market: str, symbol: str, workers: int) -> int:
+    """(거래소, 심볼) 을 담당할 worker 번호 (rendezvous hashing)
+
+    - 프로세스/재시작과 무관하게 항상 같은 결과
+    - worker 수가 바뀌어도 옮겨지는 심볼이 최소화됨
+    """
+    key = f"{market.lower()}:{symbol.upper()}"
+    return max(
+        range(workers),
+        key=lambda worker: hashlib.md5(f"{key}#{worker}".encode("utf-8")).digest(),
+    )
+
+
+def shard_plan(
+    symbols: list[str], locations: list[str], workers: int
+) -> dict[int, list[ShardAssignment]]:
+    """worker 별 (지역, 거래소, 심볼 목록) 배정
+
+    - 같은 worker 안에서는 거래소별로 심볼을 묶어 연결 하나로 다중 구독
+    """
+    grouped: defaultdict[int, defaultdict[tuple[str, str], list[str]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for location in locations:
+        for market in SocketMarketLoader(location=location).load_json():
+            for symbol in symbols:
+                worker = shard_of(market, symbol, workers)
+                grouped[worker][(location, market)].append(symbol)
+
+    return {
+        worker: [
+            ShardAssignment(location=location, market=market, symbols=shard_symbols)
+            for (location, market), shard_symbols in sorted(assignments.items())
+        ]
+        for worker, assignments in sorted(grouped.items())
+    }
+
+
+async def heartbeat(shard_id: int, health: mp.Queue, interval: float) -> None:
+    """supervisor 로 상태 보고"""
+    while True:
+        health.put_nowait((shard_id, mp.current_process().pid, time.time()))
+        await asyncio.sleep(interval)
+
+
+async def shard_main(
+    shard_id: int,
+    assignments: list[ShardAssignment],
+    socket_type: str,
+    health: mp.Queue,
+    interval: float,
+) -> None:
+    """worker 프로세스의 이벤트 루프 본체"""
+    # SIGTERM 을 받으면 태스크 취소 -> Producer flush 후 종료
+    main_task = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+
+    connection_class = CONNECTION_CLASSES[socket_type]
+    async with KafkaProducerPool.lifespan(socket_partitioner()), HttpSessionPool.lifespan():
+        beat = asyncio.create_task(heartbeat(shard_id, health, interval))
+        try:
+            await asyncio.gather(
+                *(
+                    run_coin_websocket(
+                        connection_class,
+                        symbol=assignment["symbols"],
+                        location=assignment["location"],
+                        market=assignment["market"],
+                    )
+                    for assignment in assignments
+                )
+            )
+        finally:
+            beat.cancel()
+
+
+def run_shard(
+    shard_id: int,
+    assignments: list[ShardAssignment],
+    socket_type: str,
+    health: mp.Queue,
+    interval: float,
+) -> None:
+    """worker 프로세스 시작점"""
+    try:
+        run(shard_main(shard_id, assignments, socket_type, health, interval))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+class ShardSupervisor:
+    """worker 프로세스 생성/감시/재시작"""
+
+    def __init__(
+        self,
+        socket_type: str,
+        symbols: list[str],
+        locations: list[str] | None = None,
+        workers: int = int(SHARD_WORKERS),
+        heartbeat_interval: float = float(SHARD_HEARTBEAT_INTERVAL),
+        heartbeat_timeout: float = float(SHARD_HEARTBEAT_TIMEOUT),
+    ) -> None:
+        self.socket_type = socket_type
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.plan = shard_plan(symbols, locations or ["korea", "asia", "ne"], workers)
+
+        self._ctx = mp.get_context("spawn")
+        self.health_queue: mp.Queue = self._ctx.Queue()
+        self.processes: dict[int, BaseProcess] = {}
+        self.health: dict[int, ShardHealth] = {}
+        self.logger = AsyncLogger(target="supervisor", folder="shard")
+
+    def spawn(self, shard_id: int) -> None:
+        """배정표대로 worker 프로세스 시작"""
+        process = self._ctx.Process(
+            target=run_shard,
+            name=f"shard-{shard_id}",
+            args=(
+                shard_id,
+                self.plan[shard_id],
+                self.socket_type,
+                self.health_queue,
+                self.heartbeat_interval,
+            ),
+            daemon=True,
+        )
+        process.start()
+        self.processes[shard_id] = process
+
+        restarts = self.health[shard_id]["restarts"] + 1 if shard_id in self.health else 0
+        # 시작 직후에는 heartbeat 가 없으므로 시작 시각을 기준으로 감시
+        self.health[shard_id] = ShardHealth(pid=process.pid, last_seen=time.time(), restarts=restarts)
+
+        markets = ", ".join(f"{a['market']}({len(a['symbols'])})" for a in self.plan[shard_id])
+        self.logger.get_logger().info(f"shard-{shard_id} 시작 pid={process.pid} --> {markets}")
+
+    def collect_health(self) -> None:
+        """worker heartbeat 수집"""
+        while True:
+            try:
+                shard_id, pid, seen = self.health_queue.get_nowait()
+            except queue.Empty:
+                return
+            if shard_id in self.health and self.health[shard_id]["pid"] == pid:
+                self.health[shard_id]["last_seen"] = seen
+
+    def check(self) -> None:
+        """죽었거나 heartbeat 가 끊긴 worker 재시작"""
+        now = time.time()
+        for shard_id, process in list(self.processes.items()):
+            stale = now - self.health[shard_id]["last_seen"] > self.heartbeat_timeout
+            if process.is_alive() and not stale:
+                continue
+
+            reason = "응답 없음" if process.is_alive() else f"종료 코드 {process.exitcode}"
+            self.logger.get_logger().log(logging.ERROR, f"shard-{shard_id} {reason} --> 재시작")
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=self.heartbeat_interval)
+                if process.is_alive():
+                    process.kill()
+            self.spawn(shard_id)
+
+    def shutdown(self) -> None:
+        """모든 worker 종료 (SIGTERM -> Producer flush)"""
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes.values():
+            process.join(timeout=self.heartbeat_timeout)
+            if process.is_alive():
+                process.kill()
+
+    def run(self) -> None:
+        """supervisor 루프"""
+        for shard_id in self.plan:
+            self.spawn(shard_id)
+        try:
+            while True:
+                time.sleep(self.heartbeat_interval)
+                self.collect_health()
+                self.check()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
@@ -1,5 +1,7 @@
 """코인 Rest Resquest 설계 (국내)"""
 
+from typing import Iterator
+
 from common.core.types import ExchangeResponseData
 from common.client.market_rest.async_api_client import CoinExchangeRestClient
 
@@ -14,6 +16,16 @@ class OKXRest(CoinExchangeRestClient):
     def _get_ticker_url(self, coin_name: str) -> str:
         return f"{self._rest}/market/ticker?instId={coin_name.upper()}-USDT"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        # 현물 전체
+        return f"{self._rest}/market/tickers?instType=SPOT"
+
+    def _split_tickers(self, data: dict, coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data["data"]:
+            base, _, quote = ticker["instId"].partition("-")
+            if quote == "USDT":
+                yield base, ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         return data["data"][0]
@@ -29,6 +41,16 @@ class GateIORest(CoinExchangeRestClient):
     def _get_ticker_url(self, coin_name: str) -> str:
         return f"{self._rest}/tickers?currency_pair={coin_name.lower()}_usdt"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        # 현물 전체
+        return f"{self._rest}/tickers"
+
+    def _split_tickers(self, data: list[dict], coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data:
+            base, _, quote = ticker["currency_pair"].upper().partition("_")
+            if quote == "USDT":
+                yield base, ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         return data[0]
@@ -46,6 +68,15 @@ class BybitRest(CoinExchangeRestClient):
             f"{self._rest}/market/tickers?category=spot&symbol={coin_name.upper()}USDT"
         )
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        # 현물 전체
+        return f"{self._rest}/market/tickers?category=spot"
+
+    def _split_tickers(self, data: dict, coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data["result"]["list"]:
+            if ticker["symbol"].endswith("USDT"):
+                yield ticker["symbol"].removesuffix("USDT"), ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         return data["result"]["list"][0]
@@ -12,7 +12,7 @@ from common.setting.socket_parameter import (
 
 class CoinExchangeSocketClient(AbstractExchangeSocketClient):
     async def get_present_websocket(
-        self, symbol: str, req_type: str, socket_type: str
+        self, symbol: str | list[str], req_type: str, socket_type: str
     ) -> None:
         from protocols.connection.coin_socket import (
             AsiaWebsocketConnection as WCM,
@@ -33,12 +33,12 @@ class GateIOSocket(CoinExchangeSocketClient):
             target="gateio", location="asia", socket_parameter=gateio_socket_parameter
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="tickers", socket_type=self.ticker
         )
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="order_book", socket_type=self.orderbook
         )
@@ -50,12 +50,12 @@ class OKXSocket(CoinExchangeSocketClient):
             target="okx", location="asia", socket_parameter=okx_socket_parameter
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="tickers", socket_type=self.ticker
         )
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="books", socket_type=self.orderbook
         )
@@ -67,12 +67,12 @@ class ByBitSocket(CoinExchangeSocketClient):
             target="bybit", location="asia", socket_parameter=bybit_socket_parameter
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="tickers", socket_type=self.ticker
         )
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="orderbook", socket_type=self.orderbook
         )
@@ -4,6 +4,8 @@ import tracemalloc
 
 tracemalloc.start()
 
+from typing import Iterator
+
 from common.client.market_rest.async_api_client import CoinExchangeRestClient
 from common.core.types import ExchangeResponseData
 
@@ -18,6 +20,14 @@ class UpbitRest(CoinExchangeRestClient):
     def _get_ticker_url(self, coin_name: str) -> str:
         return f"{self._rest}/ticker?markets=KRW-{coin_name.upper()}"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        markets = ",".join(f"KRW-{coin_name.upper()}" for coin_name in coin_names)
+        return f"{self._rest}/ticker?markets={markets}"
+
+    def _split_tickers(self, data: list[dict], coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data:
+            yield ticker["market"].split("-")[1], ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         if data is None:
@@ -35,6 +45,14 @@ class BithumbRest(CoinExchangeRestClient):
     def _get_ticker_url(self, coin_name: str) -> str:
         return f"{self._rest}/ticker?markets=KRW-{coin_name.upper()}"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        markets = ",".join(f"KRW-{coin_name.upper()}" for coin_name in coin_names)
+        return f"{self._rest}/ticker?markets={markets}"
+
+    def _split_tickers(self, data: list[dict], coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data:
+            yield ticker["market"].split("-")[1], ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         if data is None:
@@ -52,6 +70,14 @@ class CoinoneRest(CoinExchangeRestClient):
     def _get_ticker_url(self, coin_name: str) -> str:
         return f"{self._rest}/ticker_new/KRW/{coin_name.upper()}?additional_data=true"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        # KRW 마켓 전체
+        return f"{self._rest}/ticker_new/KRW?additional_data=true"
+
+    def _split_tickers(self, data: dict, coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data["tickers"]:
+            yield ticker["target_currency"].upper(), ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         if data is None:
@@ -69,6 +95,14 @@ class KorbitRest(CoinExchangeRestClient):
     def _get_ticker_url(self, coin_name: str) -> str:
         return f"{self._rest}/tickers?symbol={coin_name.lower()}_krw"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        symbols = ",".join(f"{coin_name.lower()}_krw" for coin_name in coin_names)
+        return f"{self._rest}/tickers?symbol={symbols}"
+
+    def _split_tickers(self, data: dict, coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data["data"]:
+            yield ticker["symbol"].split("_")[0].upper(), ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         if data is None:
@@ -11,7 +11,7 @@ from common.setting.socket_parameter import (
 
 
 class CoinExchangeSocketConnection(AbstractExchangeSocketClient):
-    async def get_present_websocket(self, symbol: str, socket_type: str) -> None:
+    async def get_present_websocket(self, symbol: str | list[str], socket_type: str) -> None:
         from protocols.connection.coin_socket import (
             KoreaWebsocketConnection as WCM,
         )
@@ -33,10 +33,10 @@ class UpbitSocket(CoinExchangeSocketConnection):
             socket_parameter=upbithumb_socket_parameter,
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.ticker)
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.orderbook)
 
 
@@ -48,10 +48,10 @@ class BithumbSocket(CoinExchangeSocketConnection):
             socket_parameter=upbithumb_socket_parameter,
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.ticker)
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.orderbook)
 
 
@@ -63,10 +63,10 @@ class CoinoneSocket(CoinExchangeSocketConnection):
             socket_parameter=coinone_socket_parameter,
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.ticker)
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.orderbook)
 
 
@@ -78,8 +78,8 @@ class KorbitSocket(CoinExchangeSocketConnection):
             socket_parameter=korbit_socket_parameter,
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.ticker)
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(symbol, socket_type=self.orderbook)
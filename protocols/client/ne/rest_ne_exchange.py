@@ -1,9 +1,18 @@
 """코인 Rest Resquest 설계 (국내)"""
 
+import json
+from typing import Iterator
+from urllib.parse import quote
+
 from common.core.types import ExchangeResponseData
 from common.client.market_rest.async_api_client import CoinExchangeRestClient
 
 
+def kraken_asset(coin_name: str) -> str:
+    """kraken 자산 코드 (BTC -> XBT)"""
+    return "XBT" if coin_name.upper() == "BTC" else coin_name.upper()
+
+
 class BinanceRest(CoinExchangeRestClient):
     def __init__(self) -> None:
         super().__init__(market="binance", location="ne")
@@ -14,6 +23,14 @@ class BinanceRest(CoinExchangeRestClient):
     def _get_ticker_url(self, coin_name: str) -> str:
         return f"{self._rest}/ticker/24hr?symbol={coin_name.upper()}USDT&type=FULL"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        symbols = json.dumps([f"{coin_name.upper()}USDT" for coin_name in coin_names], separators=(",", ":"))
+        return f"{self._rest}/ticker/24hr?symbols={quote(symbols)}&type=FULL"
+
+    def _split_tickers(self, data: list[dict], coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        for ticker in data:
+            yield ticker["symbol"].removesuffix("USDT"), ticker
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         data = await super().get_coin_all_info_price(coin_name)
         return data
@@ -31,6 +48,24 @@ class KrakenRest(CoinExchangeRestClient):
             coin_name = "XBT"
         return f"{self._rest}/Ticker?pair={coin_name.upper()}USD"
 
+    def _get_tickers_url(self, coin_names: list[str]) -> str:
+        pairs = ",".join(f"{kraken_asset(coin_name)}USD" for coin_name in coin_names)
+        return f"{self._rest}/Ticker?pair={pairs}"
+
+    def _split_tickers(self, data: dict, coin_names: list[str]) -> Iterator[tuple[str, ExchangeResponseData]]:
+        # 응답 키는 XXBTZUSD / XETHZUSD 처럼 구 자산 코드이거나 SOLUSD 처럼 그대로
+        result: dict[str, dict] = data["result"]
+        for coin_name in coin_names:
+            asset = kraken_asset(coin_name)
+            for pair in (f"X{asset}ZUSD", f"{asset}USD"):
+                if pair in result:
+                    yield coin_name.upper(), result[pair]
+                    break
+
+    def _tickers_rejected(self, data: dict) -> bool:
+        # 모르는 pair 가 하나라도 있으면 200 + {"error": ["EQuery:Unknown asset pair"], "result": {}}
+        return bool(data.get("error")) and not data.get("result")
+
     async def get_coin_all_info_price(self, coin_name: str) -> ExchangeResponseData:
         if coin_name == "BTC":
             coin_name = "XBT"
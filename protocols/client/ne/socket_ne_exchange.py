@@ -3,6 +3,7 @@
 """
 
 from common.core.abstract import AbstractExchangeSocketClient
+from common.utils.other_util import symbol_list
 from common.setting.socket_parameter import (
     binance_socket_paramater,
     kraken_socket_parameter,
@@ -11,7 +12,7 @@ from common.setting.socket_parameter import (
 
 class CoinExchangeSocketClient(AbstractExchangeSocketClient):
     async def get_present_websocket(
-        self, symbol: str, req_type: str, socket_type: str
+        self, symbol: str | list[str], req_type: str, socket_type: str
     ) -> None:
         from protocols.connection.coin_socket import (
             NEWebsocketConnection as WCM,
@@ -19,12 +20,16 @@ class CoinExchangeSocketClient(AbstractExchangeSocketClient):
 
         """소켓 출발점"""
         return await WCM().websocket_to_json(
-            uri=self._websocket,
+            uri=self.socket_uri(symbol),
             subs_fmt=self.socket_parameter(symbol=symbol, req_type=req_type),
             symbol=symbol,
             socket_type=socket_type,
         )
 
+    def socket_uri(self, symbol: str | list[str]) -> str:
+        """구독에 사용할 소켓 주소"""
+        return self._websocket
+
 
 class BinanceSocket(CoinExchangeSocketClient):
     def __init__(self) -> None:
@@ -34,12 +39,21 @@ class BinanceSocket(CoinExchangeSocketClient):
             socket_parameter=binance_socket_paramater,
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    def socket_uri(self, symbol: str | list[str]) -> str:
+        """다중 심볼이면 combined stream(/stream) 사용
+
+        - depth20 프레임에는 심볼이 없으므로 {"stream", "data"} 래퍼로 받아 분배
+        """
+        if len(symbol_list(symbol)) > 1 and self._websocket.rstrip("/").endswith("/ws"):
+            return f"{self._websocket.rstrip('/')[:-3]}/stream"
+        return self._websocket
+
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="ticker", socket_type=self.ticker
         )
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="depth20", socket_type=self.orderbook
         )
@@ -53,12 +67,12 @@ class KrakenSocket(CoinExchangeSocketClient):
             socket_parameter=kraken_socket_parameter,
         )
 
-    async def price_present_websocket(self, symbol: str) -> None:
+    async def price_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="ticker", socket_type=self.ticker
         )
 
-    async def orderbook_present_websocket(self, symbol: str) -> None:
+    async def orderbook_present_websocket(self, symbol: str | list[str]) -> None:
         return await super().get_present_websocket(
             symbol, req_type="book", socket_type=self.orderbook
         )
@@ -3,11 +3,13 @@ Coin async present price kafka data streaming
 """
 
 import asyncio
+import logging
 from common.core.data_format import KoreaCoinMarket, AsiaCoinMarket, NECoinMarket
 from common.core.types import ExchangeCollection, ExchangeData
 from common.client.market_rest.rest_interface import BaseExchangeRestAPI
 from mq.data_interaction import KafkaMessageSender
 from mq.data_partitional import CoinHashingCustomPartitional
+from common.setting.properties import REST_MODE
 
 
 class ExchangeRestAPI(BaseExchangeRestAPI):
@@ -16,6 +18,7 @@ class ExchangeRestAPI(BaseExchangeRestAPI):
     def __init__(self, location: str) -> None:
         super().__init__(location=location)
         self.location = location
+        self.sender = KafkaMessageSender(partition_pol=CoinHashingCustomPartitional())
 
     def create_schema(self, market_result: list[ExchangeData]) -> dict:
         market_classes: ExchangeCollection = {
@@ -33,9 +36,7 @@ class ExchangeRestAPI(BaseExchangeRestAPI):
         key = f"{self.location}-Total"
         while True:
             message = await self._log_market_schema(coin_symbol)
-            await KafkaMessageSender(
-                partition_pol=CoinHashingCustomPartitional()
-            ).produce_sending(message=message, topic=topic, key=key)
+            await self.sender.produce_sending(message=message, topic=topic, key=key)
             i += 1
 
             await asyncio.sleep(interval)  # 1초 대기
@@ -44,6 +45,32 @@ class ExchangeRestAPI(BaseExchangeRestAPI):
                 await asyncio.sleep(10)  # 10초 대기
                 i = 0  # 카운터 초기화
 
+    async def total_bulk_pull_request(self, coin_symbols: list[str], interval: int = 1) -> None:
+        """심볼 수와 관계없이 interval 마다 거래소별 요청 한 번, 결과는 심볼별 토픽으로 분배"""
+        i = 0
+        key = f"{self.location}-Total"
+        while True:
+            messages = await self._log_market_schema_bulk(coin_symbols)
+            for coin_symbol, message in messages.items():
+                topic = f"TotalRestDataIn{coin_symbol.upper()}"
+                await self.sender.produce_sending(message=message, topic=topic, key=key)
+            i += 1
+
+            await asyncio.sleep(interval)  # 1초 대기
+            if i >= 100:
+                await self.logging.log_message(logging.INFO, message="100번 호출 후 10초 대기합니다.")
+                await asyncio.sleep(10)  # 10초 대기
+                i = 0  # 카운터 초기화
+
+    async def pull_requests(self, coin_symbols: list[str], interval: int = 1) -> None:
+        """urls.conf [REST] mode 에 따라 bulk 또는 심볼별 폴링"""
+        if REST_MODE.lower() == "bulk":
+            await self.total_bulk_pull_request(coin_symbols, interval)
+            return
+        await asyncio.gather(
+            *(self.total_pull_request(coin_symbol=coin_symbol, interval=interval) for coin_symbol in coin_symbols)
+        )
+
 
 class KoreaExchangeRestAPI(ExchangeRestAPI):
     """한국거래소 API"""
@@ -8,6 +8,10 @@ from protocols.connection.coin_rest_api import (
     AsiaxchangeRestAPI,
     NEExchangeRestAPI,
 )
+from mq.data_interaction import KafkaProducerPool
+from common.client.market_rest.async_api_client import HttpSessionPool
+from pipe.launcher import run
+from mq.data_partitional import CoinHashingCustomPartitional
 
 
 async def f_btc_present_start() -> None:
@@ -44,8 +48,9 @@ async def be_present_gether() -> None:
 
 
 async def data_sending_start() -> None:
-    await be_present_gether()
+    async with KafkaProducerPool.lifespan(CoinHashingCustomPartitional()), HttpSessionPool.lifespan():
+        await be_present_gether()
 
 
 if __name__ == "__main__":
-    asyncio.run(be_present_gether())
+    run(data_sending_start())
@@ -2,10 +2,18 @@
 Socket Test
 """
 
-import asyncio
 from pipe.connection import CoinOrderBookWebsocket
 from pipe.socket_init import coin_present_websocket
+from pipe.launcher import run
+from mq.data_interaction import KafkaProducerPool
+from common.client.market_rest.async_api_client import HttpSessionPool
+from mq.data_partitional import socket_partitioner
+
+
+async def main() -> None:
+    async with KafkaProducerPool.lifespan(socket_partitioner()), HttpSessionPool.lifespan():
+        await coin_present_websocket(CoinOrderBookWebsocket)
 
 
 if __name__ == "__main__":
-    asyncio.run(coin_present_websocket(CoinOrderBookWebsocket))
+    run(main())
@@ -0,0 +1,27 @@
+"""
+Socket Shard Supervisor
+
+python socket_supervisor.py --type ticker --workers 4
+"""
+
+import argparse
+from config.yml_param_load import symbol_json
+from pipe.supervisor import ShardSupervisor
+from common.setting.properties import SHARD_WORKERS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="거래소 소켓 구독을 여러 프로세스로 분산 실행")
+    parser.add_argument("--type", choices=["ticker", "orderbook"], default="ticker")
+    parser.add_argument("--workers", type=int, default=int(SHARD_WORKERS))
+    args = parser.parse_args()
+
+    ShardSupervisor(
+        socket_type=args.type,
+        symbols=symbol_json(),
+        workers=args.workers,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
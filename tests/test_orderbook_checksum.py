@@ -0,0 +1,120 @@
+"""
+오더북 체크섬 검증 (거래소 문서의 예시 기준)
+
+- OKX: 문서의 bid/ask 예시로 만든 검증 문자열과 같은 문자열의 signed CRC32 인지
+- Kraken: 문서의 자릿수 포맷 예시 (0.05005 -> 5005, 0.00000500 -> 500) 와 instrument 정밀도 사용 여부
+- 벤치마크 프레임(스냅샷 + 증분) 재생 중 호가가 교차하지 않는지
+"""
+
+import zlib
+
+import pytest
+
+from benchmark._frames import load_frames
+from common.exception import OrderBookSyncError
+from common.client.market_socket.orderbook import (
+    BOOK_FORMATS,
+    BookUpdate,
+    OrderBook,
+    OrderBookEngine,
+    kraken_checksum,
+    kraken_number,
+    okx_checksum,
+    parse_kraken_instrument,
+)
+
+
+def signed_crc32(text: str) -> int:
+    checksum = zlib.crc32(text.encode("utf-8"))
+    return checksum - (1 << 32) if checksum >= 1 << 31 else checksum
+
+
+def okx_book(bids: list[list[str]], asks: list[list[str]]) -> OrderBook:
+    book = OrderBook("OKX", "BTC")
+    book.apply(
+        BookUpdate(snapshot=True, bids=[(level[0], level[1]) for level in bids], asks=[(level[0], level[1]) for level in asks]),
+        BOOK_FORMATS["OKX"],
+        validate=False,
+    )
+    return book
+
+
+@pytest.mark.parametrize(
+    ("bids", "asks", "expected"),
+    [
+        # 양쪽 레벨 수가 같은 경우
+        (
+            [["3366.1", "7", "0", "3"], ["3366", "6", "3", "4"]],
+            [["3366.8", "9", "10", "3"], ["3368", "8", "3", "4"]],
+            "3366.1:7:3366.8:9:3366:6:3368:8",
+        ),
+        # 한쪽이 짧으면 남은 쪽만 이어 붙임
+        (
+            [["3366.1", "7", "0", "3"]],
+            [["3366.8", "9", "10", "3"], ["3368", "8", "3", "4"], ["3372", "8", "3", "4"]],
+            "3366.1:7:3366.8:9:3368:8:3372:8",
+        ),
+    ],
+)
+def test_okx_checksum_matches_documented_string(bids, asks, expected):
+    assert okx_checksum(okx_book(bids, asks)) == signed_crc32(expected)
+
+
+@pytest.mark.parametrize(
+    ("value", "places", "expected"),
+    [(0.05005, 5, "5005"), (0.000005, 8, "500"), ("0.00000500", 8, "500"), (45285.2, 1, "452852"), (0.1, 8, "10000000")],
+)
+def test_kraken_number_format(value, places, expected):
+    assert kraken_number(value, places) == expected
+
+
+def kraken_frame(kind: str, bids: list[tuple[float, float]], asks: list[tuple[float, float]], checksum: int) -> dict:
+    return {
+        "channel": "book",
+        "type": kind,
+        "data": [
+            {
+                "symbol": "BTC/USD",
+                "bids": [{"price": price, "qty": qty} for price, qty in bids],
+                "asks": [{"price": price, "qty": qty} for price, qty in asks],
+                "checksum": checksum,
+            }
+        ],
+    }
+
+
+def test_kraken_checksum_uses_instrument_precision():
+    bids, asks = [(66993.7, 1.5), (66993.6, 0.1)], [(66993.9, 0.25), (66994.0, 2.0)]
+    # 끝자리 0 이 사라진 JSON 숫자를 instrument 정밀도(가격 1자리, 수량 8자리)로 다시 채운 문자열
+    expected = zlib.crc32(b"66993925000000" b"669940200000000" b"669937150000000" b"66993610000000")
+
+    engine = OrderBookEngine(send=None, region="ne", validate=True)
+    engine.set_precisions("KRAKEN", parse_kraken_instrument({
+        "channel": "instrument",
+        "type": "snapshot",
+        "data": {"assets": [], "pairs": [{"symbol": "BTC/USD", "price_precision": 1, "qty_precision": 8}]},
+    }))
+    engine.apply("KRAKEN", "BTC", kraken_frame("snapshot", bids, asks, expected))
+    assert kraken_checksum(engine.books[("KRAKEN", "BTC")]) == expected
+
+    with pytest.raises(OrderBookSyncError):
+        engine.apply("KRAKEN", "BTC", kraken_frame("update", [(66993.7, 1.0)], [], expected))
+
+
+def test_kraken_checksum_skipped_without_precision():
+    engine = OrderBookEngine(send=None, region="ne", validate=True)
+    engine.apply("KRAKEN", "BTC", kraken_frame("snapshot", [(66993.7, 1.5)], [(66993.9, 0.25)], checksum=1))
+    assert engine.books[("KRAKEN", "BTC")].synced
+    assert engine.stale == set()
+
+
+def test_benchmark_frames_replay_without_crossing():
+    engine = OrderBookEngine(send=None, region="bench", validate=True)
+    for market, frames in load_frames("orderbook").items():
+        for _ in range(2):
+            for frame in frames:
+                engine.apply(market.upper(), "BTC", frame)
+                (bid, _), (ask, _) = engine.books[(market.upper(), "BTC")].best()
+                assert bid < ask, (market, frame)
+    assert engine.counters["delta"] > 0
+    assert engine.counters["resync"] == 0
@@ -0,0 +1,63 @@
+"""
+토픽 동기화 멱등성 (InMemoryAdmin 기준)
+
+- 빈 클러스터에 sync 하면 전부 create, 같은 목록으로 다시 sync 하면 변경 없음
+- 선언 파티션이 늘면 add_partitions 한 번 후 다시 변경 없음
+- 클러스터 설정이 바뀌면 alter_config 한 번 후 다시 변경 없음
+"""
+
+import pytest
+
+from config.yml_param_load import symbol_json
+from mq.data_admin import InMemoryAdmin, TopicProvisioner, TopicSpec, desired_topics
+
+
+@pytest.fixture
+def desired() -> list[TopicSpec]:
+    return desired_topics(symbol_json(), replication=1)
+
+
+@pytest.fixture
+def admin() -> InMemoryAdmin:
+    return InMemoryAdmin()
+
+
+@pytest.fixture
+def provisioner(admin: InMemoryAdmin) -> TopicProvisioner:
+    return TopicProvisioner(admin=admin)
+
+
+def test_sync_twice_creates_once(provisioner: TopicProvisioner, desired: list[TopicSpec]) -> None:
+    created = provisioner.sync(desired)
+    assert {change["action"] for change in created} == {"create"}
+    assert sorted(change["topic"] for change in created) == sorted(spec["name"] for spec in desired)
+    assert len(created) == 31
+
+    assert provisioner.sync(desired) == []
+
+
+def test_partition_growth(provisioner: TopicProvisioner, admin: InMemoryAdmin, desired: list[TopicSpec]) -> None:
+    provisioner.sync(desired)
+    spec = desired[0]
+    grown = [TopicSpec(**{**spec, "partitions": spec["partitions"] + 2})] + desired[1:]
+
+    changes = provisioner.sync(grown)
+    assert [(change["action"], change["topic"]) for change in changes] == [("add_partitions", spec["name"])]
+    assert admin.topics[spec["name"]][0] == spec["partitions"] + 2
+    assert provisioner.sync(grown) == []
+
+    # 파티션은 줄일 수 없으므로 경고만 하고 클러스터는 그대로
+    shrunk = provisioner.sync(desired)
+    assert [change["action"] for change in shrunk] == ["warn"]
+    assert admin.topics[spec["name"]][0] == spec["partitions"] + 2
+
+
+def test_config_drift(provisioner: TopicProvisioner, admin: InMemoryAdmin, desired: list[TopicSpec]) -> None:
+    provisioner.sync(desired)
+    spec = desired[-1]
+    admin.configs[spec["name"]]["retention.ms"] = "1"
+
+    changes = provisioner.sync(desired)
+    assert [(change["action"], change["topic"]) for change in changes] == [("alter_config", spec["name"])]
+    assert admin.configs[spec["name"]]["retention.ms"] == spec["config"]["retention.ms"]
+    assert provisioner.sync(desired) == []
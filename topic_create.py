@@ -1,44 +1,105 @@
-from mq.data_admin import new_topic_initialization, delete_all_topics
+"""
+Topic Create
+
+python topic_create.py --dry-run
+python topic_create.py
+python topic_create.py --partition-mode symbol --max-partitions 64
+python topic_create.py --check    # 카프카 없이 메모리 대역으로 sync 멱등성 확인
+"""
+
+import argparse
+from config.yml_param_load import symbol_json
+from mq.data_admin import InMemoryAdmin, TopicProvisioner, desired_topics
 from common.setting.properties import (
-    KOREA_REAL_TOPIC_NAME,
-    ASIA_REAL_TOPIC_NAME,
-    NE_REAL_TOPIC_NAME,
+    PARTITION_MODE,
+    PARTITION_MAX,
+    TOPIC_REPLICATION,
 )
 
 
-def data_sending_start() -> None:
+def data_sending_start(
+    partition_mode: str = PARTITION_MODE,
+    max_partitions: int = int(PARTITION_MAX),
+    replication: int = int(TOPIC_REPLICATION),
+    dry_run: bool = False,
+) -> None:
     """
-    Topic creation based on regional partition requirements:
-    - Korea: 4 partitions
-    - Asia: 3 partitions
-    - NE: 2 partitions
+    Topic provisioning derived from config/*/_market_socket.yml, _market_symbol.yml and urls.conf
+    - only the difference from the cluster is applied, so it is safe to run repeatedly
     """
     try:
-        topic = [
-            f"{KOREA_REAL_TOPIC_NAME}-orderbook",
-            f"{KOREA_REAL_TOPIC_NAME}-ticker",
-            f"{ASIA_REAL_TOPIC_NAME}-orderbook",
-            f"{ASIA_REAL_TOPIC_NAME}-ticker",
-            f"{NE_REAL_TOPIC_NAME}-orderbook",
-            f"{NE_REAL_TOPIC_NAME}-ticker",
-            "RegionNE_OrderbookPreprocessing",
-            "RegionAsia_OrderbookPreprocessing",
-            "RegionKorea_OrderbookPreprocessing",
-            "RegionKorea_TickerPreprocessing",
-            "RegionAsia_TickerPreprocessing",
-            "RegionNE_TickerPreprocessing",
-        ]
-
-        # Partition settings by region (matching the topic order above)
-        partition = [4, 4, 3, 3, 2, 2, 2, 3, 4, 4, 3, 2]
-        replication = [3] * len(topic)
-
-        return new_topic_initialization(
-            topic=topic, partition=partition, replication_factor=replication
+        desired = desired_topics(
+            symbols=symbol_json(),
+            partition_mode=partition_mode,
+            max_partitions=max_partitions,
+            replication=replication,
         )
+        changes = TopicProvisioner().sync(desired, dry_run=dry_run)
+        for change in changes:
+            print(f"[{change['action']}] {change['topic']} --> {change['detail']}")
+        if not changes:
+            print(f"Topics up to date ({len(desired)} topics)")
     except Exception as error:
         print(f"Error creating topics: {error}")
 
 
+def idempotence_check(
+    partition_mode: str = PARTITION_MODE,
+    max_partitions: int = int(PARTITION_MAX),
+    replication: int = int(TOPIC_REPLICATION),
+) -> None:
+    """InMemoryAdmin 으로 plan / apply / sync 실행
+
+    - 빈 클러스터 sync 후 다시 plan 하면 변경 없음
+    - 설정이 바뀌거나 파티션이 줄어든 클러스터는 다음 sync 한 번으로 복구되고 그 뒤 plan 은 다시 비어 있음
+
+    Raises:
+        AssertionError: 두 번째 plan 에 변경이 남은 경우
+    """
+    desired = desired_topics(
+        symbols=symbol_json(),
+        partition_mode=partition_mode,
+        max_partitions=max_partitions,
+        replication=replication,
+    )
+    admin = InMemoryAdmin()
+    provisioner = TopicProvisioner(admin=admin)
+
+    created = provisioner.sync(desired)
+    assert {change["action"] for change in created} == {"create"}, created
+    assert provisioner.plan(desired) == [], provisioner.plan(desired)
+    print(f"create: {len(created)} topics, replan: no changes")
+
+    # 누군가 클러스터를 직접 바꾼 경우: 설정 변경 + 파티션 부족
+    spec = max(desired, key=lambda spec: spec["partitions"])
+    admin.configs[spec["name"]]["retention.ms"] = "1"
+    admin.topics[spec["name"]] = (spec["partitions"] - 1, spec["replication"])
+    repaired = provisioner.sync(desired)
+    assert sorted(change["action"] for change in repaired) == ["add_partitions", "alter_config"], repaired
+    assert provisioner.plan(desired) == [], provisioner.plan(desired)
+    print(f"drift on {spec['name']}: {len(repaired)} changes repaired, replan: no changes")
+
+
 if __name__ == "__main__":
-    data_sending_start()
+    parser = argparse.ArgumentParser(description="카프카 토픽 생성/동기화")
+    parser.add_argument("--partition-mode", choices=["exchange", "symbol"], default=PARTITION_MODE)
+    parser.add_argument("--max-partitions", type=int, default=int(PARTITION_MAX))
+    parser.add_argument("--replication", type=int, default=int(TOPIC_REPLICATION))
+    parser.add_argument("--dry-run", action="store_true", help="변경 목록만 출력")
+    parser.add_argument("--check", action="store_true", help="카프카 없이 메모리 대역으로 멱등성 확인")
+    args = parser.parse_args()
+
+    if args.check:
+        idempotence_check(
+            partition_mode=args.partition_mode,
+            max_partitions=args.max_partitions,
+            replication=args.replication,
+        )
+        raise SystemExit(0)
+
+    data_sending_start(
+        partition_mode=args.partition_mode,
+        max_partitions=args.max_partitions,
+        replication=args.replication,
+        dry_run=args.dry_run,
+    )